@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
 
-from config import CHUNK_OVERLAP, CHUNK_SIZE
+from config import CHUNK_OVERLAP, CHUNK_SIZE, MIN_CHUNK_SIZE
 from logger import get_logger
 
 logger = get_logger()
@@ -60,6 +61,33 @@ METHOD_NODES: dict[str, list[str]] = {
     "ruby": ["method"],
 }
 
+# Extensions whose plain-text chunks are cut at language boundaries (defs, classes,
+# headers) rather than by the generic separators. Unlisted extensions use the default.
+SPLITTER_LANGUAGES: dict[str, Language] = {
+    ".py": Language.PYTHON,
+    ".js": Language.JS,
+    ".jsx": Language.JS,
+    ".ts": Language.TS,
+    ".tsx": Language.TS,
+    ".java": Language.JAVA,
+    ".c": Language.C,
+    ".h": Language.C,
+    ".cpp": Language.CPP,
+    ".hpp": Language.CPP,
+    ".cs": Language.CSHARP,
+    ".go": Language.GO,
+    ".rs": Language.RUST,
+    ".rb": Language.RUBY,
+    ".php": Language.PHP,
+    ".swift": Language.SWIFT,
+    ".kt": Language.KOTLIN,
+    ".scala": Language.SCALA,
+    ".md": Language.MARKDOWN,
+    ".rst": Language.RST,
+    ".html": Language.HTML,
+    ".proto": Language.PROTO,
+}
+
 NAME_FIELD: dict[str, str] = {
     "python": "name",
     "javascript": "name",
@@ -71,12 +99,17 @@ NAME_FIELD: dict[str, str] = {
     "ruby": "name",
 }
 
-_parsers: dict[str, Any] = {}
+# tree-sitter Parser objects must not be shared between threads, so each thread
+# (e.g. an indexing worker) builds and keeps its own set.
+_parser_local = threading.local()
 
 
 def _get_parser(language: str) -> Any | None:
-    if language in _parsers:
-        return _parsers[language]
+    parsers: dict[str, Any] | None = getattr(_parser_local, "parsers", None)
+    if parsers is None:
+        parsers = _parser_local.parsers = {}
+    if language in parsers:
+        return parsers[language]
 
     try:
         from tree_sitter import Language, Parser
@@ -90,14 +123,14 @@ def _get_parser(language: str) -> Any | None:
 
             lang = Language(mod.language_typescript())
             parser = Parser(lang)
-            _parsers[language] = parser
+            parsers[language] = parser
             return parser
         elif language == "tsx":
             import tree_sitter_typescript as mod
 
             lang = Language(mod.language_tsx())
             parser = Parser(lang)
-            _parsers[language] = parser
+            parsers[language] = parser
             return parser
         elif language == "java":
             import tree_sitter_java as mod
@@ -112,12 +145,12 @@ def _get_parser(language: str) -> Any | None:
 
         lang = Language(mod.language())
         parser = Parser(lang)
-        _parsers[language] = parser
+        parsers[language] = parser
         return parser
 
     except Exception as e:
         logger.warning(f"Could not load tree-sitter parser for {language}: {e}")
-        _parsers[language] = None
+        parsers[language] = None
         return None
 
 
@@ -204,6 +237,30 @@ def _extract_class_chunks(
     return chunks
 
 
+def _merge_small_chunks(
+    chunks: list[str],
+    min_size: int = MIN_CHUNK_SIZE,
+    max_size: int = CHUNK_SIZE + CHUNK_OVERLAP,
+) -> list[str]:
+    """
+    Folds splitter pieces shorter than `min_size` into their previous neighbour.
+
+    Merging stops once a chunk would exceed `max_size`. The default allows one
+    overlap's worth of slack so a short tail can still join a full-size chunk.
+    """
+    merged: list[str] = []
+    for chunk in chunks:
+        if (
+            merged
+            and (len(merged[-1]) < min_size or len(chunk) < min_size)
+            and len(merged[-1]) + 1 + len(chunk) <= max_size
+        ):
+            merged[-1] = f"{merged[-1]}\n{chunk}"
+        else:
+            merged.append(chunk)
+    return merged
+
+
 def _make_text_chunks(
     text: str,
     source_path: str,
@@ -230,7 +287,7 @@ def _make_text_chunks(
             }
         ]
 
-    sub_chunks = text_splitter.split_text(text)
+    sub_chunks = _merge_small_chunks(text_splitter.split_text(text))
     result = []
     for i, sub in enumerate(sub_chunks):
         result.append(
@@ -255,6 +312,19 @@ class ASTSplitter:
         self._text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
         )
+        # Built up front so worker threads only ever read this dict.
+        by_language = {
+            language: RecursiveCharacterTextSplitter.from_language(
+                language, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+            )
+            for language in set(SPLITTER_LANGUAGES.values())
+        }
+        self._splitters: dict[str, RecursiveCharacterTextSplitter] = {
+            ext: by_language[language] for ext, language in SPLITTER_LANGUAGES.items()
+        }
+
+    def _splitter_for(self, file_path: Path) -> RecursiveCharacterTextSplitter:
+        return self._splitters.get(file_path.suffix.lower(), self._text_splitter)
 
     def split(self, content: str, file_path: Path) -> list[dict[str, Any]]:
         language = LANGUAGE_MAP.get(file_path.suffix.lower())
@@ -275,6 +345,7 @@ class ASTSplitter:
         tree = parser.parse(source)
         root = tree.root_node
 
+        text_splitter = self._splitter_for(file_path)
         top_types = TOP_LEVEL_NODES.get(language, [])
         chunks: list[dict[str, Any]] = []
         covered_ranges: list[tuple[int, int]] = []
@@ -304,9 +375,7 @@ class ASTSplitter:
 
             if actual_node.type == "class_definition" or actual_node.type == "class_declaration":
                 chunks.extend(
-                    _extract_class_chunks(
-                        actual_node, source, language, file_path, self._text_splitter
-                    )
+                    _extract_class_chunks(actual_node, source, language, file_path, text_splitter)
                 )
             else:
                 symbol_name = _get_node_name(actual_node, source)
@@ -319,7 +388,7 @@ class ASTSplitter:
                         None,
                         node.start_point[0] + 1,
                         node.end_point[0] + 1,
-                        self._text_splitter,
+                        text_splitter,
                     )
                 )
 
@@ -345,14 +414,14 @@ class ASTSplitter:
                     None,
                     1,
                     root.end_point[0] + 1,
-                    self._text_splitter,
+                    text_splitter,
                 )
             )
 
         return chunks
 
     def _split_by_text(self, content: str, file_path: Path) -> list[dict[str, Any]]:
-        sub_chunks = self._text_splitter.split_text(content)
+        sub_chunks = _merge_small_chunks(self._splitter_for(file_path).split_text(content))
         return [
             {
                 "text": chunk,
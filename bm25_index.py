@@ -1,3 +1,4 @@
+import heapq
 import pickle
 from pathlib import Path
 from typing import Any
@@ -28,7 +29,7 @@ def reciprocal_rank_fusion(
         if doc_id not in id_to_data:
             id_to_data[doc_id] = item
 
-    sorted_ids = sorted(rrf_scores, key=lambda x: rrf_scores[x], reverse=True)[:n]
+    sorted_ids = heapq.nlargest(n, rrf_scores, key=rrf_scores.__getitem__)
     return [id_to_data[doc_id] for doc_id in sorted_ids if doc_id in id_to_data]
 
 
@@ -63,7 +64,7 @@ class BM25Index:
         try:
             tokens = query.lower().split()
             scores = self._bm25.get_scores(tokens)
-            top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:n]
+            top_indices = heapq.nlargest(n, range(len(scores)), key=scores.__getitem__)
             return [
                 {
                     "id": self._ids[i],
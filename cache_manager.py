@@ -61,7 +61,7 @@ class LRUCache:
                 if len(self.cache) >= self.capacity:
                     oldest_key = next(iter(self.cache))
                     del self.cache[oldest_key]
-                    logger.debug(f"LRU cache evicted: {oldest_key}")
+                    logger.debug("LRU cache evicted: %s", oldest_key)
             self.cache[key] = value
 
     def clear(self) -> None:
@@ -130,7 +130,7 @@ class TTLCache:
                 else:
                     del self.cache[key]
                     self.expirations += 1
-                    logger.debug(f"TTL cache expired: {key}")
+                    logger.debug("TTL cache expired: %s", key)
             self.misses += 1
             return None
 
@@ -155,7 +155,7 @@ class TTLCache:
 
         oldest_key = min(self.cache.items(), key=lambda x: x[1][1])[0]
         del self.cache[oldest_key]
-        logger.debug(f"TTL cache evicted oldest: {oldest_key}")
+        logger.debug("TTL cache evicted oldest: %s", oldest_key)
 
     def clear(self) -> None:
         """Clears all cached items."""
@@ -183,7 +183,7 @@ class TTLCache:
                 self.expirations += 1
 
             if expired_keys:
-                logger.debug(f"TTL cache cleanup: removed {len(expired_keys)} expired items")
+                logger.debug("TTL cache cleanup: removed %d expired items", len(expired_keys))
 
             return len(expired_keys)
 
@@ -249,7 +249,7 @@ class FileCache:
 
                 return None
         except Exception as e:
-            logger.debug(f"Error checking file cache for {file_path}: {e}")
+            logger.debug("Error checking file cache for %s: %s", file_path, e)
             return None
 
     def put(self, file_path: Path, content: str) -> None:
@@ -268,7 +268,7 @@ class FileCache:
                 self.lru_cache.put(key, content)
                 self.mtime_cache[key] = mtime
         except Exception as e:
-            logger.debug(f"Error caching file {file_path}: {e}")
+            logger.debug("Error caching file %s: %s", file_path, e)
 
     def clear(self) -> None:
         """Clears all cached files."""
@@ -279,3 +279,149 @@ class FileCache:
     def get_stats(self) -> dict[str, Any]:
         """Returns file cache statistics."""
         return self.lru_cache.get_stats()
+
+
+class SemanticCache:
+    """
+    Similarity-keyed cache for query results.
+    Serves a stored result when a new query embedding is close enough (cosine) to a cached one.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_size: int = 512, ttl_seconds: int = 300):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_size: Maximum number of entries before least recently used eviction
+            ttl_seconds: Time to live for cached entries in seconds
+        """
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._matrix: Any = None  # float32 (size, dim), rows L2-normalized
+        self._namespaces: list[str] = []
+        self._values: list[Any] = []
+        self._created: list[float] = []
+        self._last_used: list[float] = []
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _normalize(embedding: Any) -> Any:
+        import numpy as np
+
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def get(self, embedding: Any, namespace: str = "") -> Any | None:
+        """
+        Retrieves the value of the most similar non-expired entry.
+
+        Args:
+            embedding: Query embedding vector
+            namespace: Only entries stored under the same namespace can match
+
+        Returns:
+            Cached value or None if no entry reaches the similarity threshold
+        """
+        import numpy as np
+
+        query = self._normalize(embedding)
+        with self.lock:
+            if self._matrix is None or self._matrix.shape[1] != query.shape[0]:
+                self.misses += 1
+                return None
+
+            scores = self._matrix @ query
+            now = time.time()
+            for idx in np.argsort(scores)[::-1]:
+                if scores[idx] < self.threshold:
+                    break
+                if self._namespaces[idx] != namespace:
+                    continue
+                if now - self._created[idx] >= self.ttl_seconds:
+                    self.expirations += 1
+                    self._remove(int(idx))
+                    self.misses += 1
+                    return None
+                self._last_used[idx] = now
+                self.hits += 1
+                return self._values[idx]
+
+            self.misses += 1
+            return None
+
+    def put(self, embedding: Any, value: Any, namespace: str = "") -> None:
+        """
+        Adds a value keyed by its query embedding.
+
+        Args:
+            embedding: Query embedding vector
+            value: Value to cache
+            namespace: Namespace the entry belongs to
+        """
+        import numpy as np
+
+        row = self._normalize(embedding)
+        now = time.time()
+        with self.lock:
+            if self._matrix is None or self._matrix.shape[1] != row.shape[0]:
+                self._reset()
+                self._matrix = row.reshape(1, -1)
+            else:
+                if len(self._values) >= self.max_size:
+                    self._remove(min(range(len(self._last_used)), key=self._last_used.__getitem__))
+                self._matrix = np.vstack([self._matrix, row])
+            self._namespaces.append(namespace)
+            self._values.append(value)
+            self._created.append(now)
+            self._last_used.append(now)
+
+    def _remove(self, idx: int) -> None:
+        """Removes the entry at idx. Caller must hold the lock."""
+        import numpy as np
+
+        self._matrix = np.delete(self._matrix, idx, axis=0)
+        del self._namespaces[idx]
+        del self._values[idx]
+        del self._created[idx]
+        del self._last_used[idx]
+
+    def _reset(self) -> None:
+        """Drops all entries. Caller must hold the lock."""
+        self._matrix = None
+        self._namespaces.clear()
+        self._values.clear()
+        self._created.clear()
+        self._last_used.clear()
+
+    def clear(self) -> None:
+        """Clears all cached entries."""
+        with self.lock:
+            self._reset()
+            logger.debug("Semantic cache cleared")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Returns cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size, expirations, threshold, hit_rate
+        """
+        with self.lock:
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._values),
+                "max_size": self.max_size,
+                "expirations": self.expirations,
+                "ttl_seconds": self.ttl_seconds,
+                "threshold": self.threshold,
+                "hit_rate": f"{hit_rate:.2f}%",
+            }
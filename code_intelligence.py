@@ -14,7 +14,7 @@ from config import (
     BINARY_EXTENSIONS,
     CODE_EXTENSIONS,
     INDEXABLE_EXTENSIONS,
-    is_dir_ignored,
+    iter_project_files,
     safe_read_text,
 )
 from logger import get_logger
@@ -73,15 +73,12 @@ class ProjectConventions:
 def _iter_code_files(root: Path, max_files: int = 5000) -> list[tuple[Path, str]]:
     """Yields (path, extension) for code files in project. Skips ignored dirs."""
     results = []
-    for dirpath, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if not is_dir_ignored(d) and not d.startswith(".")]
-        for fname in files:
-            fpath = Path(dirpath) / fname
-            ext = fpath.suffix.lower()
-            if ext in INDEXABLE_EXTENSIONS and ext not in BINARY_EXTENSIONS:
-                results.append((fpath, ext))
-                if len(results) >= max_files:
-                    return results
+    for entry in iter_project_files(root, skip_hidden=True):
+        ext = os.path.splitext(entry.name)[1].lower()
+        if ext in INDEXABLE_EXTENSIONS and ext not in BINARY_EXTENSIONS:
+            results.append((Path(entry.path), ext))
+            if len(results) >= max_files:
+                return results
     return results
 
 
@@ -1281,5 +1278,31 @@ def compute_file_complexity_ast(
         return sorted(results, key=lambda x: x[2], reverse=True)
 
     except Exception as e:
-        logger.debug(f"AST complexity failed for {file_path}: {e}")
+        logger.debug("AST complexity failed for %s: %s", file_path, e)
         return []
+
+
+def file_complexity(path: str) -> tuple[str, list[tuple[str, int]]]:
+    """
+    Computes per-function cyclomatic complexity for one file.
+    Uses radon for Python and falls back to tree-sitter when radon is unavailable
+    or fails. Module-level and exception-safe so it can run in a worker process.
+
+    Returns:
+        (language, [(function_name, complexity), ...]). The list is empty when the
+        file has no functions or could not be analyzed.
+    """
+    file_path = Path(path)
+    language = _LANGUAGE_MAP.get(file_path.suffix.lower(), "unknown")
+
+    if language == "python":
+        try:
+            from radon.complexity import cc_visit
+
+            code = file_path.read_text(encoding="utf-8", errors="replace")
+            return language, [(item.name, item.complexity) for item in cc_visit(code)]
+        except Exception:
+            pass
+
+    funcs = compute_file_complexity_ast(file_path)
+    return language, [(name, complexity) for name, _line, complexity in funcs]
@@ -1,15 +1,20 @@
+import hashlib
 import os
-from collections.abc import Callable
+import re
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
 from ast_splitter import ASTSplitter
 from config import (
     BATCH_SIZE,
-    BINARY_EXTENSIONS,
     INDEXABLE_EXTENSIONS,
     get_max_file_size_bytes,
     get_max_memory_bytes,
-    is_dir_ignored,
+    iter_project_files,
     safe_read_text,
 )
 from incremental_indexing import IndexMetadata
@@ -26,9 +31,33 @@ MAX_FILES_PER_INDEX = 5000
 # Progress reporting interval (every N files)
 PROGRESS_REPORT_INTERVAL = 100
 
+# Worker threads that read and split files ahead of the indexing loop.
+# File reads release the GIL, so reading overlaps with splitting and upserts.
+INDEX_READ_WORKERS = min(8, os.cpu_count() or 1)
+
+# Leading characters checked for NUL bytes to skip binaries not caught by extension
+BINARY_SNIFF_CHARS = 8192
+
+# Files read ahead at most; bounds chunks held in memory before the loop consumes them
+INDEX_READ_AHEAD = INDEX_READ_WORKERS * 4
+
 BatchUpsertCallback = Callable[[list[str], list[dict], list[str]], None]
 
 
+def compile_ignore_patterns(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """
+    Compiles substring ignore patterns into one alternation so each path is
+    scanned once instead of once per pattern.
+
+    Returns:
+        Compiled matcher, or None when there are no patterns
+    """
+    escaped = sorted({re.escape(p) for p in patterns if p})
+    if not escaped:
+        return None
+    return re.compile("|".join(escaped))
+
+
 class CodebaseIndexer:
     """
     Manages codebase indexing operations.
@@ -64,32 +93,31 @@ class CodebaseIndexer:
 
         return batch_upsert
 
-    def should_index_file(self, file_path: Path, ignore_patterns: set[str]) -> bool:
+    def should_index_file(
+        self, file_path: Path | os.DirEntry[str], ignore_matcher: re.Pattern[str] | None
+    ) -> bool:
         """
         Determines if a file should be indexed.
 
         Args:
-            file_path: Path to check
-            ignore_patterns: Patterns to ignore
+            file_path: Path or scandir entry to check; an entry reuses its cached stat
+            ignore_matcher: Compiled ignore patterns from compile_ignore_patterns
 
         Returns:
             True if file should be indexed
         """
-        if file_path.suffix in BINARY_EXTENSIONS:
+        # Cheapest checks first: stat() only runs for files that pass every other filter
+        suffix = os.path.splitext(file_path.name)[1]
+        if suffix and suffix not in INDEXABLE_EXTENSIONS:
             return False
 
-        if file_path.suffix and file_path.suffix not in INDEXABLE_EXTENSIONS:
+        if ignore_matcher is not None and ignore_matcher.search(os.fspath(file_path)):
             return False
 
-        file_str = str(file_path)
-        for pattern in ignore_patterns:
-            if pattern in file_str:
-                return False
-
         try:
             file_size = file_path.stat().st_size
             if file_size > get_max_file_size_bytes():
-                logger.info(f"Skipping {file_path}: exceeds max file size")
+                logger.info("Skipping %s: exceeds max file size", file_path)
                 return False
         except Exception:
             return False
@@ -115,57 +143,148 @@ class CodebaseIndexer:
         Returns:
             List of indexable file paths
         """
-        indexable_files = []
+        indexable_files: list[Path] = []
+        ignore_matcher = compile_ignore_patterns(ignore_patterns)
 
-        for root, dirs, files in os.walk(root_dir):
+        # Filter on the DirEntry so rejected files never get a Path object
+        for entry in iter_project_files(root_dir, ignored_dirs=ignored_dirs):
             if len(indexable_files) >= max_files:
                 logger.warning(f"Scan limit reached ({max_files} files). Stopping scan.")
                 break
 
-            dirs[:] = [d for d in dirs if d not in ignored_dirs and not is_dir_ignored(d)]
-
-            for file in files:
-                if len(indexable_files) >= max_files:
-                    break
-
-                file_path = Path(root) / file
-                if self.should_index_file(file_path, ignore_patterns):
-                    indexable_files.append(file_path)
+            if self.should_index_file(entry, ignore_matcher):
+                indexable_files.append(Path(entry.path))
 
         return indexable_files
 
-    def process_file_to_chunks(self, file_path: Path, indexer: MemoryLimitedIndexer) -> bool:
+    def read_and_split(self, file_path: Path) -> list[dict[str, Any]] | None:
         """
-        Processes a single file: reads, splits into AST-aware chunks, adds to indexer.
+        Reads a file and splits it into AST-aware chunks. Safe to call from worker threads.
 
         Args:
-            file_path: File to process
-            indexer: Memory-limited indexer to add chunks to
+            file_path: File to read
 
         Returns:
-            True if file was successfully processed
+            List of chunks, or None if the file is empty or could not be read
         """
         try:
             content = safe_read_text(file_path)
             if not content.strip():
-                return False
+                return None
+            if "\x00" in content[:BINARY_SNIFF_CHARS]:
+                # Binary file with an unlisted or missing extension
+                logger.debug("Skipping %s: looks binary", file_path)
+                return None
+            return self.splitter.split(content, file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Skipping {file_path}: encoding error - {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error processing {file_path}: {e}", exc_info=True)
+            return None
+
+    def add_chunks(
+        self,
+        file_path: Path,
+        chunks: list[dict[str, Any]],
+        indexer: MemoryLimitedIndexer,
+        existing_hashes: dict[str, str] | None = None,
+    ) -> int | None:
+        """
+        Adds a file's chunks to the indexer under stable chunk IDs.
 
-            chunks = self.splitter.split(content, file_path)
+        Each chunk's metadata gets a `content_hash`. When `existing_hashes` (the
+        file's chunks already in the store) is given, chunks whose hash is unchanged
+        are not re-embedded; only their metadata is refreshed, since edits above a
+        chunk shift its line range. Stored chunks the file no longer produces are
+        deleted.
 
+        Args:
+            file_path: File the chunks came from
+            chunks: Output of read_and_split
+            indexer: Memory-limited indexer to add chunks to
+            existing_hashes: Stored chunk ID -> content hash for this file
+
+        Returns:
+            Number of unchanged chunks not re-embedded, or None if adding failed
+        """
+        try:
+            chunk_ids = []
+            unchanged_ids: list[str] = []
+            unchanged_metas: list[dict[str, Any]] = []
             for chunk in chunks:
                 text = chunk["text"]
                 meta = chunk["metadata"]
                 class_prefix = f"{meta['class_name']}_" if meta.get("class_name") else ""
                 chunk_id = f"{file_path}_{meta['symbol_type']}_{class_prefix}{meta['symbol_name']}_{meta['chunk_index']}"
+                chunk_ids.append(chunk_id)
+                content_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+                meta["content_hash"] = content_hash
+                if existing_hashes is not None and existing_hashes.get(chunk_id) == content_hash:
+                    unchanged_ids.append(chunk_id)
+                    unchanged_metas.append(meta)
+                    continue
                 indexer.add_chunk(text, meta, chunk_id)
 
-            return True
-        except (OSError, UnicodeDecodeError) as e:
-            logger.warning(f"Skipping {file_path}: encoding error - {e}")
-            return False
+            if unchanged_ids:
+                self.vector_store.update_metadatas(unchanged_ids, unchanged_metas)
+            if existing_hashes:
+                stale = existing_hashes.keys() - set(chunk_ids)
+                if stale:
+                    self.vector_store.delete(ids=sorted(stale))
+            return len(unchanged_ids)
         except Exception as e:
             logger.error(f"Unexpected error processing {file_path}: {e}", exc_info=True)
+            return None
+
+    def iter_split_files(
+        self, files: Sequence[Path]
+    ) -> Iterator[tuple[Path, list[dict[str, Any]] | None]]:
+        """
+        Yields (file, chunks) in input order while worker threads read and split
+        up to INDEX_READ_AHEAD files ahead of the consumer.
+
+        Args:
+            files: Files to read and split
+
+        Returns:
+            Iterator of (file_path, chunks or None)
+        """
+        if INDEX_READ_WORKERS <= 1 or len(files) < 2:
+            for file_path in files:
+                yield file_path, self.read_and_split(file_path)
+            return
+
+        remaining = iter(files)
+        with ThreadPoolExecutor(
+            max_workers=INDEX_READ_WORKERS, thread_name_prefix="projectmind-index"
+        ) as pool:
+            pending: deque[tuple[Path, Future[list[dict[str, Any]] | None]]] = deque(
+                (file_path, pool.submit(self.read_and_split, file_path))
+                for file_path in islice(remaining, INDEX_READ_AHEAD)
+            )
+            while pending:
+                file_path, future = pending.popleft()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(self.read_and_split, next_path)))
+                yield file_path, future.result()
+
+    def process_file_to_chunks(self, file_path: Path, indexer: MemoryLimitedIndexer) -> bool:
+        """
+        Processes a single file: reads, splits into AST-aware chunks, adds to indexer.
+
+        Args:
+            file_path: File to process
+            indexer: Memory-limited indexer to add chunks to
+
+        Returns:
+            True if file was successfully processed
+        """
+        chunks = self.read_and_split(file_path)
+        if chunks is None:
             return False
+        return self.add_chunks(file_path, chunks, indexer) is not None
 
     def process_file_with_metadata(
         self, file_path: Path, indexer: MemoryLimitedIndexer, metadata: IndexMetadata
@@ -183,15 +302,60 @@ class CodebaseIndexer:
         """
         if not self.process_file_to_chunks(file_path, indexer):
             return False
+        return self._record_mtime(file_path, metadata)
 
+    def _record_mtime(self, file_path: Path, metadata: IndexMetadata) -> bool:
         try:
-            mtime = file_path.stat().st_mtime
-            metadata.update_file(str(file_path), mtime)
+            mtime_ns = file_path.stat().st_mtime_ns
+            metadata.update_file(str(file_path), mtime_ns)
             return True
         except Exception as e:
             logger.error(f"Error updating metadata for {file_path}: {e}")
             return False
 
+    def _index_files(
+        self, files: list[Path], metadata: IndexMetadata | None = None
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Shared read -> split -> batched upsert pipeline for index_all and index_changed.
+
+        Args:
+            files: Files to index
+            metadata: If given (incremental run), each indexed file's mtime is recorded
+                in it and chunks whose content hash is already stored are skipped
+
+        Returns:
+            (number of files indexed, MemoryLimitedIndexer stats plus unchanged_chunks)
+        """
+        max_memory = get_max_memory_bytes()
+        indexer = MemoryLimitedIndexer(
+            max_memory, self._create_batch_upsert_callback(), max_chunks=BATCH_SIZE
+        )
+        logger.info(
+            f"Indexing {len(files)} files (memory limit: {max_memory / 1024 / 1024:.0f} MB)..."
+        )
+
+        file_count = 0
+        unchanged_chunks = 0
+        for file_path, chunks in self.iter_split_files(files):
+            if chunks is None:
+                continue
+            existing = (
+                self.vector_store.get_chunk_hashes(str(file_path)) if metadata is not None else None
+            )
+            unchanged = self.add_chunks(file_path, chunks, indexer, existing)
+            if unchanged is None:
+                continue
+            unchanged_chunks += unchanged
+            if metadata is not None and not self._record_mtime(file_path, metadata):
+                continue
+            file_count += 1
+            if file_count % PROGRESS_REPORT_INTERVAL == 0:
+                logger.info("Progress: %d/%d files processed...", file_count, len(files))
+
+        indexer.flush()
+        return file_count, {**indexer.get_stats(), "unchanged_chunks": unchanged_chunks}
+
     def index_all(
         self, root_dir: Path, ignored_dirs: set[str], ignore_patterns: set[str], force: bool = False
     ) -> str:
@@ -213,11 +377,7 @@ class CodebaseIndexer:
             if error:
                 return error
 
-        max_memory = get_max_memory_bytes()
-        indexer = MemoryLimitedIndexer(max_memory, self._create_batch_upsert_callback())
-
-        logger.info(f"Scanning files (memory limit: {max_memory / 1024 / 1024:.0f} MB)...")
-
+        logger.info("Scanning files...")
         indexable_files = self.scan_indexable_files(root_dir, ignored_dirs, ignore_patterns)
 
         # Apply limit to prevent extremely long operations
@@ -226,21 +386,11 @@ class CodebaseIndexer:
             logger.warning(f"Limiting index to {MAX_FILES_PER_INDEX} of {total_files} files")
             indexable_files = indexable_files[:MAX_FILES_PER_INDEX]
 
-        file_count = 0
-
-        for file_path in indexable_files:
-            if self.process_file_to_chunks(file_path, indexer):
-                file_count += 1
-            # Progress reporting
-            if file_count % PROGRESS_REPORT_INTERVAL == 0:
-                logger.info(f"Progress: {file_count}/{len(indexable_files)} files processed...")
-
-        indexer.flush()
+        file_count, stats = self._index_files(indexable_files)
 
         logger.info("Rebuilding BM25 index...")
         self.vector_store.rebuild_bm25()
 
-        stats = indexer.get_stats()
         warning = (
             "" if total_files <= MAX_FILES_PER_INDEX else f" (limited from {total_files} files)"
         )
@@ -268,22 +418,7 @@ class CodebaseIndexer:
         if not changed_files:
             return "No changed files to index."
 
-        max_memory = get_max_memory_bytes()
-        indexer = MemoryLimitedIndexer(max_memory, self._create_batch_upsert_callback())
-
-        logger.info(
-            f"Found {len(changed_files)} changed files (memory limit: {max_memory / 1024 / 1024:.0f} MB)..."
-        )
-        file_count = 0
-
-        for file_path in changed_files:
-            if self.process_file_with_metadata(file_path, indexer, metadata):
-                file_count += 1
-            # Progress reporting
-            if file_count % PROGRESS_REPORT_INTERVAL == 0:
-                logger.info(f"Progress: {file_count}/{len(changed_files)} files processed...")
-
-        indexer.flush()
+        file_count, stats = self._index_files(changed_files, metadata)
 
         existing_files = {str(f) for f in all_files}
         metadata.remove_deleted_files(existing_files)
@@ -292,5 +427,6 @@ class CodebaseIndexer:
         logger.info("Rebuilding BM25 index...")
         self.vector_store.rebuild_bm25()
 
-        stats = indexer.get_stats()
-        return f"Incrementally indexed {file_count} changed files ({stats['total_chunks']} chunks in {stats['total_batches']} batches)."
+        skipped = stats["unchanged_chunks"]
+        unchanged = f", {skipped} unchanged chunks skipped" if skipped else ""
+        return f"Incrementally indexed {file_count} changed files ({stats['total_chunks']} chunks in {stats['total_batches']} batches{unchanged})."
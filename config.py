@@ -1,6 +1,8 @@
 import fnmatch
+import functools
 import os
 import sys
+from collections.abc import Collection, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -92,6 +94,21 @@ def resolve_index_ignore_file() -> Path:
     return INDEX_IGNORE_FILE
 
 
+# Skeleton written to a new memory file; {initial} is the first Recent Decisions entry
+MEMORY_TEMPLATE = """# Project Memory
+
+## Status
+- [ ] Initial Setup
+
+## Tech Stack
+- Language: Python
+- Framework:
+
+## Recent Decisions
+- {initial}
+"""
+
+
 def reconfigure(new_root: Path) -> None:
     global PROJECT_ROOT, AI_DIR, MEMORY_FILE, VECTOR_STORE_DIR
     global INDEX_IGNORE_FILE, INDEX_METADATA_FILE, BM25_INDEX_PATH, MEMORY_HISTORY_DIR, LOG_FILE
@@ -118,7 +135,11 @@ MODEL_NAME = "flax-sentence-embeddings/st-codesearch-distilroberta-base"
 
 CHUNK_SIZE = 1500
 CHUNK_OVERLAP = 150
-BATCH_SIZE = 100
+# Split pieces shorter than this are folded into a neighbouring chunk
+MIN_CHUNK_SIZE = 100
+BATCH_SIZE = 250
+# Sentences per forward pass inside SentenceTransformer.encode
+EMBEDDING_BATCH_SIZE = 64
 MAX_FILE_SIZE_MB = 10
 MAX_MEMORY_MB = 100
 
@@ -235,6 +256,7 @@ TEXT_EXTENSIONS: set[str] = {
     ".proto",
 }
 
+# Disjoint from BINARY_EXTENSIONS, so a known suffix is decided by this set alone
 INDEXABLE_EXTENSIONS = CODE_EXTENSIONS | TEXT_EXTENSIONS
 
 
@@ -266,12 +288,45 @@ def get_ignored_dirs() -> set[str]:
     return DEFAULT_IGNORED_DIRS.copy()
 
 
+@functools.lru_cache(maxsize=4096)
 def is_dir_ignored(dir_name: str) -> bool:
     if dir_name in DEFAULT_IGNORED_DIRS:
         return True
     return any(fnmatch.fnmatch(dir_name, pat) for pat in IGNORED_DIR_PATTERNS)
 
 
+def iter_project_files(
+    start: Path, skip_hidden: bool = False, ignored_dirs: Collection[str] = ()
+) -> Iterator[os.DirEntry[str]]:
+    """
+    Yields every file below start, pruning ignored directories.
+
+    Uses os.scandir so entry types come from the directory listing instead of a
+    Path object and stat call per file. Symlinked directories are not followed.
+
+    Args:
+        start: Directory to walk
+        skip_hidden: Also prune directories whose name starts with "."
+        ignored_dirs: Extra directory names to prune on top of the defaults
+    """
+    stack = [str(start)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        yield entry
+                    elif not (
+                        entry.is_symlink()
+                        or entry.name in ignored_dirs
+                        or is_dir_ignored(entry.name)
+                        or (skip_hidden and entry.name.startswith("."))
+                    ):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
 def validate_path(path: str) -> Path:
     """
     Validates that a path is within the project root directory.
@@ -339,15 +394,22 @@ def safe_read_text(file_path: Path) -> str:
 
     encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252", "iso-8859-1"]
 
+    # Read once; each encoding attempt decodes the same bytes instead of re-reading
+    try:
+        raw = file_path.read_bytes()
+    except Exception as e:
+        raise OSError(f"Error reading file {file_path}: {e}") from e
+
     for encoding in encodings:
         try:
-            content = file_path.read_text(encoding=encoding)
-            _file_cache.put(file_path, content)
-            return content
+            content = raw.decode(encoding)
         except UnicodeDecodeError:
             continue
-        except Exception as e:
-            raise OSError(f"Error reading file {file_path}: {e}") from e
+        if "\r" in content:
+            # Match read_text's universal-newline translation
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        _file_cache.put(file_path, content)
+        return content
 
     raise UnicodeDecodeError(
         "multi-encoding",
@@ -1,28 +1,113 @@
 """Git utilities for ProjectMind MCP Server."""
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from __future__ import annotations
 
-import git
+import io
+import itertools
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from exceptions import GitError
 from logger import get_logger
 
+if TYPE_CHECKING:
+    import git
+
 logger = get_logger()
 
+# Opened repositories shared across GitRepository instances, keyed by path. GitPython
+# re-reads refs on every call, so a cached Repo stays valid when HEAD moves.
+_REPO_CACHE: dict[str, git.Repo] = {}
+_REPO_CACHE_LOCK = threading.Lock()
+
+# Short-lived memo for get_commits so back-to-back tool calls share one rev-list.
+# Keyed by (path, max_count, since_days, HEAD signature); values are (stored_at, commits).
+COMMITS_CACHE_TTL = 5.0
+COMMITS_CACHE_MAX_SIZE = 8
+_CommitsKey = tuple[str, int, int | None, tuple[int, int]]
+_COMMITS_CACHE: dict[_CommitsKey, tuple[float, list[CommitInfo]]] = {}
+
+# get_recently_changed_files reads per-commit stats, so its result is kept until HEAD
+# moves. The TTL only lets files age out of the day window while HEAD stays put.
+# Keyed by (path, days, max_files); values are (HEAD signature, stored_at, files).
+RECENT_FILES_CACHE_TTL = 60.0
+_RECENT_FILES_CACHE: dict[
+    tuple[str, int, int], tuple[tuple[int, int], float, dict[str, CommitInfo]]
+] = {}
+
+
+def _head_signature(repo: git.Repo) -> tuple[int, int]:
+    """
+    Returns mtimes of HEAD and its reflog.
+
+    HEAD changes on checkout; logs/HEAD is appended on every commit, reset,
+    merge or checkout, so together they detect any movement of HEAD.
+    """
+    git_dir = str(repo.git_dir)
+    signature = []
+    for rel in ("HEAD", os.path.join("logs", "HEAD")):
+        try:
+            signature.append(os.stat(os.path.join(git_dir, rel)).st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return signature[0], signature[1]
+
+
+def _open_repo(path: str) -> git.Repo:
+    # GitPython is imported on first use; it is a sizeable share of server startup
+    import git
+
+    try:
+        return git.Repo(path, search_parent_directories=True)
+    except git.InvalidGitRepositoryError as e:
+        raise GitError("Current directory is not a git repository.") from e
+    except Exception as e:
+        raise GitError(f"Error accessing git repository: {e}") from e
+
+
+def clear_repo_cache() -> None:
+    """Drops all cached repositories. Useful for testing or after switching projects."""
+    with _REPO_CACHE_LOCK:
+        for repo in _REPO_CACHE.values():
+            try:
+                repo.close()
+            except Exception:
+                pass
+        _REPO_CACHE.clear()
+        _COMMITS_CACHE.clear()
+        _RECENT_FILES_CACHE.clear()
+
 
 @dataclass
 class CommitInfo:
-    """Represents a git commit."""
+    """
+    Represents a git commit.
+
+    Display strings (`first_line`, `date_str`, `date_short`) are computed once
+    on construction so formatting loops don't repeat strftime/split per access.
+    """
 
     hash: str
     short_hash: str
     message: str
     author: str
     date: datetime
+    first_line: str = field(init=False, repr=False)
+    date_str: str = field(init=False, repr=False)
+    date_short: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.first_line = self.message.split("\n", 1)[0][:100]
+        self.date_str = self.date.strftime("%Y-%m-%d %H:%M")
+        self.date_short = self.date_str[:10]
 
     @classmethod
-    def from_commit(cls, commit: git.Commit) -> "CommitInfo":
+    def from_commit(cls, commit: git.Commit) -> CommitInfo:
         message = commit.message
         if isinstance(message, bytes):
             message = message.decode("utf-8", errors="replace")
@@ -35,17 +120,67 @@ class CommitInfo:
             date=datetime.fromtimestamp(commit.committed_date),
         )
 
-    @property
-    def first_line(self) -> str:
-        return self.message.split("\n")[0][:100]
 
-    @property
-    def date_str(self) -> str:
-        return self.date.strftime("%Y-%m-%d %H:%M")
+# One `git log` record per commit: hash, commit time, author, raw message.
+# Fields are NUL-separated and records end with RS (0x1e) since messages span lines.
+_LOG_FORMAT = "--format=%H%x00%ct%x00%an%x00%B%x1e"
+_LOG_READ_SIZE = 64 * 1024
+
+
+def _iter_log_records(stream: io.BufferedIOBase) -> Iterator[bytes]:
+    """Yields raw `git log` records as they arrive, reading the pipe in chunks."""
+    pending = b""
+    while chunk := stream.read1(_LOG_READ_SIZE):
+        *records, pending = (pending + chunk).split(b"\x1e")
+        yield from records
+    if pending.strip():
+        yield pending
 
-    @property
-    def date_short(self) -> str:
-        return self.date.strftime("%Y-%m-%d")
+
+def _parse_log(records: Iterable[bytes]) -> Iterator[CommitInfo]:
+    for raw in records:
+        # RS never occurs inside a UTF-8 sequence, so each record decodes on its own
+        record = raw.decode("utf-8", errors="replace").lstrip("\n")
+        if not record:
+            continue
+        hexsha, committed, author, message = record.split("\x00", 3)
+        yield CommitInfo(
+            hash=hexsha,
+            short_hash=hexsha[:7],
+            message=message.strip(),
+            author=author or "Unknown",
+            date=datetime.fromtimestamp(int(committed)),
+        )
+
+
+def _wait_log(proc: git.cmd.Git.AutoInterrupt) -> None:
+    import git
+
+    try:
+        proc.wait()
+    except git.GitCommandError as e:
+        raise GitError(f"Error reading git history: {e}") from e
+
+
+def _stream_log(proc: git.cmd.Git.AutoInterrupt, records: Iterable[bytes]) -> Iterator[bytes]:
+    """Passes records through, then checks git's exit status or stops git if abandoned."""
+    finished = False
+    try:
+        yield from records
+        finished = True
+    finally:
+        if not finished:
+            proc.terminate()
+    _wait_log(proc)
+
+
+def _stream_commits(
+    commits: Iterable[CommitInfo], cutoff_date: datetime | None
+) -> Iterator[CommitInfo]:
+    for commit_info in commits:
+        if cutoff_date and commit_info.date < cutoff_date:
+            return
+        yield commit_info
 
 
 class GitRepository:
@@ -61,30 +196,83 @@ class GitRepository:
             self._path = path
 
     def _get_repo(self) -> git.Repo:
-        if self._repo is None:
-            try:
-                self._repo = git.Repo(self._path, search_parent_directories=True)
-            except git.InvalidGitRepositoryError as e:
-                raise GitError("Current directory is not a git repository.") from e
-            except Exception as e:
-                raise GitError(f"Error accessing git repository: {e}") from e
+        # Always consult the shared cache so a long-lived instance (e.g. the one held
+        # by AppContext) picks up a repo reopened after clear_repo_cache().
+        with _REPO_CACHE_LOCK:
+            cached = _REPO_CACHE.get(self._path)
+        if cached is None:
+            repo = _open_repo(self._path)
+            with _REPO_CACHE_LOCK:
+                cached = _REPO_CACHE.setdefault(self._path, repo)
+            if cached is not repo:
+                # Another caller opened it first; don't leak this one's git processes
+                repo.close()
+        self._repo = cached
         return self._repo
 
     def get_commits(self, max_count: int = 30, since_days: int | None = None) -> list[CommitInfo]:
+        """
+        Returns commits newest-first, reusing a result fetched within the last
+        COMMITS_CACHE_TTL seconds if HEAD has not moved since.
+        """
+        repo = self._get_repo()
+        key: _CommitsKey = (self._path, max_count, since_days, _head_signature(repo))
+        now = time.monotonic()
+        with _REPO_CACHE_LOCK:
+            cached = _COMMITS_CACHE.get(key)
+        if cached is not None and now - cached[0] < COMMITS_CACHE_TTL:
+            return list(cached[1])
+
+        commits = list(self.iter_commits(max_count=max_count, since_days=since_days))
+        with _REPO_CACHE_LOCK:
+            for stale in [
+                k for k, (at, _) in _COMMITS_CACHE.items() if now - at >= COMMITS_CACHE_TTL
+            ]:
+                del _COMMITS_CACHE[stale]
+            if len(_COMMITS_CACHE) >= COMMITS_CACHE_MAX_SIZE:
+                del _COMMITS_CACHE[min(_COMMITS_CACHE, key=lambda k: _COMMITS_CACHE[k][0])]
+            _COMMITS_CACHE[key] = (now, commits)
+        return list(commits)
+
+    def iter_commits(
+        self, max_count: int = 30, since_days: int | None = None
+    ) -> Iterator[CommitInfo]:
+        """
+        Yields commits newest-first from a single streamed `git log` process.
+
+        Commit fields come preformatted from git instead of being resolved per
+        commit through GitPython objects, and records are parsed as git writes
+        them. git is started and its first record read eagerly, so a log that
+        fails outright raises GitError from this call; a consumer that stops
+        early terminates git.
+        """
+        import git
+
         repo = self._get_repo()
-        commits = []
 
         cutoff_date = None
+        kwargs: dict[str, str] = {}
         if since_days is not None:
             cutoff_date = datetime.now() - timedelta(days=since_days)
+            # Let git do the date filtering; the check in _stream_commits only guards
+            # against clock-skewed history that --since still lets through.
+            kwargs["since"] = cutoff_date.isoformat(timespec="seconds")
 
-        for commit in repo.iter_commits(max_count=max_count):
-            commit_info = CommitInfo.from_commit(commit)
-            if cutoff_date and commit_info.date < cutoff_date:
-                break
-            commits.append(commit_info)
+        try:
+            proc = repo.git.log(_LOG_FORMAT, max_count=max_count, as_process=True, **kwargs)
+        except git.GitCommandError as e:
+            raise GitError(f"Error reading git history: {e}") from e
 
-        return commits
+        records = _iter_log_records(proc.stdout)
+        # Read up to the first record now: a log that fails outright (e.g. no commits
+        # yet) prints nothing, and its GitError should surface from this call
+        first = next(records, None)
+        if first is None:
+            _wait_log(proc)
+            return iter(())
+        return _stream_commits(
+            _parse_log(_stream_log(proc, itertools.chain([first], records))), cutoff_date
+        )
 
     def get_commits_by_author(self, commits: list[CommitInfo]) -> dict[str, list[CommitInfo]]:
         authors: dict[str, list[CommitInfo]] = {}
@@ -124,7 +312,31 @@ class GitRepository:
     def get_recently_changed_files(
         self, days: int = 7, max_files: int = 50
     ) -> dict[str, CommitInfo]:
+        """
+        Maps each file touched in the last `days` days to its newest commit,
+        reusing the previous result while HEAD has not moved.
+        """
         repo = self._get_repo()
+        key = (self._path, days, max_files)
+        signature = _head_signature(repo)
+        now = time.monotonic()
+        with _REPO_CACHE_LOCK:
+            cached = _RECENT_FILES_CACHE.get(key)
+        if (
+            cached is not None
+            and cached[0] == signature
+            and now - cached[1] < RECENT_FILES_CACHE_TTL
+        ):
+            return dict(cached[2])
+
+        result = self._scan_recently_changed_files(repo, days, max_files)
+        with _REPO_CACHE_LOCK:
+            _RECENT_FILES_CACHE[key] = (signature, now, result)
+        return dict(result)
+
+    def _scan_recently_changed_files(
+        self, repo: git.Repo, days: int, max_files: int
+    ) -> dict[str, CommitInfo]:
         result: dict[str, CommitInfo] = {}
         cutoff = datetime.now() - timedelta(days=days)
         try:
@@ -85,7 +85,7 @@ def atomic_write(file_path: Path, content: str) -> None:
 
 class IndexMetadata:
     def __init__(self) -> None:
-        self.metadata: dict[str, dict[str, str | float]] = {}
+        self.metadata: dict[str, dict[str, str | int | float]] = {}
         self.load()
 
     def load(self) -> None:
@@ -110,17 +110,28 @@ class IndexMetadata:
         try:
             content = json.dumps(self.metadata, indent=2)
             atomic_write(config.INDEX_METADATA_FILE, content)
-            logger.debug(f"Metadata saved successfully: {len(self.metadata)} files tracked")
+            logger.debug("Metadata saved successfully: %d files tracked", len(self.metadata))
         except Exception as e:
             logger.error(f"Error saving metadata: {e}", exc_info=True)
             raise
 
-    def get_file_mtime(self, file_path: str) -> float:
-        return float(self.metadata.get(file_path, {}).get("mtime", 0.0))
+    def get_file_mtime(self, file_path: str) -> int:
+        """
+        Returns the stored modification time in integer nanoseconds (0 if unknown).
 
-    def update_file(self, file_path: str, mtime: float) -> None:
+        Entries written before the `mtime_ns` schema stored float seconds under
+        `mtime`; those are converted so existing metadata keeps working.
+        """
+        entry = self.metadata.get(file_path, {})
+        if "mtime_ns" in entry:
+            return int(entry["mtime_ns"])
+        if "mtime" in entry:
+            return int(float(entry["mtime"]) * 1_000_000_000)
+        return 0
+
+    def update_file(self, file_path: str, mtime_ns: int) -> None:
         self.metadata[file_path] = {
-            "mtime": mtime,
+            "mtime_ns": mtime_ns,
             "indexed_at": datetime.now().isoformat(),
         }
 
@@ -129,10 +140,10 @@ class IndexMetadata:
 
         for file_path in all_files:
             try:
-                current_mtime = file_path.stat().st_mtime
-                stored_mtime = self.get_file_mtime(str(file_path))
+                current_mtime_ns = file_path.stat().st_mtime_ns
+                stored_mtime_ns = self.get_file_mtime(str(file_path))
 
-                if current_mtime > stored_mtime:
+                if current_mtime_ns > stored_mtime_ns:
                     changed_files.append(file_path)
             except Exception:
                 changed_files.append(file_path)
@@ -1,13 +1,21 @@
 """Centralized logging configuration for ProjectMind"""
 
+import atexit
 import json
 import logging
+import multiprocessing
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 import config
 
 _logger: logging.Logger | None = None
+_listener: QueueListener | None = None
+# Whether _listener's thread is running; guarded by _listener_lock
+_listener_running = False
+_listener_lock = threading.Lock()
 
 
 class StructuredFormatter(logging.Formatter):
@@ -56,31 +64,43 @@ class StructuredFormatter(logging.Formatter):
         return base
 
 
+def _make_formatter() -> StructuredFormatter:
+    return StructuredFormatter(
+        fmt="[%(asctime)s] %(levelname)s [%(name)s.%(funcName)s:%(lineno)d] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
 def setup_logger(name: str = "ProjectMind") -> logging.Logger:
     """
     Sets up a rotating file logger with both file and stderr output.
     Supports structured logging with extra fields.
 
+    File writes go through a QueueHandler and are performed by a background
+    QueueListener thread, so log calls never block on disk I/O or rotation.
+    In a spawned child process (e.g. a pool worker re-importing mcp_server.py as
+    __mp_main__) it falls back to setup_worker_logger instead.
+
     Args:
         name: Logger name
 
     Returns:
         Configured logger instance
     """
-    global _logger
+    global _logger, _listener
 
     if _logger is not None:
         return _logger
 
+    if multiprocessing.current_process().name != "MainProcess":
+        return setup_worker_logger(name)
+
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
     logger.handlers.clear()
 
-    formatter = StructuredFormatter(
-        fmt="[%(asctime)s] %(levelname)s [%(name)s.%(funcName)s:%(lineno)d] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = _make_formatter()
 
     try:
         config.AI_DIR.mkdir(parents=True, exist_ok=True)
@@ -93,7 +113,15 @@ def setup_logger(name: str = "ProjectMind") -> logging.Logger:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _start_listener()
+        atexit.register(_stop_listener)
+
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
     except Exception as e:
         sys.stderr.write(f"Warning: Could not setup file logging: {e}\n")
 
@@ -106,6 +134,38 @@ def setup_logger(name: str = "ProjectMind") -> logging.Logger:
     return logger
 
 
+def setup_worker_logger(name: str = "ProjectMind") -> logging.Logger:
+    """
+    Configures logging in a worker process to go to stderr only.
+
+    Used as a process pool initializer so spawned workers, which re-import the
+    modules that call get_logger(), don't each attach a RotatingFileHandler and
+    listener thread to the server's log file. A listener already set up in this
+    process is stopped and its handlers closed.
+
+    Args:
+        name: Logger name
+
+    Returns:
+        Configured logger instance
+    """
+    global _logger
+
+    _discard_listener()
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(logging.WARNING)
+    stderr_handler.setFormatter(_make_formatter())
+    logger.addHandler(stderr_handler)
+
+    _logger = logger
+    return logger
+
+
 def get_logger() -> logging.Logger:
     """
     Gets the configured logger instance.
@@ -117,3 +177,46 @@ def get_logger() -> logging.Logger:
     if _logger is None:
         return setup_logger()
     return _logger
+
+
+def _start_listener() -> None:
+    global _listener_running
+    with _listener_lock:
+        if _listener is not None and not _listener_running:
+            _listener.start()
+            _listener_running = True
+
+
+def _stop_listener() -> None:
+    """Stops the listener after it has written every queued record."""
+    global _listener_running
+    with _listener_lock:
+        if _listener is not None and _listener_running:
+            _listener.stop()
+            _listener_running = False
+
+
+def _discard_listener() -> None:
+    """Stops the listener, if any, closes its handlers and forgets it."""
+    global _listener, _listener_running
+    with _listener_lock:
+        if _listener is None:
+            return
+        if _listener_running:
+            _listener.stop()
+            _listener_running = False
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def flush_logger() -> None:
+    """
+    Blocks until all queued log records have been written to the log file.
+    """
+    with _listener_lock:
+        if _listener is None or not _listener_running:
+            return
+        # stop() drains the queue before joining the thread; start a fresh one after
+        _listener.stop()
+        _listener.start()
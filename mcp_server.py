@@ -1,8 +1,15 @@
+import atexit
+import functools
+import heapq
+import operator
 import os
-import sys
+import re
 import threading
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import time
+from typing import Any, TypeGuard
 
 from mcp.server.fastmcp import FastMCP
 
@@ -13,6 +20,7 @@ from config import (
     get_ignored_dirs,
     is_dir_ignored,
     is_mcp_server_dir,
+    iter_project_files,
     reconfigure,
     resolve_index_ignore_file,
     validate_path,
@@ -20,7 +28,7 @@ from config import (
 from context import get_context, reset_context
 from exceptions import GitError
 from git_utils import CommitInfo, GitRepository
-from logger import setup_logger
+from logger import setup_logger, setup_worker_logger
 
 logger = setup_logger()
 
@@ -30,6 +38,20 @@ def log(message: str) -> None:
     logger.info(message)
 
 
+def _gitignore_entries(content: str) -> set[str]:
+    """
+    Returns the .gitignore patterns as bare names, e.g. "/.ai/" and "**/.ai" both
+    become ".ai", so checks match whole entries rather than substrings like ".aim/".
+    """
+    entries = set()
+    for line in content.splitlines():
+        pattern = line.strip()
+        if not pattern or pattern.startswith(("#", "!")):
+            continue
+        entries.add(pattern.removeprefix("**/").strip("/"))
+    return entries
+
+
 def startup_check() -> None:
     log("=" * 60)
     log("ProjectMind MCP Server Starting...")
@@ -51,28 +73,21 @@ def startup_check() -> None:
         git_dir = config.PROJECT_ROOT / ".git"
         if git_dir.exists():
             gitignore_path = config.PROJECT_ROOT / ".gitignore"
-            ai_ignored = False
-            pycache_ignored = False
-
-            if gitignore_path.exists():
-                content = gitignore_path.read_text()
-                if ".ai/" in content or ".ai" in content:
-                    ai_ignored = True
-                if "__pycache__" in content:
-                    pycache_ignored = True
-
-                if not ai_ignored or not pycache_ignored:
-                    with open(gitignore_path, "a") as f:
-                        if not content.endswith("\n") and content:
+            try:
+                # One handle for the check and the append
+                with open(gitignore_path, "r+", encoding="utf-8") as f:
+                    content = f.read()
+                    entries = _gitignore_entries(content)
+                    missing = [e for e in (".ai", "__pycache__") if e not in entries]
+                    if missing:
+                        f.seek(0, os.SEEK_END)
+                        if content and not content.endswith("\n"):
                             f.write("\n")
-                        if not ai_ignored:
-                            f.write(".ai/\n")
-                            log("Added .ai/ to .gitignore")
-                        if not pycache_ignored:
-                            f.write("__pycache__/\n")
-                            log("Added __pycache__/ to .gitignore")
-            else:
-                with open(gitignore_path, "w") as f:
+                        for entry in missing:
+                            f.write(f"{entry}/\n")
+                            log(f"Added {entry}/ to .gitignore")
+            except FileNotFoundError:
+                with open(gitignore_path, "w", encoding="utf-8") as f:
                     f.write(".ai/\n__pycache__/\n")
                 log("Created .gitignore with .ai/ and __pycache__/")
     except (OSError, PermissionError) as e:
@@ -80,19 +95,9 @@ def startup_check() -> None:
 
     try:
         if not config.MEMORY_FILE.exists():
-            template = """# Project Memory
-
-## Status
-- [ ] Initial Setup
-
-## Tech Stack
-- Language: Python
-- Framework:
-
-## Recent Decisions
-- Project initialized.
-"""
-            config.MEMORY_FILE.write_text(template)
+            config.MEMORY_FILE.write_text(
+                config.MEMORY_TEMPLATE.format(initial="Project initialized.")
+            )
             log(f"Created {config.MEMORY_FILE}")
     except (OSError, PermissionError) as e:
         log(f"Warning: Could not create {config.MEMORY_FILE}: {e}")
@@ -114,6 +119,17 @@ def ensure_startup() -> None:
         _startup_done = True
 
 
+def start_background_startup() -> threading.Thread:
+    """
+    Runs ensure_startup() on a daemon thread so the transport can start serving
+    immediately. Tools still call ensure_startup(), which waits on _startup_lock
+    until the background run has finished.
+    """
+    thread = threading.Thread(target=ensure_startup, name="projectmind-startup", daemon=True)
+    thread.start()
+    return thread
+
+
 mcp = FastMCP("ProjectMind")
 
 
@@ -156,7 +172,7 @@ def set_project_root(path: str) -> str:
     Returns:
         Confirmation message with the new project root.
     """
-    global _startup_done
+    global _startup_done, _git_repo_probe, _quality_cache
     target = Path(path).resolve()
     if not target.exists():
         return f"Error: Path does not exist: {path}"
@@ -166,6 +182,8 @@ def set_project_root(path: str) -> str:
     reconfigure(target)
     reset_context()
     _startup_done = False
+    _git_repo_probe = None
+    _quality_cache = None
     ensure_startup()
     log(f"Project root changed to: {config.PROJECT_ROOT}")
 
@@ -269,7 +287,7 @@ def session_init(project_path: str = "") -> str:
     Returns:
         Consolidated Markdown brief summarising project root, memory, and index state.
     """
-    global _startup_done
+    global _startup_done, _git_repo_probe
 
     sections: list[str] = ["# ProjectMind — Session Init"]
 
@@ -282,6 +300,7 @@ def session_init(project_path: str = "") -> str:
         reconfigure(target)
         reset_context()
         _startup_done = False
+        _git_repo_probe = None
         ensure_startup()
         sections.append(f"**Project root** set to: `{config.PROJECT_ROOT}`")
     else:
@@ -341,31 +360,38 @@ def session_init(project_path: str = "") -> str:
 
 def load_index_ignore_patterns() -> set[str]:
     ignore_file = resolve_index_ignore_file()
-    if not ignore_file.exists():
+    try:
+        mtime_ns = ignore_file.stat().st_mtime_ns
+    except OSError:
         return set()
 
     try:
-        patterns = set()
-        with open(ignore_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    patterns.add(line)
-        return patterns
+        return set(_parse_index_ignore(str(ignore_file), mtime_ns))
     except Exception as e:
         log(f"Error reading .indexignore at {ignore_file}: {e}")
         return set()
 
 
-def _read_memory_sections() -> dict[str, str]:
-    """Reads memory.md and returns sections as a dict. No vector store needed."""
-    if not config.MEMORY_FILE.exists():
-        return {}
-    try:
-        content = config.MEMORY_FILE.read_text(encoding="utf-8")
-    except Exception:
-        return {}
+@functools.lru_cache(maxsize=4)
+def _parse_index_ignore(path: str, mtime_ns: int) -> frozenset[str]:
+    """Parses an .indexignore file. mtime_ns is part of the cache key so edits are picked up."""
+    patterns = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                patterns.add(line)
+    return frozenset(patterns)
+
+
+# memory.md text (as read and lower-cased) and its "## " sections, keyed by
+# (path, mtime_ns, size) so the overview and explore tools share one read and
+# parse until the file changes.
+_memory_snapshot: tuple[tuple[Path, int, int], str, str, dict[str, str]] | None = None
+_memory_snapshot_lock = threading.Lock()
 
+
+def _parse_memory_sections(content: str) -> dict[str, str]:
     sections: dict[str, str] = {}
     current_section = ""
     current_lines: list[str] = []
@@ -385,16 +411,50 @@ def _read_memory_sections() -> dict[str, str]:
     return sections
 
 
+def _get_memory_snapshot() -> tuple[str, str, dict[str, str]] | None:
+    """Returns (content, lower-cased content, sections) of memory.md, or None if unreadable."""
+    global _memory_snapshot
+
+    path = config.MEMORY_FILE
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = (path, st.st_mtime_ns, st.st_size)
+
+    snap = _memory_snapshot
+    if snap is not None and snap[0] == key:
+        return snap[1], snap[2], snap[3]
+
+    with _memory_snapshot_lock:
+        try:
+            content = path.read_text(encoding="utf-8")
+        except Exception:
+            return None
+        sections = _parse_memory_sections(content)
+        content_lower = content.lower()
+        _memory_snapshot = (key, content, content_lower, sections)
+    return content, content_lower, sections
+
+
+def _read_memory_sections() -> dict[str, str]:
+    """Reads memory.md and returns sections as a dict. No vector store needed."""
+    snapshot = _get_memory_snapshot()
+    return dict(snapshot[2]) if snapshot is not None else {}
+
+
 def _search_memory_for(keyword: str) -> list[str]:
     """Searches memory.md for lines mentioning a keyword. No vector store needed."""
-    if not config.MEMORY_FILE.exists():
-        return []
-    try:
-        content = config.MEMORY_FILE.read_text(encoding="utf-8")
-    except Exception:
+    snapshot = _get_memory_snapshot()
+    if snapshot is None:
         return []
+    content, content_lower, _sections = snapshot
 
     keyword_lower = keyword.lower()
+    # Most keywords never appear; one scan of the whole file rules them out
+    # before any per-line splitting and lower-casing
+    if keyword_lower not in content_lower:
+        return []
     matches = []
     for line in content.split("\n"):
         if keyword_lower in line.lower() and line.strip():
@@ -402,14 +462,63 @@ def _search_memory_for(keyword: str) -> list[str]:
     return matches
 
 
+def _shared_git_repo() -> GitRepository:
+    """Returns the GitRepository held by the app context, creating it on first use."""
+    ctx = get_context()
+    if ctx.git_repo is None:
+        ctx.git_repo = GitRepository()
+    return ctx.git_repo
+
+
+def _rel_posix(path: Path) -> str:
+    """Returns path relative to PROJECT_ROOT with forward slashes, as git reports it."""
+    return path.relative_to(config.PROJECT_ROOT).as_posix()
+
+
+# Outcome of the last _get_git_repo_safe probe, keyed by the project root it ran for.
+# A failed probe is kept too, so non-git projects don't search parent dirs on every
+# call, but only until <root>/.git appears (e.g. after `git init`).
+_git_repo_probe: tuple[Path, GitRepository | None] | None = None
+
+
 def _get_git_repo_safe() -> GitRepository | None:
     """Returns GitRepository or None if not a git repo. Never raises."""
+    global _git_repo_probe
+    root = config.PROJECT_ROOT
+    probe = _git_repo_probe
+    if probe is not None and probe[0] == root:
+        if probe[1] is not None or not (root / ".git").exists():
+            return probe[1]
+    repo: GitRepository | None
     try:
         repo = GitRepository()
         repo._get_repo()
-        return repo
     except Exception:
-        return None
+        repo = None
+    _git_repo_probe = (root, repo)
+    return repo
+
+
+# Root-level files that identify the project's tooling, with the tech label each implies
+_CONFIG_FILE_HINTS: tuple[tuple[str, str], ...] = (
+    ("pyproject.toml", "Python (pyproject)"),
+    ("setup.py", "Python (setup.py)"),
+    ("requirements.txt", "Python (requirements)"),
+    ("package.json", "Node.js"),
+    ("Cargo.toml", "Rust"),
+    ("go.mod", "Go"),
+    ("pom.xml", "Java (Maven)"),
+    ("build.gradle", "Java (Gradle)"),
+    ("Gemfile", "Ruby"),
+    ("composer.json", "PHP"),
+    ("Dockerfile", "Docker"),
+    ("docker-compose.yml", "Docker Compose"),
+    (".gitignore", "Git"),
+)
+
+
+# Runs get_project_overview's tree scan alongside its inline probes
+_overview_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="projectmind-overview")
 
 
 @mcp.tool()
@@ -428,38 +537,56 @@ def get_project_overview() -> str:
         overview = [f"# PROJECT OVERVIEW: {root.name}\n"]
         overview.append(f"**Root**: `{root}`")
 
-        git_repo = _get_git_repo_safe()
-        if git_repo:
-            branch = git_repo.get_active_branch()
-            total = git_repo.get_total_commit_count()
-            overview.append(f"**Git**: branch `{branch}`, {total}+ commits")
+        # The tree walk is the slow probe; it runs in the background while the root
+        # listing, memory and git history are read here. Git stays on this thread:
+        # the cached GitPython Repo is not safe to drive from another one.
+        scan_future = _overview_executor.submit(_get_tree_scan)
+        try:
+            # One listing of the root serves both the config-file hints and the
+            # Root Directories section; DirEntry types need no stat per entry
+            try:
+                with os.scandir(root) as entries:
+                    root_entries: list[os.DirEntry[str]] | None = sorted(
+                        entries, key=lambda e: (not e.is_dir(), e.name)
+                    )
+            except PermissionError:
+                root_entries = None
+            root_names = {entry.name for entry in root_entries or ()}
+
+            memory_sections = _read_memory_sections()
+
+            git_line = None
+            recent_commits: list[CommitInfo] = []
+            git_repo = _get_git_repo_safe()
+            if git_repo:
+                try:
+                    recent_commits = git_repo.get_commits(max_count=5, since_days=7)
+                except GitError:
+                    pass
+                git_line = (
+                    f"**Git**: branch `{git_repo.get_active_branch()}`, "
+                    f"{git_repo.get_total_commit_count()}+ commits"
+                )
+
+            scan = scan_future.result()
+        finally:
+            # Only has an effect if we bailed out before the scan was picked up
+            scan_future.cancel()
 
         config_files = []
         tech_hints = []
-        for name, label in [
-            ("pyproject.toml", "Python (pyproject)"),
-            ("setup.py", "Python (setup.py)"),
-            ("requirements.txt", "Python (requirements)"),
-            ("package.json", "Node.js"),
-            ("Cargo.toml", "Rust"),
-            ("go.mod", "Go"),
-            ("pom.xml", "Java (Maven)"),
-            ("build.gradle", "Java (Gradle)"),
-            ("Gemfile", "Ruby"),
-            ("composer.json", "PHP"),
-            ("Dockerfile", "Docker"),
-            ("docker-compose.yml", "Docker Compose"),
-            (".gitignore", "Git"),
-        ]:
-            if (root / name).exists():
+        for name, label in _CONFIG_FILE_HINTS:
+            if name in root_names:
                 config_files.append(name)
                 if label not in ("Git",):
                     tech_hints.append(label)
 
+        if git_line:
+            overview.append(git_line)
+
         if tech_hints:
             overview.append(f"**Tech**: {', '.join(tech_hints)}")
 
-        memory_sections = _read_memory_sections()
         if "Tech Stack" in memory_sections and memory_sections["Tech Stack"]:
             overview.append("\n## Tech Stack (from memory)")
             for line in memory_sections["Tech Stack"].split("\n")[:10]:
@@ -473,10 +600,12 @@ def get_project_overview() -> str:
                     overview.append(line)
 
         overview.append("\n## Root Directories")
-        try:
+        if root_entries is None:
+            overview.append("- (permission denied)")
+        else:
             dirs = []
             files_at_root = 0
-            for entry in sorted(root.iterdir(), key=lambda e: (not e.is_dir(), e.name)):
+            for entry in root_entries:
                 if entry.is_dir():
                     if not is_dir_ignored(entry.name) and not entry.name.startswith("."):
                         dirs.append(entry.name)
@@ -486,21 +615,16 @@ def get_project_overview() -> str:
                 overview.append(f"- `{d}/`")
             if files_at_root:
                 overview.append(f"- ... and {files_at_root} files at root level")
-        except PermissionError:
-            overview.append("- (permission denied)")
 
+        total_files = scan["total_files"]
         file_types: dict[str, int] = {}
-        total_files = 0
-        for _root_path, dir_names, files in os.walk(root):
-            dir_names[:] = [d for d in dir_names if not is_dir_ignored(d)]
-            for file in files:
-                total_files += 1
-                ext = Path(file).suffix.lower()
-                if ext in config.INDEXABLE_EXTENSIONS:
-                    file_types[ext] = file_types.get(ext, 0) + 1
+        for raw_ext, count in scan["ext_histogram"].items():
+            ext = raw_ext.lower()
+            if ext in config.INDEXABLE_EXTENSIONS:
+                file_types[ext] = file_types.get(ext, 0) + count
 
         overview.append(f"\n## File Stats (total: {total_files})")
-        for ext, count in sorted(file_types.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for ext, count in heapq.nlargest(10, file_types.items(), key=operator.itemgetter(1)):
             overview.append(f"- `{ext}`: {count}")
 
         if config_files:
@@ -508,15 +632,10 @@ def get_project_overview() -> str:
             for cfg in config_files:
                 overview.append(f"- `{cfg}`")
 
-        if git_repo:
-            try:
-                commits = git_repo.get_commits(max_count=5, since_days=7)
-                if commits:
-                    overview.append("\n## Recent Activity (last 7 days)")
-                    for c in commits:
-                        overview.append(f"- {c.date_short} [{c.short_hash}]: {c.first_line}")
-            except GitError:
-                pass
+        if recent_commits:
+            overview.append("\n## Recent Activity (last 7 days)")
+            for c in recent_commits:
+                overview.append(f"- {c.date_short} [{c.short_hash}]: {c.first_line}")
 
         recent_decisions = memory_sections.get("Recent Decisions", "")
         if recent_decisions:
@@ -588,11 +707,11 @@ def explore_directory(path: str = ".", depth: int = 1, max_items: int = 100) ->
     lines = [f"# {header}/\n"]
     count = [0]
 
-    def _format_git_hint(entry_path: Path) -> str:
+    def _format_git_hint(entry_path: str) -> str:
         if not recently_changed:
             return ""
         try:
-            rel_path = str(entry_path.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
+            rel_path = _rel_posix(Path(entry_path))
         except ValueError:
             return ""
         if rel_path in recently_changed:
@@ -600,11 +719,13 @@ def explore_directory(path: str = ".", depth: int = 1, max_items: int = 100) ->
             return f"  [changed {ci.date_short}: {ci.first_line[:40]}]"
         return ""
 
-    def _walk(dir_path: Path, prefix: str, current_depth: int) -> None:
+    def _walk(dir_path: str, prefix: str, current_depth: int) -> None:
         if count[0] >= max_items:
             return
         try:
-            entries = sorted(dir_path.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
+            # DirEntry types come from the directory listing, so sorting needs no stat calls
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
         except PermissionError:
             lines.append(f"{prefix}(permission denied)")
             return
@@ -613,7 +734,7 @@ def explore_directory(path: str = ".", depth: int = 1, max_items: int = 100) ->
         files_list = []
         for entry in entries:
             if entry.is_dir():
-                if not is_dir_ignored(entry.name) and not entry.name.startswith("."):
+                if not entry.name.startswith(".") and not is_dir_ignored(entry.name):
                     dirs_list.append(entry)
             else:
                 files_list.append(entry)
@@ -625,7 +746,7 @@ def explore_directory(path: str = ".", depth: int = 1, max_items: int = 100) ->
             lines.append(f"{prefix}{d.name}/")
             count[0] += 1
             if current_depth < depth:
-                _walk(d, prefix + "  ", current_depth + 1)
+                _walk(d.path, prefix + "  ", current_depth + 1)
 
         for f in files_list:
             if count[0] >= max_items:
@@ -641,11 +762,11 @@ def explore_directory(path: str = ".", depth: int = 1, max_items: int = 100) ->
                     size_str = f"{size / 1024 / 1024:.1f}MB"
             except OSError:
                 size_str = "?"
-            git_hint = _format_git_hint(f)
+            git_hint = _format_git_hint(f.path)
             lines.append(f"{prefix}{f.name}  ({size_str}){git_hint}")
             count[0] += 1
 
-    _walk(target, "", 1)
+    _walk(str(target), "", 1)
 
     if count[0] == 0:
         lines.append("(empty directory)")
@@ -659,6 +780,35 @@ def explore_directory(path: str = ".", depth: int = 1, max_items: int = 100) ->
     return "\n".join(lines)
 
 
+# Structure lines for get_file_summary, matched per line from its start. Each
+# pattern has one group per kind, so match.lastindex tells which kind matched.
+# Definitions must be followed by "(" or ":" so docstring prose ("class instances
+# are ...") is not taken for one; anonymous async function expressions are skipped.
+_PY_STRUCTURE_RE = re.compile(
+    r"[ \t]*(?:((?:import|from)[ \t]+\S.*)"
+    r"|class[ \t]+([A-Za-z_]\w*)[ \t]*[(:]"
+    r"|def[ \t]+([A-Za-z_]\w*)[ \t]*\()"
+)
+_JS_STRUCTURE_RE = re.compile(
+    r"[ \t]*(?:(import |const .*require\()|(export )|(function |.*async function[ \t]+\w))"
+)
+
+# Files above this size are summarized from a streamed UTF-8 read, so only the
+# preview is held in memory; smaller ones use safe_read_text (encoding detection, cache)
+SUMMARY_STREAM_MIN_BYTES = 1024 * 1024
+
+
+def _iter_file_lines(path: Path) -> Iterator[str]:
+    """Yields the lines of a file without their newline, matching str.split("\\n")."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        ends_with_newline = True
+        for line in f:
+            ends_with_newline = line.endswith("\n")
+            yield line[:-1] if ends_with_newline else line
+    if ends_with_newline:
+        yield ""
+
+
 @mcp.tool()
 def get_file_summary(path: str, max_lines: int = 50) -> str:
     """
@@ -701,9 +851,10 @@ def get_file_summary(path: str, max_lines: int = 50) -> str:
     result.append(f"**Extension**: `{target.suffix}`")
 
     git_repo = _get_git_repo_safe()
+    file_commits: list[CommitInfo] = []
     if git_repo:
         try:
-            rel_path = str(target.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
+            rel_path = _rel_posix(target)
             file_commits = git_repo.get_file_commits(rel_path, max_count=5)
             if file_commits:
                 result.append(
@@ -717,29 +868,53 @@ def get_file_summary(path: str, max_lines: int = 50) -> str:
         result.append("\n(binary file — no preview)")
         return "\n".join(result)
 
+    ext = target.suffix.lower()
+    is_python = ext == ".py"
+    is_script = ext in (".js", ".ts", ".jsx", ".tsx")
+    imports: list[str] = []
+    classes: list[str] = []
+    exports: list[str] = []
+    functions: list[str] = []
+    preview_lines: list[str] = []
+    line_count = 0
+
+    # One pass over the lines keeps only the preview and the extracted structure
     try:
-        content = config.safe_read_text(target)
+        if size_kb * 1024 > SUMMARY_STREAM_MIN_BYTES:
+            lines: Iterable[str] = _iter_file_lines(target)
+        else:
+            lines = config.safe_read_text(target).split("\n")
+        for line in lines:
+            line_count += 1
+            if len(preview_lines) < max_lines:
+                preview_lines.append(line)
+            if is_python:
+                match = _PY_STRUCTURE_RE.match(line)
+                if match is None:
+                    continue
+                if match.lastindex == 1:
+                    imports.append(match[1].rstrip())
+                elif match.lastindex == 2:
+                    classes.append(match[2])
+                else:
+                    functions.append(match[3])
+            elif is_script:
+                match = _JS_STRUCTURE_RE.match(line)
+                if match is None:
+                    continue
+                if match.lastindex == 1:
+                    imports.append(line.strip()[:100])
+                elif match.lastindex == 2:
+                    exports.append(line.strip()[:100])
+                else:
+                    functions.append(line.strip()[:80])
     except (UnicodeDecodeError, OSError) as e:
         result.append(f"\n(cannot read: {e})")
         return "\n".join(result)
 
-    lines = content.split("\n")
-    result.append(f"**Lines**: {len(lines)}")
-
-    ext = target.suffix.lower()
-    if ext == ".py":
-        imports = []
-        classes = []
-        functions = []
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith(("import ", "from ")):
-                imports.append(stripped)
-            elif stripped.startswith("class ") and ":" in stripped:
-                classes.append(stripped.split("(")[0].split(":")[0].replace("class ", "").strip())
-            elif stripped.startswith("def ") and ":" in stripped:
-                functions.append(stripped.split("(")[0].replace("def ", "").strip())
+    result.append(f"**Lines**: {line_count}")
 
+    if is_python:
         if imports:
             result.append(f"\n**Imports** ({len(imports)}):")
             for imp in imports[:15]:
@@ -755,25 +930,7 @@ def get_file_summary(path: str, max_lines: int = 50) -> str:
             if len(functions) > 20:
                 result.append(f"  - ... ({len(functions) - 20} more)")
 
-    elif ext in (".js", ".ts", ".jsx", ".tsx"):
-        imports = []
-        exports = []
-        functions = []
-        for line in lines:
-            stripped = line.strip()
-            if (
-                stripped.startswith("import ")
-                or stripped.startswith("const ")
-                and "require(" in stripped
-            ):
-                imports.append(stripped[:100])
-            elif stripped.startswith("export "):
-                exports.append(stripped[:100])
-            elif "function " in stripped and (
-                "function " == stripped[:9] or "async function" in stripped
-            ):
-                functions.append(stripped[:80])
-
+    elif is_script:
         if imports:
             result.append(f"\n**Imports** ({len(imports)}):")
             for imp in imports[:10]:
@@ -783,16 +940,10 @@ def get_file_summary(path: str, max_lines: int = 50) -> str:
             for exp in exports[:10]:
                 result.append(f"  - `{exp}`")
 
-    if git_repo:
-        try:
-            rel_path = str(target.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
-            file_commits = git_repo.get_file_commits(rel_path, max_count=5)
-            if file_commits:
-                result.append("\n## Git History")
-                for c in file_commits:
-                    result.append(f"- {c.date_str} [{c.short_hash}] {c.first_line} ({c.author})")
-        except Exception:
-            pass
+    if file_commits:
+        result.append("\n## Git History")
+        for c in file_commits:
+            result.append(f"- {c.date_str} [{c.short_hash}] {c.first_line} ({c.author})")
 
     memory_mentions = _search_memory_for(target.name)
     if memory_mentions:
@@ -801,13 +952,12 @@ def get_file_summary(path: str, max_lines: int = 50) -> str:
             result.append(f"- {mention}")
 
     if max_lines > 0:
-        preview_lines = lines[:max_lines]
-        result.append(f"\n## Preview (first {min(max_lines, len(lines))} lines)")
+        result.append(f"\n## Preview (first {len(preview_lines)} lines)")
         result.append("```" + ext.lstrip("."))
         result.append("\n".join(preview_lines))
         result.append("```")
-        if len(lines) > max_lines:
-            result.append(f"\n... ({len(lines) - max_lines} more lines)")
+        if line_count > max_lines:
+            result.append(f"\n... ({line_count - max_lines} more lines)")
 
     return "\n".join(result)
 
@@ -857,7 +1007,7 @@ def get_file_relations(path: str) -> str:
     try:
         from code_intelligence import get_file_relations as _get_relations
 
-        rel_path = str(target.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
+        rel_path = _rel_posix(target)
         return _get_relations(rel_path, config.PROJECT_ROOT)
     except Exception as e:
         return f"Error analyzing relations: {e}"
@@ -929,7 +1079,7 @@ def analyze_change_impact(path: str) -> str:
     try:
         from code_intelligence import analyze_change_impact as _analyze_impact
 
-        rel_path = str(target.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
+        rel_path = _rel_posix(target)
         return _analyze_impact(rel_path, config.PROJECT_ROOT)
     except Exception as e:
         return f"Error analyzing impact: {e}"
@@ -970,7 +1120,7 @@ def get_dependencies_with_depth(
         from code_intelligence import build_import_graph
         from code_intelligence import get_dependencies_with_depth as _get_deps
 
-        rel_path = str(target.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
+        rel_path = _rel_posix(target)
         graph = build_import_graph(config.PROJECT_ROOT)
 
         if rel_path not in graph and direction == "downstream":
@@ -1039,8 +1189,8 @@ def find_dependency_path(from_file: str, to_file: str, max_depth: int = 10) -> s
         from code_intelligence import build_import_graph
         from code_intelligence import find_dependency_path as _find_path
 
-        source_rel = str(source.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
-        target_rel = str(target.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
+        source_rel = _rel_posix(source)
+        target_rel = _rel_posix(target)
 
         graph = build_import_graph(config.PROJECT_ROOT)
         path = _find_path(source_rel, target_rel, graph, max_depth)
@@ -1104,7 +1254,7 @@ def get_module_cluster(
     try:
         from code_intelligence import get_module_cluster as _get_cluster
 
-        rel_path = str(target.relative_to(config.PROJECT_ROOT)).replace("\\", "/")
+        rel_path = _rel_posix(target)
         cluster = _get_cluster(
             rel_path, config.PROJECT_ROOT, similarity_threshold, max_cluster_size
         )
@@ -1559,7 +1709,7 @@ def project_onboarding() -> str:
     """
     ensure_startup()
     try:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import as_completed
 
         results: dict[str, str] = {}
 
@@ -1751,8 +1901,79 @@ def index_codebase(force: bool = False) -> str:
     return warning + result
 
 
+MAX_BATCH_QUERIES = 10
+
+
+def _collect_queries(query: str, queries: list[str] | None) -> list[str]:
+    """Returns the primary query followed by any distinct, non-blank extra queries."""
+    collected = [query]
+    for extra in queries or []:
+        if extra and extra.strip() and extra not in collected:
+            collected.append(extra)
+    return collected
+
+
+def _format_codebase_search(query: str, results: dict[str, Any], total_count: int | None) -> str:
+    """Renders a single hybrid search result set for search_codebase."""
+    if not results.get("documents") or not results["documents"][0]:
+        return f"# SEARCH: {query}\n\nNo matches found."
+
+    # Extract files and calculate coverage
+    files = set()
+    for meta in results.get("metadatas", [[]])[0]:
+        if "source" in meta:
+            files.add(meta["source"])
+
+    # Check index coverage
+    coverage = "full" if total_count and total_count > 100 else "partial"
+
+    # Calculate average relevance (distance)
+    import numpy as np
+
+    distances = np.asarray(results.get("distances", [[]])[0], dtype=np.float64)
+    avg_distance = float(distances.mean()) if distances.size else 0.0
+    confidence = max(0.0, min(1.0, 1.0 - avg_distance))  # Convert distance to confidence
+    relevance_scores = np.maximum(0, ((1 - distances) * 100).astype(np.int64)).tolist()
+
+    # Build output with metadata
+    output = [f"# SEARCH: {query}\n"]
+    output.append(f"**Results**: {len(results['documents'][0])}")
+    output.append(f"**Confidence**: {int(confidence * 100)}%")
+    output.append(f"**Coverage**: {coverage}")
+    output.append(f"**Files**: {len(files)}\n")
+
+    # Add results
+    for i in range(len(results["documents"][0])):
+        doc = results["documents"][0][i]
+        meta = results["metadatas"][0][i]
+        file_path = meta.get("source", "")
+
+        relevance_score = relevance_scores[i] if i < len(relevance_scores) else 0
+
+        output.append(f"## Result {i + 1} ({relevance_score}% relevant)")
+        if file_path:
+            output.append(f"**File**: `{file_path}`")
+        output.append(f"```\n{doc}\n```\n")
+
+    # Add suggestions based on results
+    suggestions = []
+    if confidence < 0.5:
+        suggestions.append("Low confidence - consider refining your query")
+    if len(files) < 3:
+        suggestions.append("Few files matched - try broader search terms")
+    if coverage == "partial":
+        suggestions.append("Partial index coverage - run index_codebase() for complete results")
+
+    if suggestions:
+        output.append("## Suggestions")
+        for s in suggestions:
+            output.append(f"- {s}")
+
+    return "\n".join(output)
+
+
 @mcp.tool()
-def search_codebase(query: str, n_results: int = 5) -> str:
+def search_codebase(query: str, n_results: int = 5, queries: list[str] | None = None) -> str:
     if not query or not query.strip():
         return "Error: Query cannot be empty."
 
@@ -1762,105 +1983,60 @@ def search_codebase(query: str, n_results: int = 5) -> str:
     if n_results > 50:
         return "Error: n_results cannot exceed 50."
 
+    all_queries = _collect_queries(query, queries)
+    if len(all_queries) > MAX_BATCH_QUERIES:
+        return f"Error: Cannot search more than {MAX_BATCH_QUERIES} queries at once."
+
     err = _check_index_ready()
     if err:
         return err
 
     try:
         ctx = get_context()
-        results = ctx.vector_store.hybrid_query(query_texts=[query], n_results=n_results)
+        if len(all_queries) == 1:
+            results = ctx.vector_store.hybrid_query(query_texts=[query], n_results=n_results)
 
-        if results is None:
-            return "Vector store not initialized."
+            if results is None:
+                return "Vector store not initialized."
 
-        if not results.get("documents") or not results["documents"][0]:
-            return "No matches found."
+            if not results.get("documents") or not results["documents"][0]:
+                return "No matches found."
 
-        # Extract files and calculate coverage
-        files = set()
-        for meta in results.get("metadatas", [[]])[0]:
-            if "source" in meta:
-                files.add(meta["source"])
+            return _format_codebase_search(query, results, ctx.vector_store.get_count())
+
+        batch = ctx.vector_store.hybrid_query_many(all_queries, n_results=n_results)
+        if all(results is None for results in batch):
+            return "Vector store not initialized."
 
-        # Check index coverage
         total_count = ctx.vector_store.get_count()
-        coverage = "full" if total_count and total_count > 100 else "partial"
-
-        # Calculate average relevance (distance)
-        distances = results.get("distances", [[]])[0]
-        avg_distance = sum(distances) / len(distances) if distances else 0
-        confidence = max(0.0, min(1.0, 1.0 - avg_distance))  # Convert distance to confidence
-
-        # Build output with metadata
-        output = [f"# SEARCH: {query}\n"]
-        output.append(f"**Results**: {len(results['documents'][0])}")
-        output.append(f"**Confidence**: {int(confidence * 100)}%")
-        output.append(f"**Coverage**: {coverage}")
-        output.append(f"**Files**: {len(files)}\n")
-
-        # Add results
-        for i in range(len(results["documents"][0])):
-            doc = results["documents"][0][i]
-            meta = results["metadatas"][0][i]
-            file_path = meta.get("source", "")
-
-            relevance_score = 0
-            if distances and i < len(distances):
-                relevance_score = max(0, int((1 - distances[i]) * 100))
-
-            output.append(f"## Result {i + 1} ({relevance_score}% relevant)")
-            if file_path:
-                output.append(f"**File**: `{file_path}`")
-            output.append(f"```\n{doc}\n```\n")
-
-        # Add suggestions based on results
-        suggestions = []
-        if confidence < 0.5:
-            suggestions.append("Low confidence - consider refining your query")
-        if len(files) < 3:
-            suggestions.append("Few files matched - try broader search terms")
-        if coverage == "partial":
-            suggestions.append("Partial index coverage - run index_codebase() for complete results")
-
-        if suggestions:
-            output.append("## Suggestions")
-            for s in suggestions:
-                output.append(f"- {s}")
-
-        return "\n".join(output)
+        sections = []
+        for text, results in zip(all_queries, batch, strict=True):
+            if results is None:
+                sections.append(f"# SEARCH: {text}\n\nVector store not initialized.")
+            else:
+                sections.append(_format_codebase_search(text, results, total_count))
+        return "\n\n".join(sections)
     except Exception as e:
         log(f"Search error: {e}")
         return f"Error during search: {e}"
 
 
-@mcp.tool()
-def ingest_git_history(limit: int = 30) -> str:
-    if limit <= 0:
-        return "Error: Limit must be greater than 0."
+_HASH_RE = re.compile(r"\[([0-9a-f]{7,40})\]")
 
-    if limit > 1000:
-        return "Error: Limit cannot exceed 1000."
-
-    try:
-        git_repo = GitRepository()
-        commits = git_repo.get_commits(max_count=limit)
-    except GitError as e:
-        return str(e)
 
+def _ingest_commits(commits: Iterable[CommitInfo]) -> str:
+    """Appends commits not yet mentioned in memory to the Development Log section."""
     ctx = get_context()
     current_memory = ctx.memory_manager.read(max_lines=None)
     if current_memory == "Memory file not found.":
         return "Memory file not found."
 
     try:
-        header = "## Development Log (Git)"
-        if header not in current_memory:
-            ctx.memory_manager.update("", section="Development Log (Git)")
-            current_memory = ctx.memory_manager.read(max_lines=None)
+        existing_hashes = {match[:7] for match in _HASH_RE.findall(current_memory)}
 
         new_entries = []
         for commit in commits:
-            if commit.short_hash in current_memory:
+            if commit.short_hash in existing_hashes:
                 continue
 
             message = commit.message.replace("\n", " ")
@@ -1880,6 +2056,22 @@ def ingest_git_history(limit: int = 30) -> str:
         return f"Error ingesting git history: {e}"
 
 
+@mcp.tool()
+def ingest_git_history(limit: int = 30) -> str:
+    if limit <= 0:
+        return "Error: Limit must be greater than 0."
+
+    if limit > 1000:
+        return "Error: Limit cannot exceed 1000."
+
+    try:
+        commits = _shared_git_repo().iter_commits(max_count=limit)
+    except GitError as e:
+        return str(e)
+
+    return _ingest_commits(commits)
+
+
 @mcp.tool()
 def get_index_stats() -> str:
     """
@@ -1911,14 +2103,20 @@ def generate_project_summary() -> str:
         memory = read_memory()
         if memory and "Memory file not found" not in memory:
             summary_parts.append("## Current Memory State")
-            lines = memory.split("\n")[:30]
-            summary_parts.append("\n".join(lines))
-            if len(memory.split("\n")) > 30:
+            # Locate the end of line 30 without splitting the whole memory file
+            head_end = -1
+            for _ in range(30):
+                head_end = memory.find("\n", head_end + 1)
+                if head_end < 0:
+                    break
+            if head_end < 0:
+                summary_parts.append(memory)
+            else:
+                summary_parts.append(memory[:head_end])
                 summary_parts.append("\n... (truncated, see full memory)\n")
 
         try:
-            git_repo = GitRepository()
-            commits = git_repo.get_commits(max_count=5)
+            commits = _shared_git_repo().get_commits(max_count=5)
             if commits:
                 summary_parts.append("\n## Recent Activity (Last 5 Commits)")
                 for commit in commits:
@@ -1926,17 +2124,9 @@ def generate_project_summary() -> str:
         except GitError:
             pass
 
-        root = config.PROJECT_ROOT
-        py_files = 0
-        js_files = 0
-
-        for _root_path, dirs, files in os.walk(root):
-            dirs[:] = [d for d in dirs if not is_dir_ignored(d)]
-            for file in files:
-                if file.endswith(".py"):
-                    py_files += 1
-                elif file.endswith((".js", ".ts")):
-                    js_files += 1
+        ext_histogram = _get_tree_scan()["ext_histogram"]
+        py_files = ext_histogram.get(".py", 0)
+        js_files = ext_histogram.get(".js", 0) + ext_histogram.get(".ts", 0)
 
         summary_parts.append("\n## Codebase Stats")
         summary_parts.append(f"- Python files: {py_files}")
@@ -1950,6 +2140,44 @@ def generate_project_summary() -> str:
         return f"Error generating summary: {e}"
 
 
+def _pyproject_dependencies(pyproject_path: Path) -> list[str]:
+    """
+    Lists dependencies declared in pyproject.toml.
+
+    Reads PEP 621 `[project].dependencies`, falling back to
+    `[tool.poetry.dependencies]`. On Python 3.10 (no tomllib) or a malformed
+    file, scans the `dependencies = [` block line by line instead.
+    """
+    try:
+        import tomllib
+
+        with open(pyproject_path, "rb") as f:
+            data = tomllib.load(f)
+    except (ImportError, ValueError):
+        deps = []
+        in_deps = False
+        for line in pyproject_path.read_text(encoding="utf-8", errors="ignore").split("\n"):
+            if "dependencies = [" in line:
+                in_deps = True
+                continue
+            if in_deps:
+                if "]" in line:
+                    break
+                if '"' in line:
+                    deps.append(line.strip().rstrip(",").strip('"'))
+        return deps
+
+    project_deps = data.get("project", {}).get("dependencies", [])
+    if project_deps:
+        return [str(dep) for dep in project_deps]
+
+    poetry_deps = data.get("tool", {}).get("poetry", {}).get("dependencies", {})
+    return [
+        f"{name}: {spec}" if isinstance(spec, str) else str(name)
+        for name, spec in poetry_deps.items()
+    ]
+
+
 @mcp.tool()
 def extract_tech_stack() -> str:
     try:
@@ -1957,37 +2185,28 @@ def extract_tech_stack() -> str:
 
         pyproject_path = config.PROJECT_ROOT / "pyproject.toml"
         if pyproject_path.exists():
-            content = pyproject_path.read_text()
             tech_stack.append("## Python Project")
-            if "dependencies" in content:
+            deps = _pyproject_dependencies(pyproject_path)
+            if deps:
                 tech_stack.append("\n**Dependencies:**")
-                lines = content.split("\n")
-                in_deps = False
-                for line in lines:
-                    if "dependencies = [" in line:
-                        in_deps = True
-                        continue
-                    if in_deps:
-                        if "]" in line:
-                            break
-                        if '"' in line:
-                            tech_stack.append(f"- {line.strip()}")
+                tech_stack.extend(f"- {dep}" for dep in deps)
 
         requirements_path = config.PROJECT_ROOT / "requirements.txt"
         if not tech_stack and requirements_path.exists():
-            content = requirements_path.read_text()
+            content = requirements_path.read_text(encoding="utf-8", errors="ignore")
             tech_stack.append("## Python Project")
             tech_stack.append("\n**Dependencies:**")
-            for line in content.split("\n"):
-                if line.strip() and not line.startswith("#"):
-                    tech_stack.append(f"- {line.strip()}")
+            for line in content.splitlines():
+                requirement = line.strip()
+                if requirement and not requirement.startswith("#"):
+                    tech_stack.append(f"- {requirement}")
 
         package_json_path = config.PROJECT_ROOT / "package.json"
         if package_json_path.exists():
             import json
 
-            with open(package_json_path) as f:
-                data = json.load(f)
+            # json detects UTF-8/16/32 from bytes itself; skips the text-mode reader
+            data = json.loads(package_json_path.read_bytes())
             tech_stack.append("\n## JavaScript/Node.js Project")
             if "dependencies" in data:
                 tech_stack.append("\n**Dependencies:**")
@@ -2012,84 +2231,205 @@ def extract_tech_stack() -> str:
         return f"Error extracting tech stack: {e}"
 
 
-_structure_cache: str | None = None
-_structure_cache_time: float = 0.0
-_structure_cache_lock = threading.Lock()
+# Readers take the fast path without locking: each cache is replaced by a single
+# assignment of an immutable snapshot, which is atomic under the GIL. The lock only
+# serializes rebuilds; it is re-entrant because the structure rebuild reads the tree scan.
+# (project root, rendered report, stored_at of the tree scan it was rendered from)
+_structure_snapshot: tuple[Path, str, float] | None = None
+_structure_cache_lock = threading.RLock()
 STRUCTURE_CACHE_TTL = 300
+STRUCTURE_CONFIG_FILES = (
+    "pyproject.toml",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    ".gitignore",
+    "docker-compose.yml",
+    "Dockerfile",
+    ".env.example",
+)
+STRUCTURE_FILE_TYPES = frozenset(
+    {".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".rs", ".java", ".c", ".cpp"}
+)
+
+_tree_scan_cache: dict[str, Any] = {}
+# Set while a background rescan of an expired tree scan is running (see _get_tree_scan)
+_tree_scan_refreshing = threading.Event()
+
+
+def _tree_scan_fresh(cached: dict[str, Any], root: Path, mtime_root: int, now: float) -> bool:
+    return bool(
+        cached
+        and cached["root"] == root
+        and cached["mtime_root"] == mtime_root
+        and (now - cached["time"]) < STRUCTURE_CACHE_TTL
+    )
+
+
+def _scan_tree(root: Path) -> dict[str, Any]:
+    """
+    Walks the project once, collecting the file statistics shared by the overview tools.
+
+    Returns:
+        Dict with per_dir_counts (files per top-level directory), ext_histogram
+        (file suffix -> count), total_files and root_names (entry names at the root)
+    """
+    per_dir_counts: dict[str, int] = {}
+    ext_histogram: dict[str, int] = {}
+    total_files = 0
+
+    def count(entry: os.DirEntry[str]) -> None:
+        ext = os.path.splitext(entry.name)[1]
+        ext_histogram[ext] = ext_histogram.get(ext, 0) + 1
+
+    with os.scandir(root) as entries:
+        top_level = list(entries)
+
+    for entry in top_level:
+        if entry.is_dir():
+            if entry.is_symlink() or is_dir_ignored(entry.name):
+                continue
+            dir_files = 0
+            for file_entry in iter_project_files(Path(entry.path)):
+                count(file_entry)
+                dir_files += 1
+            per_dir_counts[entry.name] = dir_files
+            total_files += dir_files
+        else:
+            count(entry)
+            total_files += 1
+
+    return {
+        "per_dir_counts": per_dir_counts,
+        "ext_histogram": ext_histogram,
+        "total_files": total_files,
+        "root_names": frozenset(entry.name for entry in top_level),
+    }
+
+
+def _get_tree_scan() -> dict[str, Any]:
+    """
+    Returns the cached project tree scan, rescanning when the project root changed
+    or its mtime moved. Once STRUCTURE_CACHE_TTL has elapsed the cached scan is
+    still served while a background thread rescans, so only the first call walks
+    the tree.
+    """
+    global _tree_scan_cache
+
+    root = config.PROJECT_ROOT
+    try:
+        mtime_root = root.stat().st_mtime_ns
+    except OSError:
+        mtime_root = 0
+    current_time = time()
+
+    cached = _tree_scan_cache
+    if _tree_scan_fresh(cached, root, mtime_root, current_time):
+        return cached
+    if cached and cached["root"] == root and cached["mtime_root"] == mtime_root:
+        _refresh_tree_scan_in_background(root, mtime_root)
+        return cached
+
+    with _structure_cache_lock:
+        # Another caller may have rebuilt while we waited for the lock
+        cached = _tree_scan_cache
+        if _tree_scan_fresh(cached, root, mtime_root, current_time):
+            return cached
+
+        scan = _scan_tree(root)
+        scan.update(root=root, mtime_root=mtime_root, time=current_time)
+        _tree_scan_cache = scan
+        return scan
+
+
+def _refresh_tree_scan_in_background(root: Path, mtime_root: int) -> None:
+    """Starts one daemon rescan of an expired tree scan unless one is already running."""
+    with _structure_cache_lock:
+        if _tree_scan_refreshing.is_set():
+            return
+        _tree_scan_refreshing.set()
+
+    def _refresh() -> None:
+        global _tree_scan_cache
+        try:
+            scan = _scan_tree(root)
+            scan.update(root=root, mtime_root=mtime_root, time=time())
+            with _structure_cache_lock:
+                # Don't clobber a scan of another root or a newer root listing
+                cached = _tree_scan_cache
+                if cached and cached["root"] == root and cached["mtime_root"] == mtime_root:
+                    _tree_scan_cache = scan
+        except Exception as e:
+            log(f"Background tree scan failed: {e}")
+        finally:
+            _tree_scan_refreshing.clear()
+
+    threading.Thread(target=_refresh, name="projectmind-tree-scan", daemon=True).start()
 
 
 @mcp.tool()
 def analyze_project_structure() -> str:
-    global _structure_cache, _structure_cache_time
+    global _structure_snapshot
 
+    root = config.PROJECT_ROOT
     current_time = time()
 
+    snap = _structure_snapshot
+    if _structure_snapshot_fresh(snap, root, current_time):
+        return snap[1]
+
     with _structure_cache_lock:
-        if _structure_cache and (current_time - _structure_cache_time) < STRUCTURE_CACHE_TTL:
-            return _structure_cache
+        snap = _structure_snapshot
+        if _structure_snapshot_fresh(snap, root, current_time):
+            return snap[1]
+        return _build_project_structure(root)
 
-    try:
-        root = config.PROJECT_ROOT
 
+def _structure_snapshot_fresh(
+    snap: tuple[Path, str, float] | None, root: Path, now: float
+) -> TypeGuard[tuple[Path, str, float]]:
+    """
+    A snapshot is only as fresh as the tree scan it was rendered from: it is keyed on
+    that scan's stored_at, so it goes with the scan, and an expired scan served while
+    it is rescanned in the background never yields a snapshot that outlives it.
+    """
+    return (
+        snap is not None
+        and snap[0] == root
+        and snap[2] == _tree_scan_cache.get("time")
+        and (now - snap[2]) < STRUCTURE_CACHE_TTL
+    )
+
+
+def _build_project_structure(root: Path) -> str:
+    """Renders the structure report and publishes it as the new snapshot."""
+    global _structure_snapshot
+
+    try:
         structure = []
         structure.append("# PROJECT STRUCTURE\n")
 
-        dirs_by_depth = {}
-        for item in root.iterdir():
-            if item.is_dir() and not is_dir_ignored(item.name):
-                try:
-                    count = 0
-                    for _r, _d, _f in os.walk(item):
-                        _d[:] = [d for d in _d if not is_dir_ignored(d)]
-                        count += len(_f)
-                    dirs_by_depth[item.name] = count
-                except (PermissionError, OSError):
-                    continue
+        scan = _get_tree_scan()
 
-        sorted_dirs = sorted(dirs_by_depth.items(), key=lambda x: x[1], reverse=True)[:10]
+        sorted_dirs = heapq.nlargest(10, scan["per_dir_counts"].items(), key=operator.itemgetter(1))
 
         structure.append("## Main Directories (by size)")
         for dir_name, count in sorted_dirs:
             structure.append(f"- `{dir_name}/` ({count} items)")
 
-        file_types: dict[str, int] = {}
-        for _root_path, dirs, files in os.walk(root):
-            dirs[:] = [d for d in dirs if not is_dir_ignored(d)]
-
-            for file in files:
-                ext = Path(file).suffix
-                if ext in [
-                    ".py",
-                    ".js",
-                    ".ts",
-                    ".jsx",
-                    ".tsx",
-                    ".go",
-                    ".rs",
-                    ".java",
-                    ".c",
-                    ".cpp",
-                ]:
-                    file_types[ext] = file_types.get(ext, 0) + 1
+        file_types = {
+            ext: count
+            for ext, count in scan["ext_histogram"].items()
+            if ext in STRUCTURE_FILE_TYPES
+        }
 
         if file_types:
             structure.append("\n## File Types")
             for ext, count in sorted(file_types.items(), key=lambda x: x[1], reverse=True):
                 structure.append(f"- `{ext}`: {count} files")
 
-        config_files = []
-        for cfg in [
-            "pyproject.toml",
-            "package.json",
-            "Cargo.toml",
-            "go.mod",
-            ".gitignore",
-            "docker-compose.yml",
-            "Dockerfile",
-            ".env.example",
-        ]:
-            if (root / cfg).exists():
-                config_files.append(cfg)
+        # Presence comes from the root listing already in the scan, not a stat per name
+        config_files = [cfg for cfg in STRUCTURE_CONFIG_FILES if cfg in scan["root_names"]]
 
         if config_files:
             structure.append("\n## Configuration Files")
@@ -2097,11 +2437,7 @@ def analyze_project_structure() -> str:
                 structure.append(f"- {cfg}")
 
         result = "\n".join(structure)
-
-        with _structure_cache_lock:
-            _structure_cache = result
-            _structure_cache_time = current_time
-
+        _structure_snapshot = (root, result, scan["time"])
         return result
     except Exception as e:
         return f"Error analyzing structure: {e}"
@@ -2113,7 +2449,7 @@ def get_recent_changes_summary(days: int = 7) -> str:
         return "Error: days must be between 1 and 365"
 
     try:
-        git_repo = GitRepository()
+        git_repo = _shared_git_repo()
         commits = git_repo.get_commits(max_count=100, since_days=days)
     except GitError as e:
         return str(e)
@@ -2165,8 +2501,8 @@ def index_changed_files() -> str:
 def should_include_search_result(
     source: str,
     relevance: float,
-    file_types: list[str] | None,
-    exclude_dirs: list[str] | None,
+    file_types: Collection[str] | None,
+    exclude_dirs: Collection[str] | None,
     min_relevance: float,
 ) -> bool:
     """
@@ -2182,21 +2518,58 @@ def should_include_search_result(
     Returns:
         True if result passes all filters
     """
-    if min_relevance > 0 and relevance < min_relevance:
-        return False
+    return make_search_result_filter(file_types, exclude_dirs, min_relevance)(source, relevance)
 
-    if file_types:
-        file_ext = Path(source).suffix
-        if file_ext not in file_types:
-            return False
 
-    if exclude_dirs:
-        source_parts = Path(source).parts
-        for exc_dir in exclude_dirs:
-            if exc_dir in source_parts:
-                return False
+def make_search_result_filter(
+    file_types: Collection[str] | None,
+    exclude_dirs: Collection[str] | None,
+    min_relevance: float,
+) -> Callable[[str, float], bool]:
+    """
+    Builds a (source, relevance) predicate with the active filters bound in.
 
-    return True
+    Only the checks that are switched on end up in the returned function, so the
+    per-result cost doesn't include re-testing which filters apply.
+
+    Args:
+        file_types: Allowed file extensions (None = all)
+        exclude_dirs: Directories to exclude (None = none)
+        min_relevance: Minimum relevance threshold
+
+    Returns:
+        Predicate equivalent to should_include_search_result for these filters
+    """
+    type_set = frozenset(file_types or ())
+    exclude_set = frozenset(exclude_dirs or ())
+
+    def type_and_dir_ok(source: str) -> bool:
+        path = Path(source)
+        return path.suffix in type_set and exclude_set.isdisjoint(path.parts)
+
+    def type_ok(source: str) -> bool:
+        return Path(source).suffix in type_set
+
+    def dir_ok(source: str) -> bool:
+        return exclude_set.isdisjoint(Path(source).parts)
+
+    path_ok: Callable[[str], bool] | None = None
+    if type_set and exclude_set:
+        path_ok = type_and_dir_ok
+    elif type_set:
+        path_ok = type_ok
+    elif exclude_set:
+        path_ok = dir_ok
+
+    if path_ok is None:
+        if min_relevance > 0:
+            return lambda source, relevance: relevance >= min_relevance
+        return lambda source, relevance: True
+
+    check = path_ok
+    if min_relevance > 0:
+        return lambda source, relevance: relevance >= min_relevance and check(source)
+    return lambda source, relevance: check(source)
 
 
 def format_search_result(source: str, document: str, relevance: float) -> str:
@@ -2214,6 +2587,47 @@ def format_search_result(source: str, document: str, relevance: float) -> str:
     return f"--- {source} (relevance: {relevance:.2f}) ---\n{document}\n"
 
 
+def _filter_advanced_results(
+    results: dict[str, Any],
+    n_results: int,
+    file_types: list[str] | None,
+    exclude_dirs: list[str] | None,
+    min_relevance: float,
+) -> list[str]:
+    """Applies search_codebase_advanced filters and returns formatted results."""
+    output: list[str] = []
+    if not results["documents"]:
+        return output
+
+    import numpy as np
+
+    documents = results["documents"][0]
+    metadatas = results["metadatas"][0]
+    if "distances" in results:
+        distances = np.asarray(results["distances"][0], dtype=np.float64)
+    else:
+        distances = np.zeros(len(documents))
+
+    # Score and apply the relevance threshold to the whole result set in one pass;
+    # only the survivors go through the per-path filters below.
+    path_filter = make_search_result_filter(file_types, exclude_dirs, 0.0)
+    relevances = np.maximum(0.0, 1.0 - distances / 2.0)
+    candidates = (
+        np.flatnonzero(relevances >= min_relevance) if min_relevance > 0 else range(len(documents))
+    )
+
+    for i in candidates:
+        source = metadatas[i].get("source", "unknown")
+        relevance = float(relevances[i])
+
+        if path_filter(source, relevance):
+            output.append(format_search_result(source, documents[i], relevance))
+
+        if len(output) >= n_results:
+            break
+    return output
+
+
 @mcp.tool()
 def search_codebase_advanced(
     query: str,
@@ -2221,6 +2635,7 @@ def search_codebase_advanced(
     file_types: list[str] | None = None,
     exclude_dirs: list[str] | None = None,
     min_relevance: float = 0.0,
+    queries: list[str] | None = None,
 ) -> str:
     if not query or not query.strip():
         return "Error: Query cannot be empty."
@@ -2234,36 +2649,43 @@ def search_codebase_advanced(
     if min_relevance < 0 or min_relevance > 1:
         return "Error: min_relevance must be between 0 and 1."
 
+    all_queries = _collect_queries(query, queries)
+    if len(all_queries) > MAX_BATCH_QUERIES:
+        return f"Error: Cannot search more than {MAX_BATCH_QUERIES} queries at once."
+
     err = _check_index_ready()
     if err:
         return err
 
     try:
         ctx = get_context()
-        results = ctx.vector_store.hybrid_query(query_texts=[query], n_results=n_results * 2)
+        if len(all_queries) == 1:
+            results = ctx.vector_store.hybrid_query(query_texts=[query], n_results=n_results * 2)
 
-        if results is None:
-            return "Vector store not initialized."
-
-        output = []
-        if results["documents"]:
-            for i in range(len(results["documents"][0])):
-                doc = results["documents"][0][i]
-                meta = results["metadatas"][0][i]
-                source = meta.get("source", "unknown")
-                distance = results.get("distances", [[]])[0][i] if "distances" in results else 0
-
-                relevance = max(0.0, 1.0 - (distance / 2.0))
+            if results is None:
+                return "Vector store not initialized."
 
-                if should_include_search_result(
-                    source, relevance, file_types, exclude_dirs, min_relevance
-                ):
-                    output.append(format_search_result(source, doc, relevance))
+            output = _filter_advanced_results(
+                results, n_results, file_types, exclude_dirs, min_relevance
+            )
+            return "\n".join(output) if output else "No matches found."
 
-                if len(output) >= n_results:
-                    break
+        batch = ctx.vector_store.hybrid_query_many(all_queries, n_results=n_results * 2)
+        if all(results is None for results in batch):
+            return "Vector store not initialized."
 
-        return "\n".join(output) if output else "No matches found."
+        sections = []
+        for text, results in zip(all_queries, batch, strict=True):
+            output = (
+                _filter_advanced_results(
+                    results, n_results, file_types, exclude_dirs, min_relevance
+                )
+                if results is not None
+                else []
+            )
+            body = "\n".join(output) if output else "No matches found."
+            sections.append(f"=== {text} ===\n{body}")
+        return "\n\n".join(sections)
     except Exception as e:
         log(f"Search error: {e}")
         return f"Error during search: {e}"
@@ -2275,7 +2697,7 @@ def auto_update_memory_from_commits(days: int = 7, auto_summarize: bool = True)
         return "Error: days must be between 1 and 90"
 
     try:
-        git_repo = GitRepository()
+        git_repo = _shared_git_repo()
         commits = git_repo.get_commits(max_count=100, since_days=days)
     except GitError as e:
         return str(e)
@@ -2301,13 +2723,69 @@ def auto_update_memory_from_commits(days: int = 7, auto_summarize: bool = True)
 
             return f"Auto-summarized {len(commits)} commits into memory"
         else:
-            ingested = ingest_git_history(limit=len(commits))
-            return f"Auto-update: {ingested}"
+            # Reuse the commits already fetched instead of re-running git log
+            return f"Auto-update: {_ingest_commits(commits)}"
 
     except Exception as e:
         return f"Error: {e}"
 
 
+COMPLEXITY_POOL_MIN_FILES = 8
+COMPLEXITY_MAX_WORKERS = 8
+# Files analyzed per call; the walk stops once this many supported files are found
+COMPLEXITY_MAX_FILES = 100
+
+
+# Worker pool for analyze_code_complexity, created on first use and reused across calls
+_complexity_pool: Any = None
+_complexity_pool_lock = threading.Lock()
+
+
+def _complexity_workers() -> int:
+    return min(os.cpu_count() or 1, COMPLEXITY_MAX_WORKERS)
+
+
+def _get_complexity_pool() -> Any:
+    """
+    Returns the shared complexity ProcessPoolExecutor, creating it on first use.
+
+    Workers are spawned rather than forked: a fork would copy locks held by the log
+    listener and the background startup and tree-scan threads. Their initializer keeps
+    worker logging off the server's log file.
+    """
+    global _complexity_pool
+    with _complexity_pool_lock:
+        if _complexity_pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            _complexity_pool = ProcessPoolExecutor(
+                max_workers=_complexity_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=setup_worker_logger,
+            )
+            atexit.register(_shutdown_complexity_pool)
+        return _complexity_pool
+
+
+def _discard_complexity_pool(pool: Any) -> None:
+    """Shuts down a failed pool so the next call starts a fresh one."""
+    global _complexity_pool
+    with _complexity_pool_lock:
+        if _complexity_pool is pool:
+            _complexity_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _shutdown_complexity_pool() -> None:
+    """Stops the shared pool's workers; registered to run at interpreter exit."""
+    global _complexity_pool
+    with _complexity_pool_lock:
+        pool, _complexity_pool = _complexity_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 @mcp.tool()
 def analyze_code_complexity(target_path: str = ".") -> str:
     try:
@@ -2315,7 +2793,7 @@ def analyze_code_complexity(target_path: str = ".") -> str:
         if not target.exists():
             return f"Path not found: {target_path}"
 
-        from code_intelligence import _LANGUAGE_MAP, compute_file_complexity_ast
+        from code_intelligence import _LANGUAGE_MAP, file_complexity
 
         results = ["# CODE COMPLEXITY ANALYSIS\n"]
         high_complexity: list[tuple[str, str, int]] = []
@@ -2324,48 +2802,45 @@ def analyze_code_complexity(target_path: str = ".") -> str:
         file_count = 0
         lang_counts: dict[str, int] = {}
 
-        supported_exts = set(_LANGUAGE_MAP.keys())
-        all_files = [
-            f
-            for f in target.rglob("*")
-            if f.is_file()
-            and f.suffix.lower() in supported_exts
-            and not any(is_dir_ignored(p) for p in f.relative_to(target).parts[:-1])
-        ]
-
-        if not all_files:
-            return "No supported files found (Python, JS, TS, Java, Go, Rust, Ruby)"
+        from itertools import islice
 
-        for src_file in all_files[:100]:
-            lang = _LANGUAGE_MAP.get(src_file.suffix.lower(), "unknown")
+        supported_exts = set(_LANGUAGE_MAP.keys())
+        paths = list(
+            islice(
+                (
+                    entry.path
+                    for entry in iter_project_files(target)
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in supported_exts
+                ),
+                COMPLEXITY_MAX_FILES,
+            )
+        )
 
-            if lang == "python":
-                try:
-                    from radon.complexity import cc_visit
-
-                    code = src_file.read_text(encoding="utf-8", errors="replace")
-                    cc_results = cc_visit(code)
-                    if cc_results:
-                        for item in cc_results:
-                            if item.complexity > 10:
-                                high_complexity.append((str(src_file), item.name, item.complexity))
-                            total_complexity += item.complexity
-                            total_functions += 1
-                        file_count += 1
-                        lang_counts[lang] = lang_counts.get(lang, 0) + 1
-                    continue
-                except (ImportError, Exception):
-                    pass
+        if not paths:
+            return "No supported files found (Python, JS, TS, Java, Go, Rust, Ruby)"
 
-            funcs = compute_file_complexity_ast(src_file)
-            if funcs:
-                for name, _line, complexity in funcs:
-                    if complexity > 10:
-                        high_complexity.append((str(src_file), name, complexity))
-                    total_complexity += complexity
-                    total_functions += 1
-                file_count += 1
-                lang_counts[lang] = lang_counts.get(lang, 0) + 1
+        per_file = None
+        if len(paths) >= COMPLEXITY_POOL_MIN_FILES and _complexity_workers() > 1:
+            # radon/tree-sitter parsing is CPU-bound and holds the GIL; fan out to processes
+            pool = _get_complexity_pool()
+            try:
+                per_file = list(pool.map(file_complexity, paths, chunksize=4))
+            except Exception as e:
+                log(f"Complexity worker pool failed, analyzing serially: {e}")
+                _discard_complexity_pool(pool)
+        if per_file is None:
+            per_file = [file_complexity(p) for p in paths]
+
+        for src_file, (lang, funcs) in zip(paths, per_file, strict=True):
+            if not funcs:
+                continue
+            for name, complexity in funcs:
+                if complexity > 10:
+                    high_complexity.append((src_file, name, complexity))
+                total_complexity += complexity
+                total_functions += 1
+            file_count += 1
+            lang_counts[lang] = lang_counts.get(lang, 0) + 1
 
         if not file_count:
             return "No functions found to analyze"
@@ -2394,12 +2869,38 @@ def analyze_code_complexity(target_path: str = ".") -> str:
         return f"Error analyzing complexity: {e}"
 
 
+# Below this many files pylint's worker start-up outweighs parallel linting
+QUALITY_JOBS_MIN_FILES = 4
+
+# Issue counts from the last pylint run: (pylint identity, abspath -> ((mtime_ns, size),
+# category -> count)). Cross-module messages (import-error, no-member, cyclic-import)
+# depend on every file linted together, so a call is only answered from here when all
+# of its files are unchanged; otherwise its whole set is re-linted and replaces this.
+_QualityCounts = dict[str, tuple[tuple[int, int], dict[str, int]]]
+_quality_cache: tuple[tuple[str, ...], _QualityCounts] | None = None
+
+
+def _pylint_identity() -> tuple[str, ...]:
+    """The pylint version, project root and rcfiles a cached lint result depends on."""
+    import pylint
+    from pylint.config import find_default_config_files
+
+    identity = [pylint.__version__, str(config.PROJECT_ROOT)]
+    for rcfile in find_default_config_files():
+        st = rcfile.stat()
+        identity.append(f"{rcfile}:{st.st_mtime_ns}:{st.st_size}")
+    return tuple(identity)
+
+
 @mcp.tool()
 def analyze_code_quality(target_path: str = ".", max_files: int = 10) -> str:
+    global _quality_cache
     try:
+        from contextlib import redirect_stderr, redirect_stdout
         from io import StringIO
 
         from pylint.lint import Run
+        from pylint.reporters import CollectingReporter
     except ImportError:
         return "Error: pylint not installed. Run: pip install pylint"
 
@@ -2408,51 +2909,82 @@ def analyze_code_quality(target_path: str = ".", max_files: int = 10) -> str:
         if not target.exists():
             return f"Path not found: {target_path}"
 
-        py_files = list(target.rglob("*.py"))
-        py_files = [
-            f
-            for f in py_files
-            if not any(is_dir_ignored(p) for p in f.relative_to(target).parts[:-1])
-        ]
+        from itertools import islice
+
+        # Only max_files are linted, so the walk stops as soon as that many are found
+        files_to_check = list(
+            islice(
+                (
+                    Path(entry.path)
+                    for entry in iter_project_files(target)
+                    if entry.name.endswith(".py") and entry.is_file()
+                ),
+                max(max_files, 0),
+            )
+        )
 
-        if not py_files:
+        if not files_to_check:
             return "No Python files found"
 
         results = []
         results.append("# CODE QUALITY ANALYSIS\n")
 
-        files_to_check = py_files[:max_files]
         results.append(f"Analyzing {len(files_to_check)} files...\n")
 
         issues_summary = {"convention": 0, "refactor": 0, "warning": 0, "error": 0}
 
+        to_lint: dict[str, tuple[int, int]] = {}
         for py_file in files_to_check:
-            try:
-                old_stdout = sys.stdout
-                old_stderr = sys.stderr
-                sys.stdout = StringIO()
-                sys.stderr = StringIO()
-
-                try:
-                    pylint_output = Run([str(py_file), "--output-format=text"], exit=False)
-                finally:
-                    sys.stdout = old_stdout
-                    sys.stderr = old_stderr
-
-                stats = pylint_output.linter.stats
-                if hasattr(stats, "convention"):
-                    issues_summary["convention"] += stats.convention
-                if hasattr(stats, "refactor"):
-                    issues_summary["refactor"] += stats.refactor
-                if hasattr(stats, "warning"):
-                    issues_summary["warning"] += stats.warning
-                if hasattr(stats, "error"):
-                    issues_summary["error"] += stats.error
+            st = py_file.stat()
+            to_lint[os.path.abspath(py_file)] = (st.st_mtime_ns, st.st_size)
 
-            except Exception:
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
-                continue
+        identity = _pylint_identity()
+        cached = _quality_cache
+        if (
+            cached is not None
+            and cached[0] == identity
+            and all(
+                path in cached[1] and cached[1][path][0] == signature
+                for path, signature in to_lint.items()
+            )
+        ):
+            for path in to_lint:
+                for category, count in cached[1][path][1].items():
+                    issues_summary[category] += count
+            to_lint = {}
+
+        # One run for all files: pylint startup (config, plugins, astroid) dominates
+        # per-file lint time. Output is collected in memory; stdout is the MCP channel.
+        # astroid caches parsed modules process-wide; without clearing them an edited
+        # file would be linted from its stale tree on the next call.
+        argv = list(to_lint) + ["--persistent=n", "--score=n", "--clear-cache-post-run=y"]
+        # pylint's --jobs workers are forked; forking while other threads (log listener,
+        # background scans, the MCP transport) hold locks can deadlock the children, so
+        # parallel linting is only used from a single-threaded process.
+        if len(to_lint) >= QUALITY_JOBS_MIN_FILES and threading.active_count() == 1:
+            argv.append("--jobs=0")
+        try:
+            if to_lint:
+                reporter = CollectingReporter()
+                with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                    Run(argv, reporter=reporter, exit=False)
+
+                per_file: dict[str, dict[str, int]] = {
+                    path: dict.fromkeys(issues_summary, 0) for path in to_lint
+                }
+                for msg in reporter.messages:
+                    counts = per_file.get(msg.abspath)
+                    if counts is not None and msg.category in counts:
+                        counts[msg.category] += 1
+                for counts in per_file.values():
+                    for category, count in counts.items():
+                        issues_summary[category] += count
+                _quality_cache = (
+                    identity,
+                    {path: (to_lint[path], counts) for path, counts in per_file.items()},
+                )
+        except Exception as e:
+            log(f"pylint run failed: {e}")
 
         results.append("## Issues Summary")
         results.append(f"- Errors: {issues_summary['error']}")
@@ -2474,6 +3006,26 @@ def analyze_code_quality(target_path: str = ".", max_files: int = 10) -> str:
         return f"Error analyzing quality: {e}"
 
 
+_PC_COV_RE = re.compile(rb'<span class="pc_cov">(\d+)%</span>')
+
+
+def _read_overall_coverage(index_file: Path) -> str | None:
+    """
+    Extracts the overall percentage from a coverage.py htmlcov index.
+
+    The report is memory-mapped and searched as bytes, so it is neither copied into
+    a str nor decoded; only the matched digits are.
+    """
+    import mmap
+
+    with open(index_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _PC_COV_RE.search(mm)
+            return match.group(1).decode("ascii") if match else None
+
+
 @mcp.tool()
 def get_test_coverage_info() -> str:
     try:
@@ -2489,15 +3041,9 @@ def get_test_coverage_info() -> str:
         if htmlcov_dir.exists():
             index_file = htmlcov_dir / "index.html"
             if index_file.exists():
-                content = index_file.read_text()
-
-                if "pc_cov" in content:
-                    import re
-
-                    match = re.search(r'<span class="pc_cov">(\d+)%</span>', content)
-                    if match:
-                        coverage = match.group(1)
-                        results.append(f"**Overall Coverage**: {coverage}%\n")
+                coverage = _read_overall_coverage(index_file)
+                if coverage:
+                    results.append(f"**Overall Coverage**: {coverage}%\n")
 
                 results.append("Coverage report available at: htmlcov/index.html")
 
@@ -2548,6 +3094,7 @@ def get_cache_stats() -> str:
     ctx = get_context()
     file_stats = get_file_cache_stats()
     query_stats = ctx.vector_store.get_query_cache_stats()
+    semantic_stats = ctx.vector_store.get_semantic_cache_stats()
 
     result = "# CACHE STATISTICS\n\n"
     result += "## File Cache (safe_read_text)\n"
@@ -2562,11 +3109,19 @@ def get_cache_stats() -> str:
     result += f"- **Hit Rate**: {query_stats['hit_rate']}\n"
     result += f"- **Size**: {query_stats['size']}/{query_stats['max_size']}\n"
     result += f"- **Expirations**: {query_stats['expirations']}\n"
-    result += f"- **TTL**: {query_stats['ttl_seconds']}s\n"
+    result += f"- **TTL**: {query_stats['ttl_seconds']}s\n\n"
+
+    result += "## Semantic Query Cache (near-duplicate queries)\n"
+    result += f"- **Hits**: {semantic_stats['hits']}\n"
+    result += f"- **Misses**: {semantic_stats['misses']}\n"
+    result += f"- **Hit Rate**: {semantic_stats['hit_rate']}\n"
+    result += f"- **Size**: {semantic_stats['size']}/{semantic_stats['max_size']}\n"
+    result += f"- **Similarity Threshold**: {semantic_stats['threshold']}\n"
+    result += f"- **TTL**: {semantic_stats['ttl_seconds']}s\n"
 
     return result
 
 
 if __name__ == "__main__":
-    ensure_startup()
+    start_background_startup()
     mcp.run()
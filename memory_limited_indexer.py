@@ -10,21 +10,24 @@ logger = get_logger()
 class MemoryLimitedIndexer:
     """
     Manages document indexing with memory limits.
-    Automatically flushes batches when memory threshold is reached.
+    Automatically flushes batches when memory threshold or chunk count cap is reached.
     """
 
     def __init__(
         self,
         max_memory_bytes: int,
         batch_callback: Callable[[list[str], list[dict], list[str]], None],
+        max_chunks: int | None = None,
     ):
         """
         Args:
             max_memory_bytes: Maximum memory to use for buffering documents
             batch_callback: Function to call when flushing batch (documents, metadatas, ids)
+            max_chunks: Flush as soon as this many chunks are buffered (None = memory only)
         """
         self.max_memory_bytes = max_memory_bytes
         self.batch_callback = batch_callback
+        self.max_chunks = max_chunks
         self.documents: list[str] = []
         self.metadatas: list[dict] = []
         self.ids: list[str] = []
@@ -70,6 +73,9 @@ class MemoryLimitedIndexer:
         self.current_memory += chunk_size
         self.total_chunks += 1
 
+        if self.max_chunks is not None and len(self.documents) >= self.max_chunks:
+            self.flush()
+
     def flush(self) -> None:
         """
         Flushes current batch to the callback.
@@ -79,9 +85,10 @@ class MemoryLimitedIndexer:
             return
 
         logger.debug(
-            f"Flushing batch {self.total_batches + 1}: "
-            f"{len(self.documents)} chunks, "
-            f"{self.current_memory / 1024 / 1024:.2f} MB"
+            "Flushing batch %d: %d chunks, %.2f MB",
+            self.total_batches + 1,
+            len(self.documents),
+            self.current_memory / 1024 / 1024,
         )
 
         try:
@@ -1,4 +1,7 @@
+import filecmp
 import json
+import os
+import re
 import shutil
 import threading
 from datetime import datetime
@@ -9,6 +12,46 @@ from logger import get_logger
 
 logger = get_logger()
 
+# Markdown header lines; group 1 is the run of leading "#" that gives the level
+_HEADER_RE = re.compile(r"^(#+)[^\n]*", re.MULTILINE)
+
+
+def _remove_sections(content: str, section_name: str) -> str:
+    """
+    Removes every header of level >= 2 whose line contains section_name
+    (case-insensitive), along with everything up to the next header of the
+    same or a higher level.
+
+    Only header lines are visited in Python; the text between them is copied
+    as slices.
+    """
+    needle = section_name.lower()
+    kept: list[str] = []
+    keep_from = 0
+    skip_level = 0
+
+    for match in _HEADER_RE.finditer(content):
+        level = len(match.group(1))
+        if level >= 2 and needle in match.group(0).lower():
+            if not skip_level:
+                kept.append(content[keep_from : match.start()])
+            skip_level = level
+        elif skip_level and level <= skip_level:
+            keep_from = match.start()
+            skip_level = 0
+
+    result = "".join(kept)
+    if skip_level:
+        # Removed through EOF: also drop the newline that joined it to the kept text
+        return result[:-1] if result.endswith("\n") else result
+    return result + content[keep_from:]
+
+
+# Rendered list_versions output per history directory, keyed by the directory's
+# mtime: every new version adds files and so bumps it. save_version also drops the
+# entry, since a save within the same second rewrites an existing .meta.json in place.
+_VERSIONS_CACHE: dict[Path, tuple[int, str]] = {}
+
 
 class MemoryManager:
     """
@@ -78,14 +121,19 @@ class MemoryManager:
         try:
             normalized_new = content.strip()
             new_entry = f"\n\n### Update ({section})\n{normalized_new}"
+            # The shared handle ignores undecodable bytes in the existing file, which
+            # would also drop unencodable characters from the entry; reject those here
+            new_entry.encode("utf-8")
 
             with self._lock:
-                existing = self.memory_file.read_text(encoding="utf-8", errors="ignore")
-                if self._has_duplicate_update(existing, section, normalized_new):
-                    logger.info(f"Memory update skipped (duplicate): {section}")
-                    return "Memory update skipped (duplicate entry already present)."
-
-                with open(self.memory_file, "a", encoding="utf-8") as f:
+                # One handle for the duplicate check and the append
+                with open(self.memory_file, "r+", encoding="utf-8", errors="ignore") as f:
+                    existing = f.read()
+                    if self._has_duplicate_update(existing, section, normalized_new):
+                        logger.info(f"Memory update skipped (duplicate): {section}")
+                        return "Memory update skipped (duplicate entry already present)."
+
+                    f.seek(0, os.SEEK_END)
                     f.write(new_entry)
 
             logger.info(f"Memory updated: {section}")
@@ -135,18 +183,7 @@ class MemoryManager:
 
         try:
             if keep_template:
-                template = """# Project Memory
-
-## Status
-- [ ] Initial Setup
-
-## Tech Stack
-- Language: Python
-- Framework:
-
-## Recent Decisions
-- Memory cleared.
-"""
+                template = config.MEMORY_TEMPLATE.format(initial="Memory cleared.")
                 with self._lock:
                     self.memory_file.write_text(template)
                 logger.info("Memory cleared (template preserved)")
@@ -179,26 +216,7 @@ class MemoryManager:
         try:
             with self._lock:
                 content = self.memory_file.read_text()
-                lines = content.split("\n")
-                new_lines = []
-                skip = False
-                skip_level = 0
-
-                for line in lines:
-                    stripped = line.lstrip("#")
-                    current_level = len(line) - len(stripped) if line.startswith("#") else 0
-
-                    if current_level >= 2 and section_name.lower() in line.lower():
-                        skip = True
-                        skip_level = current_level
-                        continue
-                    elif skip and current_level > 0 and current_level <= skip_level:
-                        skip = False
-
-                    if not skip:
-                        new_lines.append(line)
-
-                self.memory_file.write_text("\n".join(new_lines))
+                self.memory_file.write_text(_remove_sections(content, section_name))
             logger.info(f"Section '{section_name}' deleted")
             return f"Section '{section_name}' deleted successfully."
         except Exception as e:
@@ -234,8 +252,9 @@ class MemoryManager:
                 "created_at": datetime.now().isoformat(),
             }
 
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
+            metadata_file.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+            with self._lock:
+                _VERSIONS_CACHE.pop(self.history_dir, None)
 
             logger.info(f"Memory version saved: {version_file.name}")
             return f"Memory version saved: {version_file.name}"
@@ -247,18 +266,27 @@ class MemoryManager:
         """
         Lists all saved memory versions.
 
+        The listing is reused while the history directory's mtime is unchanged.
+
         Returns:
             Formatted list of versions or error
         """
-        if not self.history_dir.exists():
+        try:
+            mtime_ns = self.history_dir.stat().st_mtime_ns
+        except OSError:
             return "No memory versions found"
 
+        with self._lock:
+            cached = _VERSIONS_CACHE.get(self.history_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
             versions = []
             for meta_file in sorted(self.history_dir.glob("*.meta.json"), reverse=True):
                 try:
-                    with open(meta_file) as f:
-                        meta = json.load(f)
+                    # json detects the encoding from bytes itself; skips the text-mode reader
+                    meta = json.loads(meta_file.read_bytes())
 
                     timestamp = meta.get("timestamp", "unknown")
                     description = meta.get("description", "")
@@ -274,14 +302,28 @@ class MemoryManager:
                 except Exception:
                     continue
 
-            if not versions:
-                return "No memory versions found"
-
-            return "# MEMORY VERSIONS\n\n" + "\n".join(versions)
+            if versions:
+                listing = "# MEMORY VERSIONS\n\n" + "\n".join(versions)
+            else:
+                listing = "No memory versions found"
+            with self._lock:
+                _VERSIONS_CACHE[self.history_dir] = (mtime_ns, listing)
+            return listing
         except Exception as e:
             logger.error(f"Error listing versions: {e}")
             return f"Error listing versions: {e}"
 
+    def _matches_latest_version(self) -> bool:
+        """Checks whether memory is byte-identical to the newest saved version."""
+        versions = sorted(self.history_dir.glob("memory_*.md"))
+        if not versions:
+            return False
+        try:
+            with self._lock:
+                return filecmp.cmp(self.memory_file, versions[-1], shallow=False)
+        except OSError:
+            return False
+
     def restore_version(self, timestamp: str) -> str:
         """
         Restores a specific memory version.
@@ -301,7 +343,8 @@ class MemoryManager:
             if not version_file.exists():
                 return f"Version not found: {timestamp}"
 
-            self.save_version(description="Auto-backup before restore")
+            if not self._matches_latest_version():
+                self.save_version(description="Auto-backup before restore")
 
             with self._lock:
                 shutil.copy2(version_file, self.memory_file)
@@ -0,0 +1,45 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ast_splitter import ASTSplitter, _merge_small_chunks
+from config import CHUNK_SIZE
+
+
+class TestLanguageSplitters:
+    """Tests for per-extension text splitters."""
+
+    def test_markdown_splits_on_headers(self):
+        """Test that markdown text falls back to header-aware splitting"""
+        section = "word " * (CHUNK_SIZE // 10)
+        content = f"# One\n{section}\n\n# Two\n{section}\n"
+
+        chunks = ASTSplitter().split(content, Path("notes.md"))
+
+        assert [c["text"].splitlines()[0] for c in chunks] == ["# One", "# Two"]
+        assert all(c["metadata"]["symbol_type"] == "text" for c in chunks)
+
+    def test_unknown_extension_uses_generic_splitter(self):
+        """Test that extensions without a language fall back to the default splitter"""
+        splitter = ASTSplitter()
+
+        assert splitter._splitter_for(Path("data.yaml")) is splitter._text_splitter
+        assert splitter._splitter_for(Path("Main.PY")) is not splitter._text_splitter
+
+
+class TestMergeSmallChunks:
+    """Tests for folding tiny splitter pieces into their neighbours."""
+
+    def test_tiny_tail_joins_previous_chunk(self):
+        """Test that a short trailing piece is appended to the chunk before it"""
+        assert _merge_small_chunks(["a" * 50, "b" * 10, "c" * 50], min_size=20, max_size=100) == [
+            "a" * 50 + "\n" + "b" * 10,
+            "c" * 50,
+        ]
+
+    def test_merge_respects_max_size(self):
+        """Test that pieces stay separate when merging would exceed max_size"""
+        chunks = ["a" * 95, "b" * 10]
+        assert _merge_small_chunks(chunks, min_size=20, max_size=100) == chunks
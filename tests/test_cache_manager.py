@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cache_manager import FileCache, LRUCache, TTLCache
+from cache_manager import FileCache, LRUCache, SemanticCache, TTLCache
 
 
 class TestLRUCache(unittest.TestCase):
@@ -238,5 +238,71 @@ class TestFileCache(unittest.TestCase):
         self.assertIsNone(cache.get(file_path))
 
 
+class TestSemanticCache(unittest.TestCase):
+    def test_semantic_cache_near_duplicate_hit(self):
+        """Test that a sufficiently similar embedding returns the cached value"""
+        cache = SemanticCache(threshold=0.95, max_size=10)
+
+        cache.put([1.0, 0.0, 0.0], "result")
+
+        self.assertEqual(cache.get([0.99, 0.05, 0.0]), "result")
+        self.assertIsNone(cache.get([0.0, 1.0, 0.0]))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_semantic_cache_namespace_isolation(self):
+        """Test that entries only match within their namespace"""
+        cache = SemanticCache(threshold=0.95, max_size=10)
+
+        cache.put([1.0, 0.0], "five", namespace="5")
+        cache.put([1.0, 0.0], "ten", namespace="10")
+
+        self.assertEqual(cache.get([1.0, 0.0], namespace="5"), "five")
+        self.assertEqual(cache.get([1.0, 0.0], namespace="10"), "ten")
+        self.assertIsNone(cache.get([1.0, 0.0], namespace="20"))
+
+    @patch("time.time")
+    def test_semantic_cache_expiration(self, mock_time):
+        """Test that entries expire after TTL"""
+        cache = SemanticCache(threshold=0.95, max_size=10, ttl_seconds=5)
+
+        mock_time.return_value = 100.0
+        cache.put([1.0, 0.0], "result")
+
+        mock_time.return_value = 106.0
+        self.assertIsNone(cache.get([1.0, 0.0]))
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+        self.assertEqual(cache.get_stats()["size"], 0)
+
+    @patch("time.time")
+    def test_semantic_cache_lru_eviction(self, mock_time):
+        """Test that the least recently used entry is evicted at capacity"""
+        cache = SemanticCache(threshold=0.95, max_size=2)
+
+        mock_time.return_value = 1.0
+        cache.put([1.0, 0.0, 0.0], "a")
+        mock_time.return_value = 2.0
+        cache.put([0.0, 1.0, 0.0], "b")
+        mock_time.return_value = 3.0
+        cache.get([1.0, 0.0, 0.0])
+        mock_time.return_value = 4.0
+        cache.put([0.0, 0.0, 1.0], "c")
+
+        self.assertEqual(cache.get([1.0, 0.0, 0.0]), "a")
+        self.assertIsNone(cache.get([0.0, 1.0, 0.0]))
+        self.assertEqual(cache.get([0.0, 0.0, 1.0]), "c")
+
+    def test_semantic_cache_clear(self):
+        """Test clearing semantic cache"""
+        cache = SemanticCache()
+
+        cache.put([1.0, 0.0], "result")
+        cache.clear()
+
+        self.assertIsNone(cache.get([1.0, 0.0]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@ import os
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -13,6 +13,7 @@ from config import (
     get_ignored_dirs,
     get_max_file_size_bytes,
     get_max_memory_bytes,
+    iter_project_files,
     safe_read_text,
     validate_path,
 )
@@ -52,37 +53,35 @@ class TestValidatePath(unittest.TestCase):
 
 
 class TestSafeReadText(unittest.TestCase):
-    @patch("pathlib.Path.read_text")
-    def test_safe_read_text_utf8(self, mock_read_text):
+    @patch("pathlib.Path.read_bytes")
+    def test_safe_read_text_utf8(self, mock_read_bytes):
         """Test reading UTF-8 file successfully"""
-        mock_read_text.return_value = "Hello World"
+        mock_read_bytes.return_value = b"Hello World"
         result = safe_read_text(Path("test.txt"))
         self.assertEqual(result, "Hello World")
-        mock_read_text.assert_called_once_with(encoding="utf-8")
-
-    @patch("pathlib.Path.read_text")
-    def test_safe_read_text_fallback_to_latin1(self, mock_read_text):
-        """Test fallback to Latin-1 when UTF-8 fails"""
-        mock_read_text.side_effect = [
-            UnicodeDecodeError("utf-8", b"", 0, 1, "invalid"),
-            UnicodeDecodeError("utf-8-sig", b"", 0, 1, "invalid"),
-            "Café",
-        ]
+        mock_read_bytes.assert_called_once_with()
+
+    @patch("pathlib.Path.read_bytes")
+    def test_safe_read_text_fallback_to_latin1(self, mock_read_bytes):
+        """Test fallback to Latin-1 when UTF-8 fails, without re-reading the file"""
+        mock_read_bytes.return_value = b"Caf\xe9"
         result = safe_read_text(Path("test.txt"))
         self.assertEqual(result, "Café")
-        self.assertEqual(mock_read_text.call_count, 3)
+        self.assertEqual(mock_read_bytes.call_count, 1)
 
-    @patch("pathlib.Path.read_text")
-    def test_safe_read_text_raises_on_all_encoding_failures(self, mock_read_text):
+    @patch("pathlib.Path.read_bytes")
+    def test_safe_read_text_raises_on_all_encoding_failures(self, mock_read_bytes):
         """Test that UnicodeDecodeError is raised when all encodings fail"""
-        mock_read_text.side_effect = UnicodeDecodeError("utf-8", b"", 0, 1, "invalid")
+        raw = MagicMock()
+        raw.decode.side_effect = UnicodeDecodeError("utf-8", b"", 0, 1, "invalid")
+        mock_read_bytes.return_value = raw
         with self.assertRaises(UnicodeDecodeError):
             safe_read_text(Path("test.txt"))
 
-    @patch("pathlib.Path.read_text")
-    def test_safe_read_text_raises_io_error(self, mock_read_text):
+    @patch("pathlib.Path.read_bytes")
+    def test_safe_read_text_raises_io_error(self, mock_read_bytes):
         """Test that IOError is raised on file read failure"""
-        mock_read_text.side_effect = PermissionError("Access denied")
+        mock_read_bytes.side_effect = PermissionError("Access denied")
         with self.assertRaises(IOError):
             safe_read_text(Path("test.txt"))
 
@@ -118,6 +117,13 @@ class TestConfigFunctions(unittest.TestCase):
         result = get_max_memory_bytes()
         self.assertEqual(result, MAX_MEMORY_MB * 1024 * 1024)
 
+    def test_binary_extensions_never_indexable(self):
+        """Test that binary suffixes are excluded by INDEXABLE_EXTENSIONS alone"""
+        import config
+
+        self.assertFalse(config.BINARY_EXTENSIONS & config.INDEXABLE_EXTENSIONS)
+        self.assertNotIn("", config.INDEXABLE_EXTENSIONS)
+
     def test_get_ignored_dirs_returns_copy(self):
         """Test that get_ignored_dirs returns a copy, not reference"""
         dirs1 = get_ignored_dirs()
@@ -132,6 +138,26 @@ class TestConfigFunctions(unittest.TestCase):
         self.assertIn("node_modules", dirs)
         self.assertIn("__pycache__", dirs)
 
+    def test_iter_project_files_prunes_ignored_dirs(self):
+        """Test that iter_project_files skips ignored and, optionally, hidden dirs"""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "src").mkdir()
+            (root / "src" / "main.py").write_text("")
+            (root / "node_modules").mkdir()
+            (root / "node_modules" / "dep.js").write_text("")
+            (root / ".hidden").mkdir()
+            (root / ".hidden" / "secret.py").write_text("")
+            (root / "top.txt").write_text("")
+
+            names = {e.name for e in iter_project_files(root)}
+            self.assertEqual(names, {"main.py", "secret.py", "top.txt"})
+
+            names = {e.name for e in iter_project_files(root, skip_hidden=True)}
+            self.assertEqual(names, {"main.py", "top.txt"})
+
 
 if __name__ == "__main__":
     unittest.main()
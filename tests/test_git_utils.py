@@ -1,5 +1,6 @@
 """Tests for git_utils module."""
 
+import io
 import os
 import sys
 from datetime import datetime, timedelta
@@ -10,7 +11,37 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from exceptions import GitError
-from git_utils import CommitInfo, GitRepository
+from git_utils import CommitInfo, GitRepository, clear_repo_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_repo_cache():
+    clear_repo_cache()
+    yield
+    clear_repo_cache()
+
+
+def _log_output(*commits: tuple[str, datetime, str, str]) -> MagicMock:
+    """Fakes a `git log --format=%H%x00%ct%x00%an%x00%B%x1e` process started as_process."""
+    records = [
+        f"{sha}\x00{int(date.timestamp())}\x00{author}\x00{message}\x1e"
+        for sha, date, author, message in commits
+    ]
+    proc = MagicMock()
+    proc.stdout = io.BytesIO("\n".join(records).encode("utf-8"))
+    return proc
+
+
+def test_gitpython_imported_lazily() -> None:
+    """Test that importing git_utils does not pull in GitPython."""
+    import subprocess
+
+    code = "import sys, git_utils; print('git' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
 
 
 class TestCommitInfo:
@@ -57,13 +88,27 @@ class TestCommitInfo:
         assert info.date_str == "2024-03-15 14:30"
         assert info.date_short == "2024-03-15"
 
+    def test_display_fields_precomputed(self) -> None:
+        """Test that display strings are stored on the instance, not recomputed."""
+        info = CommitInfo(
+            hash="abc123",
+            short_hash="abc",
+            message="Subject line\n\nBody",
+            author="Test",
+            date=datetime(2024, 3, 15, 14, 30),
+        )
+
+        assert info.__dict__["first_line"] == "Subject line"
+        assert info.__dict__["date_str"] == "2024-03-15 14:30"
+        assert info.__dict__["date_short"] == "2024-03-15"
+
 
 class TestGitRepository:
     """Tests for GitRepository class."""
 
     def test_invalid_repository(self) -> None:
         """Test error when not in a git repository."""
-        with patch("git_utils.git.Repo") as mock_repo:
+        with patch("git.Repo") as mock_repo:
             import git
 
             mock_repo.side_effect = git.InvalidGitRepositoryError()
@@ -76,49 +121,183 @@ class TestGitRepository:
 
     def test_get_commits(self) -> None:
         """Test getting commits from repository."""
-        with patch("git_utils.git.Repo") as mock_repo_class:
+        with patch("git.Repo") as mock_repo_class:
             mock_repo = MagicMock()
             mock_repo_class.return_value = mock_repo
-
-            mock_commit = MagicMock()
-            mock_commit.hexsha = "abc1234567890"
-            mock_commit.message = "Test commit"
-            mock_commit.author.name = "Author"
-            mock_commit.committed_date = datetime.now().timestamp()
-
-            mock_repo.iter_commits.return_value = [mock_commit]
+            mock_repo.git.log.return_value = _log_output(
+                ("abc1234567890", datetime.now(), "Author", "Test commit\n")
+            )
 
             repo = GitRepository()
             commits = repo.get_commits(max_count=10)
 
             assert len(commits) == 1
             assert commits[0].short_hash == "abc1234"
+            assert commits[0].message == "Test commit"
+            assert mock_repo.git.log.call_args.kwargs["max_count"] == 10
 
     def test_get_commits_with_since_days(self) -> None:
         """Test getting commits filtered by date."""
-        with patch("git_utils.git.Repo") as mock_repo_class:
+        with patch("git.Repo") as mock_repo_class:
             mock_repo = MagicMock()
             mock_repo_class.return_value = mock_repo
-
-            recent_commit = MagicMock()
-            recent_commit.hexsha = "recent123"
-            recent_commit.message = "Recent"
-            recent_commit.author.name = "Author"
-            recent_commit.committed_date = datetime.now().timestamp()
-
-            old_commit = MagicMock()
-            old_commit.hexsha = "old456789"
-            old_commit.message = "Old"
-            old_commit.author.name = "Author"
-            old_commit.committed_date = (datetime.now() - timedelta(days=30)).timestamp()
-
-            mock_repo.iter_commits.return_value = [recent_commit, old_commit]
+            mock_repo.git.log.return_value = _log_output(
+                ("recent123", datetime.now(), "Author", "Recent\n"),
+                ("old456789", datetime.now() - timedelta(days=30), "Author", "Old\n"),
+            )
 
             repo = GitRepository()
             commits = repo.get_commits(max_count=10, since_days=7)
 
             assert len(commits) == 1
             assert commits[0].short_hash == "recent1"
+            assert "since" in mock_repo.git.log.call_args.kwargs
+
+    def test_iter_commits_parses_multiline_messages(self) -> None:
+        """Test that log records keep multi-line messages and fall back for empty authors."""
+        with patch("git.Repo") as mock_repo_class:
+            mock_repo = MagicMock()
+            mock_repo_class.return_value = mock_repo
+            mock_repo.git.log.return_value = _log_output(
+                ("first1234", datetime(2026, 1, 2), "", "Subject\n\nBody line\n"),
+                ("second123", datetime(2026, 1, 1), "Dev", "Caf\u00e9\n"),
+            )
+
+            commits = list(GitRepository().iter_commits(max_count=10))
+
+            assert [c.short_hash for c in commits] == ["first12", "second1"]
+            assert commits[0].message == "Subject\n\nBody line"
+            assert commits[0].first_line == "Subject"
+            assert commits[0].author == "Unknown"
+            assert commits[1].message == "Caf\u00e9"
+            assert commits[1].date == datetime(2026, 1, 1)
+
+    def test_iter_commits_streams_lazily(self) -> None:
+        """Test that iter_commits parses records only as they are consumed."""
+        with patch("git.Repo") as mock_repo_class:
+            mock_repo = MagicMock()
+            mock_repo_class.return_value = mock_repo
+            proc = _log_output(("first1234", datetime.now(), "Author", "First\n"))
+            chunks = [proc.stdout.getvalue()]
+
+            def read1(_size: int) -> bytes:
+                if not chunks:
+                    raise AssertionError("read past the first record")
+                return chunks.pop()
+
+            proc.stdout = MagicMock(read1=read1)
+            mock_repo.git.log.return_value = proc
+
+            commits = GitRepository().iter_commits(max_count=10)
+            assert next(commits).short_hash == "first12"
+            assert mock_repo.git.log.call_args.kwargs["as_process"] is True
+            proc.wait.assert_not_called()
+
+            commits.close()
+            proc.terminate.assert_called_once()
+
+    def test_iter_commits_raises_on_call(self) -> None:
+        """Test that GitError surfaces before iteration starts."""
+        with patch("git.Repo") as mock_repo:
+            import git
+
+            mock_repo.side_effect = git.InvalidGitRepositoryError()
+
+            with pytest.raises(GitError):
+                GitRepository("/fake/path").iter_commits()
+
+    def test_iter_commits_wraps_git_log_failure(self) -> None:
+        """Test that a failing git log (e.g. no commits yet) surfaces as GitError."""
+        import git
+
+        with patch("git.Repo") as mock_repo_class:
+            mock_repo = MagicMock()
+            mock_repo_class.return_value = mock_repo
+            mock_repo.git.log.return_value = _log_output()
+            mock_repo.git.log.return_value.wait.side_effect = git.GitCommandError("log", 128)
+
+            with pytest.raises(GitError):
+                GitRepository("/some/repo").iter_commits()
+
+    def test_get_commits_memoized_until_head_moves(self) -> None:
+        """Test that back-to-back get_commits calls reuse one git log."""
+        with (
+            patch("git.Repo") as mock_repo_class,
+            patch("git_utils._head_signature") as mock_signature,
+        ):
+            mock_repo = MagicMock()
+            mock_repo_class.return_value = mock_repo
+            mock_signature.return_value = (1, 1)
+            mock_repo.git.log.return_value = _log_output(
+                ("abc1234567890", datetime.now(), "Author", "Test commit\n")
+            )
+
+            first = GitRepository("/some/repo").get_commits(max_count=10)
+            second = GitRepository("/some/repo").get_commits(max_count=10)
+            assert first == second
+            assert mock_repo.git.log.call_count == 1
+
+            GitRepository("/some/repo").get_commits(max_count=20)
+            assert mock_repo.git.log.call_count == 2
+
+            mock_signature.return_value = (2, 2)
+            GitRepository("/some/repo").get_commits(max_count=10)
+            assert mock_repo.git.log.call_count == 3
+
+    def test_recently_changed_files_memoized_until_head_moves(self) -> None:
+        """Test that recently changed files are rescanned only after HEAD moves."""
+        with (
+            patch("git.Repo") as mock_repo_class,
+            patch("git_utils._head_signature") as mock_signature,
+        ):
+            mock_repo = MagicMock()
+            mock_repo_class.return_value = mock_repo
+            mock_signature.return_value = (1, 1)
+            mock_commit = MagicMock()
+            mock_commit.hexsha = "abc1234567890"
+            mock_commit.message = "Change"
+            mock_commit.author.name = "Author"
+            mock_commit.committed_date = datetime.now().timestamp()
+            mock_commit.stats.files = {"a.py": {}}
+            mock_repo.iter_commits.side_effect = lambda **kwargs: iter([mock_commit])
+
+            first = GitRepository("/some/repo").get_recently_changed_files(days=14)
+            first.clear()
+            second = GitRepository("/some/repo").get_recently_changed_files(days=14)
+            assert list(second) == ["a.py"]
+            assert mock_repo.iter_commits.call_count == 1
+
+            mock_signature.return_value = (2, 2)
+            GitRepository("/some/repo").get_recently_changed_files(days=14)
+            assert mock_repo.iter_commits.call_count == 2
+
+    def test_repo_shared_across_instances(self) -> None:
+        """Test that the opened git.Repo is reused by later instances."""
+        with patch("git.Repo") as mock_repo_class:
+            mock_repo_class.return_value = MagicMock()
+
+            first = GitRepository("/some/repo")._get_repo()
+            second = GitRepository("/some/repo")._get_repo()
+
+            assert first is second
+            assert mock_repo_class.call_count == 1
+
+    def test_repo_kept_when_head_moves(self) -> None:
+        """Test that a cached repo is reused, not reopened, after HEAD changes."""
+        with (
+            patch("git.Repo") as mock_repo_class,
+            patch("git_utils._head_signature") as mock_signature,
+        ):
+            mock_repo_class.side_effect = [MagicMock(), MagicMock()]
+            mock_signature.return_value = (1, 1)
+            first = GitRepository("/some/repo")._get_repo()
+
+            mock_signature.return_value = (2, 2)
+            second = GitRepository("/some/repo")._get_repo()
+
+            assert first is second
+            assert mock_repo_class.call_count == 1
+            first.close.assert_not_called()
 
     def test_get_author_stats(self) -> None:
         """Test author statistics calculation."""
@@ -101,11 +101,21 @@ class TestIndexMetadata(unittest.TestCase):
     def test_get_file_mtime_existing(self):
         """Test getting mtime for existing file"""
         metadata = IndexMetadata()
-        metadata.metadata = {"test.py": {"mtime": 123.45}}
+        metadata.metadata = {"test.py": {"mtime_ns": 123450000000}}
 
         mtime = metadata.get_file_mtime("test.py")
 
-        self.assertEqual(mtime, 123.45)
+        self.assertEqual(mtime, 123450000000)
+
+    def test_get_file_mtime_legacy_float_entry(self):
+        """Test that legacy float-seconds entries are converted to nanoseconds"""
+        metadata = IndexMetadata()
+        metadata.metadata = {"test.py": {"mtime": 100.5}}
+
+        mtime = metadata.get_file_mtime("test.py")
+
+        self.assertEqual(mtime, 100_500_000_000)
+        self.assertIsInstance(mtime, int)
 
     def test_get_file_mtime_non_existing(self):
         """Test getting mtime for non-existing file returns 0"""
@@ -113,25 +123,25 @@ class TestIndexMetadata(unittest.TestCase):
 
         mtime = metadata.get_file_mtime("nonexistent.py")
 
-        self.assertEqual(mtime, 0.0)
+        self.assertEqual(mtime, 0)
 
     def test_update_file(self):
         """Test updating file metadata"""
         metadata = IndexMetadata()
 
-        metadata.update_file("test.py", 123.45)
+        metadata.update_file("test.py", 123450000000)
 
-        self.assertEqual(metadata.metadata["test.py"]["mtime"], 123.45)
+        self.assertEqual(metadata.metadata["test.py"]["mtime_ns"], 123450000000)
         self.assertIn("indexed_at", metadata.metadata["test.py"])
 
     @patch("pathlib.Path.stat")
     def test_get_changed_files_detects_changes(self, mock_stat):
         """Test that get_changed_files detects modified files"""
         metadata = IndexMetadata()
-        metadata.metadata = {"old.py": {"mtime": 100.0}}
+        metadata.metadata = {"old.py": {"mtime_ns": 100_000_000_000}}
 
         mock_stat_result = MagicMock()
-        mock_stat_result.st_mtime = 200.0
+        mock_stat_result.st_mtime_ns = 200_000_000_000
         mock_stat.return_value = mock_stat_result
 
         files = [Path("old.py"), Path("new.py")]
@@ -145,10 +155,10 @@ class TestIndexMetadata(unittest.TestCase):
     def test_get_changed_files_skips_unchanged(self, mock_stat):
         """Test that unchanged files are not returned"""
         metadata = IndexMetadata()
-        metadata.metadata = {"unchanged.py": {"mtime": 100.0}}
+        metadata.metadata = {"unchanged.py": {"mtime_ns": 100_000_000_123}}
 
         mock_stat_result = MagicMock()
-        mock_stat_result.st_mtime = 100.0
+        mock_stat_result.st_mtime_ns = 100_000_000_123
         mock_stat.return_value = mock_stat_result
 
         files = [Path("unchanged.py")]
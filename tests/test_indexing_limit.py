@@ -1,5 +1,4 @@
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from codebase_indexer import CodebaseIndexer
 
@@ -7,15 +6,13 @@ from codebase_indexer import CodebaseIndexer
 class TestIndexingLimit:
     """Tests for indexing limits."""
 
-    @patch("os.walk")
-    def test_scan_limit(self, mock_walk):
+    def test_scan_limit(self, tmp_path):
         """Test that scan_indexable_files respects the max_files limit."""
-        # Mock os.walk to return many files
         # We simulate 2 directories, each with 10 files
-        mock_walk.return_value = [
-            ("/root", [], [f"file{i}.py" for i in range(10)]),
-            ("/root/subdir", [], [f"subfile{i}.py" for i in range(10)]),
-        ]
+        (tmp_path / "subdir").mkdir()
+        for i in range(10):
+            (tmp_path / f"file{i}.py").write_text("")
+            (tmp_path / "subdir" / f"subfile{i}.py").write_text("")
 
         # Mock vector store
         mock_store = MagicMock()
@@ -29,9 +26,169 @@ class TestIndexingLimit:
 
         # Run scan with limit
         files = indexer.scan_indexable_files(
-            Path("/root"), ignored_dirs=set(), ignore_patterns=set(), max_files=limit
+            tmp_path, ignored_dirs=set(), ignore_patterns=set(), max_files=limit
         )
 
         assert len(files) == limit
         assert len(files) < 20  # Should be less than total available files
         print(f"Scanned {len(files)} files with limit {limit}")
+
+    def test_scan_prunes_dirs_and_filters_files(self, tmp_path):
+        """Test that the scan skips ignored dirs, unindexable suffixes and ignore patterns."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("print()")
+        (tmp_path / "src" / "main.pyc").write_bytes(b"\0")
+        (tmp_path / "src" / "secret_keys.py").write_text("")
+        (tmp_path / "vendor").mkdir()
+        (tmp_path / "vendor" / "lib.py").write_text("")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("")
+
+        indexer = CodebaseIndexer(MagicMock())
+        files = indexer.scan_indexable_files(
+            tmp_path, ignored_dirs={"vendor"}, ignore_patterns={"secret_"}
+        )
+
+        assert files == [tmp_path / "src" / "main.py"]
+
+
+class TestParallelSplit:
+    """Tests for the threaded read-and-split pipeline."""
+
+    def test_iter_split_files_matches_serial_order(self, tmp_path, monkeypatch):
+        """Test that threaded splitting yields the same chunks, in file order, as serial."""
+        import codebase_indexer
+
+        files = []
+        for i in range(12):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"def func_{i}():\n    return {i}\n", encoding="utf-8")
+            files.append(path)
+        (tmp_path / "empty.py").write_text("   \n", encoding="utf-8")
+        files.insert(5, tmp_path / "empty.py")
+
+        indexer = CodebaseIndexer(MagicMock())
+        monkeypatch.setattr(codebase_indexer, "INDEX_READ_WORKERS", 4)
+        monkeypatch.setattr(codebase_indexer, "INDEX_READ_AHEAD", 3)
+        threaded = list(indexer.iter_split_files(files))
+
+        monkeypatch.setattr(codebase_indexer, "INDEX_READ_WORKERS", 1)
+        serial = list(indexer.iter_split_files(files))
+
+        assert [path for path, _ in threaded] == files
+        assert threaded == serial
+        assert threaded[5][1] is None
+
+    def test_read_and_split_skips_binary_content(self, tmp_path):
+        """Test that files with NUL bytes are skipped even without a binary extension."""
+        blob = tmp_path / "data"
+        blob.write_bytes(b"header\x00\x01\x02payload")
+
+        assert CodebaseIndexer(MagicMock()).read_and_split(blob) is None
+
+
+class TestIgnoreMatcher:
+    """Tests for compiled ignore patterns."""
+
+    def test_matches_any_substring_literally(self):
+        """Test that the matcher behaves like `any(p in path for p in patterns)`."""
+        from codebase_indexer import compile_ignore_patterns
+
+        patterns = {"*.log", "build/", "a+b", "secret"}
+        matcher = compile_ignore_patterns(patterns)
+        paths = [
+            "/repo/app.log",
+            "/repo/x*.log",
+            "/repo/build/out.py",
+            "/repo/a+b.py",
+            "/repo/aab.py",
+            "/repo/secrets.py",
+            "/repo/main.py",
+        ]
+        for path in paths:
+            assert bool(matcher.search(path)) == any(p in path for p in patterns), path
+
+    def test_no_patterns_returns_none(self):
+        """Test that an empty pattern set never matches anything."""
+        from codebase_indexer import compile_ignore_patterns
+
+        assert compile_ignore_patterns(set()) is None
+        assert compile_ignore_patterns({""}) is None
+
+
+class TestIndexPipeline:
+    """Tests for the pipeline shared by full and incremental indexing."""
+
+    def test_index_changed_records_mtimes_and_upserts(self, tmp_path, monkeypatch):
+        """Test that incremental indexing upserts chunks and records each file's mtime."""
+        import codebase_indexer
+
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text(f"def {name[0]}():\n    return 1\n", encoding="utf-8")
+
+        metadata = MagicMock()
+        metadata.get_changed_files.side_effect = lambda files: files
+        monkeypatch.setattr(codebase_indexer, "IndexMetadata", lambda: metadata)
+
+        store = MagicMock()
+        store.get_chunk_hashes.return_value = {}
+        result = CodebaseIndexer(store).index_changed(tmp_path, set(), set())
+
+        assert result.startswith("Incrementally indexed 2 changed files")
+        recorded = {call.args[0] for call in metadata.update_file.call_args_list}
+        assert recorded == {str(tmp_path / "a.py"), str(tmp_path / "b.py")}
+        metadata.save.assert_called_once()
+        store.upsert.assert_called()
+        store.rebuild_bm25.assert_called_once()
+
+    def test_unchanged_chunks_are_not_reembedded(self, tmp_path):
+        """Test that chunks with a stored matching hash are skipped and stale ones deleted."""
+        file_path = tmp_path / "a.py"
+        file_path.write_text(
+            "def a():\n    return 1\n\n\ndef b():\n    return 2\n", encoding="utf-8"
+        )
+        store = MagicMock()
+        indexer = CodebaseIndexer(store)
+        chunks = indexer.read_and_split(file_path)
+
+        first = MagicMock()
+        assert indexer.add_chunks(file_path, chunks, first, {}) == 0
+        stored = {
+            call.args[2]: call.args[1]["content_hash"] for call in first.add_chunk.call_args_list
+        }
+        assert len(stored) == 2
+
+        a_id, b_id = stored
+        existing = {a_id: stored[a_id], b_id: "outdated", f"{file_path}_function_gone_0": "x"}
+        second = MagicMock()
+        assert (
+            indexer.add_chunks(file_path, indexer.read_and_split(file_path), second, existing) == 1
+        )
+
+        assert [call.args[2] for call in second.add_chunk.call_args_list] == [b_id]
+        store.delete.assert_called_once_with(ids=[f"{file_path}_function_gone_0"])
+
+    def test_unchanged_chunk_gets_fresh_line_range(self, tmp_path):
+        """Test that lines inserted above an unchanged chunk update its stored line range."""
+        file_path = tmp_path / "a.py"
+        file_path.write_text("def a():\n    return 1\n", encoding="utf-8")
+        store = MagicMock()
+        indexer = CodebaseIndexer(store)
+
+        first = MagicMock()
+        indexer.add_chunks(file_path, indexer.read_and_split(file_path), first, {})
+        ((_text, meta, chunk_id),) = [call.args for call in first.add_chunk.call_args_list]
+        assert meta["line_start"] == 1
+
+        file_path.write_text("import os\n\n\ndef a():\n    return 1\n", encoding="utf-8")
+        second = MagicMock()
+        existing = {chunk_id: meta["content_hash"]}
+        assert (
+            indexer.add_chunks(file_path, indexer.read_and_split(file_path), second, existing) == 1
+        )
+
+        assert chunk_id not in [call.args[2] for call in second.add_chunk.call_args_list]
+        ((ids, metas),) = [call.args for call in store.update_metadatas.call_args_list]
+        assert ids == [chunk_id]
+        assert metas[0]["line_start"] == 4
+        assert metas[0]["content_hash"] == meta["content_hash"]
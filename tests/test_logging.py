@@ -1,12 +1,14 @@
 """Tests for logging system"""
 
+import logging
 import os
 import sys
 
 sys.path.append(os.getcwd())
 
+import logger as logger_module
 from config import LOG_FILE
-from logger import get_logger, setup_logger
+from logger import flush_logger, get_logger, setup_logger
 
 
 def test_logger_setup() -> None:
@@ -37,6 +39,7 @@ def test_log_file_creation() -> None:
     logger.info("Test log message")
     logger.warning("Test warning message")
     logger.error("Test error message")
+    flush_logger()
 
     if LOG_FILE.exists():
         content = LOG_FILE.read_text(encoding="utf-8")
@@ -67,9 +70,11 @@ def test_log_rotation_config() -> None:
     """Test log rotation configuration"""
     print("Testing log rotation configuration...")
 
-    logger = get_logger()
+    get_logger()
+    listener = logger_module._listener
+    handlers = listener.handlers if listener is not None else ()
 
-    for handler in logger.handlers:
+    for handler in handlers:
         if hasattr(handler, "maxBytes"):
             assert handler.maxBytes == 10 * 1024 * 1024
             assert handler.backupCount == 5
@@ -81,6 +86,78 @@ def test_log_rotation_config() -> None:
     print("  [WARNING] No rotating file handler found")
 
 
+def test_file_writes_are_queued() -> None:
+    """Test that the logger only holds a QueueHandler for file output"""
+    from logging.handlers import QueueHandler, RotatingFileHandler
+
+    logger = get_logger()
+
+    assert not any(isinstance(h, RotatingFileHandler) for h in logger.handlers)
+    if logger_module._listener is not None:
+        assert any(isinstance(h, QueueHandler) for h in logger.handlers)
+
+
+def test_flush_after_listener_stopped() -> None:
+    """Test that flushing is a no-op once the listener has been stopped at exit"""
+    get_logger()
+    if logger_module._listener is None:
+        return
+
+    logger_module._stop_listener()
+    try:
+        assert not logger_module._listener_running
+        flush_logger()
+        assert not logger_module._listener_running
+    finally:
+        logger_module._start_listener()
+    assert logger_module._listener_running
+    flush_logger()
+
+
+def test_worker_logger_skips_file_handler(tmp_path, monkeypatch) -> None:
+    """Test that pool workers log to stderr only, never to the shared log file"""
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+    main_logger = get_logger()
+    main_handlers = list(main_logger.handlers)
+    file_handler = RotatingFileHandler(tmp_path / "worker.log")
+    listener = QueueListener(queue.SimpleQueue(), file_handler)
+    listener.start()
+    monkeypatch.setattr(logger_module, "_listener", listener)
+    monkeypatch.setattr(logger_module, "_listener_running", True)
+    try:
+        logger_module.setup_worker_logger("ProjectMindWorkerTest")
+        worker = get_logger()
+        assert worker.name == "ProjectMindWorkerTest"
+        assert [type(h) for h in worker.handlers] == [logging.StreamHandler]
+        assert not any(isinstance(h, (QueueHandler, RotatingFileHandler)) for h in worker.handlers)
+        # A listener inherited from the re-imported modules is stopped and closed
+        assert logger_module._listener is None
+        assert listener._thread is None
+        assert file_handler.stream is None
+    finally:
+        logger_module._logger = main_logger
+        main_logger.handlers[:] = main_handlers
+
+
+def test_setup_logger_in_spawned_process_skips_file_handler(monkeypatch) -> None:
+    """Test that setup_logger in a spawned child (e.g. __mp_main__) is stderr-only"""
+    import multiprocessing
+
+    main_logger = get_logger()
+    main_handlers = list(main_logger.handlers)
+    monkeypatch.setattr(multiprocessing.current_process(), "name", "SpawnProcess-1")
+    monkeypatch.setattr(logger_module, "_logger", None)
+    monkeypatch.setattr(logger_module, "_listener", None)
+    try:
+        worker = setup_logger("ProjectMindSpawnTest")
+        assert [type(h) for h in worker.handlers] == [logging.StreamHandler]
+        assert logger_module._listener is None
+    finally:
+        main_logger.handlers[:] = main_handlers
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("LOGGING SYSTEM TESTS")
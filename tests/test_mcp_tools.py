@@ -268,6 +268,617 @@ def test_memory_versioning() -> None:
     print("Memory versioning verification passed.")
 
 
+def test_tree_scan_prunes_and_caches(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "a.py").write_text("")
+    (tmp_path / "src" / "b.ts").write_text("")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "index.js").write_text("")
+    (tmp_path / "setup.py").write_text("")
+
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "_tree_scan_cache", {})
+
+    scan = mcp_server._get_tree_scan()
+    assert scan["per_dir_counts"] == {"src": 2}
+    assert scan["ext_histogram"] == {".py": 2, ".ts": 1}
+    assert scan["total_files"] == 3
+    assert scan["root_names"] == {"src", "node_modules", "setup.py"}
+    assert mcp_server._get_tree_scan() is scan
+
+    (tmp_path / "main.py").write_text("")
+    rescanned = mcp_server._get_tree_scan()
+    assert rescanned is not scan
+    assert rescanned["ext_histogram"][".py"] == 3
+
+
+def test_tree_scan_served_stale_while_rescanning(tmp_path, monkeypatch) -> None:
+    import threading
+
+    import config
+    import mcp_server
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "_tree_scan_cache", {})
+
+    scan = mcp_server._get_tree_scan()
+    scan["time"] -= mcp_server.STRUCTURE_CACHE_TTL + 1
+    # A change below the root leaves the root mtime, and so the cache key, unchanged
+    (tmp_path / "src" / "b.py").write_text("")
+
+    assert mcp_server._get_tree_scan() is scan
+    for thread in threading.enumerate():
+        if thread.name == "projectmind-tree-scan":
+            thread.join(timeout=5)
+
+    refreshed = mcp_server._get_tree_scan()
+    assert refreshed is not scan
+    assert refreshed["ext_histogram"] == {".py": 2}
+
+
+def test_project_structure_snapshot_hit_skips_lock(tmp_path, monkeypatch) -> None:
+    from unittest.mock import MagicMock
+
+    import config
+    import mcp_server
+
+    (tmp_path / "pyproject.toml").write_text("")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "_tree_scan_cache", {})
+    monkeypatch.setattr(mcp_server, "_structure_snapshot", None)
+
+    first = analyze_project_structure()
+    assert "- pyproject.toml" in first
+
+    lock = MagicMock()
+    monkeypatch.setattr(mcp_server, "_structure_cache_lock", lock)
+    assert analyze_project_structure() is first
+    lock.__enter__.assert_not_called()
+
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.setattr(config, "PROJECT_ROOT", other)
+    assert analyze_project_structure() != first
+    lock.__enter__.assert_called()
+
+
+def test_project_structure_follows_background_rescan(tmp_path, monkeypatch) -> None:
+    import threading
+
+    import config
+    import mcp_server
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "_tree_scan_cache", {})
+    monkeypatch.setattr(mcp_server, "_structure_snapshot", None)
+
+    assert "- `.py`: 1 files" in analyze_project_structure()
+    mcp_server._tree_scan_cache["time"] -= mcp_server.STRUCTURE_CACHE_TTL + 1
+    (tmp_path / "src" / "b.py").write_text("")
+
+    # The expired scan is still served once, but the snapshot doesn't outlive it
+    assert "- `.py`: 1 files" in analyze_project_structure()
+    for thread in threading.enumerate():
+        if thread.name == "projectmind-tree-scan":
+            thread.join(timeout=5)
+    assert "- `.py`: 2 files" in analyze_project_structure()
+
+
+def test_background_startup_runs_once(monkeypatch) -> None:
+    from unittest.mock import MagicMock
+
+    import mcp_server
+
+    check = MagicMock()
+    monkeypatch.setattr(mcp_server, "startup_check", check)
+    monkeypatch.setattr(mcp_server, "_startup_done", False)
+
+    thread = mcp_server.start_background_startup()
+    thread.join(timeout=5)
+    assert thread.daemon
+    assert mcp_server._startup_done is True
+
+    ensure_startup()
+    check.assert_called_once()
+
+
+def test_ingest_git_history_skips_known_hashes(monkeypatch) -> None:
+    from datetime import datetime
+    from unittest.mock import MagicMock
+
+    import mcp_server
+    from context import AppContext, reset_context, set_context
+    from git_utils import CommitInfo
+
+    commits = [
+        CommitInfo("b" * 40, "bbbbbbb", "New work", "Dev", datetime(2026, 1, 2)),
+        CommitInfo("a" * 40, "aaaaaaa", "Old work", "Dev", datetime(2026, 1, 1)),
+    ]
+    repo = MagicMock()
+    repo.iter_commits.return_value = iter(commits)
+    monkeypatch.setattr(mcp_server, "GitRepository", lambda: repo)
+
+    memory_manager = MagicMock()
+    memory_manager.read.return_value = (
+        "## Development Log (Git)\n- **2026-01-01 00:00** [aaaaaaa]: Old work (*Dev*)\n"
+    )
+    set_context(AppContext(MagicMock(), memory_manager, MagicMock(), None))
+    try:
+        assert ingest_git_history(limit=5) == "Ingested 1 new commits into memory."
+    finally:
+        reset_context()
+
+    entries = memory_manager.update.call_args.args[0]
+    assert "[bbbbbbb]" in entries
+    assert "[aaaaaaa]" not in entries
+
+
+def test_auto_update_memory_reuses_fetched_commits(monkeypatch) -> None:
+    from datetime import datetime
+    from unittest.mock import MagicMock
+
+    from context import AppContext, reset_context, set_context
+    from git_utils import CommitInfo
+
+    repo = MagicMock()
+    repo.get_commits.return_value = [
+        CommitInfo("c" * 40, "ccccccc", "Fix", "Dev", datetime(2026, 1, 3)),
+    ]
+    memory_manager = MagicMock()
+    memory_manager.read.return_value = "# Memory\n"
+    set_context(AppContext(MagicMock(), memory_manager, MagicMock(), repo))
+    try:
+        result = auto_update_memory_from_commits(days=7)
+    finally:
+        reset_context()
+
+    assert result == "Auto-update: Ingested 1 new commits into memory."
+    repo.get_commits.assert_called_once()
+    repo.iter_commits.assert_not_called()
+
+
+def test_index_ignore_patterns_reparsed_on_change(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    ignore_file = tmp_path / ".indexignore"
+    ignore_file.write_text("# comment\n*.log\n\nbuild/\n", encoding="utf-8")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    assert mcp_server.load_index_ignore_patterns() == {"*.log", "build/"}
+
+    ignore_file.write_text("*.tmp\n", encoding="utf-8")
+    os.utime(ignore_file, ns=(0, ignore_file.stat().st_mtime_ns + 1_000_000))
+    assert mcp_server.load_index_ignore_patterns() == {"*.tmp"}
+
+
+def test_complexity_pool_matches_serial(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    branches = "\n".join(f"    if x == {i}:\n        return {i}" for i in range(12))
+    for i in range(10):
+        (tmp_path / f"mod{i}.py").write_text(f"def f{i}(x):\n{branches}\n    return -1\n")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    monkeypatch.setattr(mcp_server, "COMPLEXITY_POOL_MIN_FILES", 10_000)
+    serial = mcp_server.analyze_code_complexity(".")
+    monkeypatch.setattr(mcp_server, "COMPLEXITY_POOL_MIN_FILES", 1)
+    monkeypatch.setattr(mcp_server, "_complexity_workers", lambda: 2)
+    monkeypatch.setattr(mcp_server, "log", lambda message: pytest.fail(message))
+    pooled = mcp_server.analyze_code_complexity(".")
+    pool = mcp_server._complexity_pool
+    assert pool is not None
+    assert mcp_server.analyze_code_complexity(".") == pooled
+    assert mcp_server._complexity_pool is pool
+
+    assert serial == pooled
+    assert "Files analyzed: 10" in pooled
+    assert "High complexity (>10): 10" in pooled
+
+    monkeypatch.setattr(mcp_server, "COMPLEXITY_MAX_FILES", 4)
+    assert "Files analyzed: 4" in mcp_server.analyze_code_complexity(".")
+
+    mcp_server._shutdown_complexity_pool()
+    assert mcp_server._complexity_pool is None
+
+
+def test_code_quality_stops_walk_at_max_files(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    for i in range(6):
+        (tmp_path / f"mod{i}.py").write_text(f'"""Module {i}."""\n')
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    walked = []
+    real_iter = mcp_server.iter_project_files
+
+    def counting_iter(*args, **kwargs):
+        for entry in real_iter(*args, **kwargs):
+            walked.append(entry.name)
+            yield entry
+
+    monkeypatch.setattr(mcp_server, "iter_project_files", counting_iter)
+
+    assert "Analyzing 2 files" in mcp_server.analyze_code_quality(".", max_files=2)
+    assert len(walked) == 2
+
+
+def test_code_quality_uses_pylint_jobs_for_many_files(tmp_path, monkeypatch) -> None:
+    from unittest.mock import MagicMock
+
+    import pylint.lint
+
+    import config
+    import mcp_server
+
+    for i in range(4):
+        (tmp_path / f"mod{i}.py").write_text(f'"""Module {i}."""\n')
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "_quality_cache", None)
+    run = MagicMock()
+    monkeypatch.setattr(pylint.lint, "Run", run)
+
+    monkeypatch.setattr(mcp_server.threading, "active_count", lambda: 1)
+    mcp_server.analyze_code_quality(".", max_files=4)
+    assert "--jobs=0" in run.call_args.args[0]
+
+    monkeypatch.setattr(mcp_server, "_quality_cache", None)
+    mcp_server.analyze_code_quality(".", max_files=mcp_server.QUALITY_JOBS_MIN_FILES - 1)
+    assert "--jobs=0" not in run.call_args.args[0]
+
+    # Never fork pylint workers while other threads are running, as in the server
+    monkeypatch.setattr(mcp_server.threading, "active_count", lambda: 3)
+    monkeypatch.setattr(mcp_server, "_quality_cache", None)
+    mcp_server.analyze_code_quality(".", max_files=4)
+    assert "--jobs=0" not in run.call_args.args[0]
+
+
+def test_code_quality_relints_set_when_a_file_changes(tmp_path, monkeypatch) -> None:
+    import pylint.lint
+
+    import config
+    import mcp_server
+
+    clean = tmp_path / "clean.py"
+    clean.write_text('"""Clean module."""\n')
+    messy = tmp_path / "messy.py"
+    messy.write_text('"""Messy module."""\nimport os\n')
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "_quality_cache", None)
+
+    linted: list[list[str]] = []
+    real_run = pylint.lint.Run
+
+    def recording_run(argv, **kwargs):
+        linted.append([arg for arg in argv if not arg.startswith("--")])
+        return real_run(argv, **kwargs)
+
+    monkeypatch.setattr(pylint.lint, "Run", recording_run)
+
+    first = mcp_server.analyze_code_quality(".")
+    assert "- Warnings: 1" in first
+    assert mcp_server.analyze_code_quality(".") == first
+    assert len(linted) == 1
+
+    # Messages can depend on the other files linted, so one change re-lints the whole set
+    messy.write_text('"""Messy module."""\nimport os\nimport sys\n')
+    assert "- Warnings: 2" in mcp_server.analyze_code_quality(".")
+    assert sorted(linted[-1]) == sorted([str(clean), str(messy)])
+
+    # A subset of the last run's unchanged files is still answered from the cache
+    assert "Analyzing 1 files" in mcp_server.analyze_code_quality(".", max_files=1)
+    assert len(linted) == 2
+
+    mcp_server.set_project_root(str(tmp_path))
+    assert mcp_server._quality_cache is None
+
+
+def test_project_overview_lists_root_entries(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    for name in ("src", "docs", ".hidden", "node_modules"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "src" / "app.py").write_text("")
+    (tmp_path / "README.md").write_text("")
+    (tmp_path / "package.json").write_text("{}")
+    (tmp_path / ".gitignore").write_text("")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "ensure_startup", lambda: None)
+
+    result = mcp_server.get_project_overview()
+    assert "- `docs/`\n- `src/`\n- ... and 3 files at root level" in result
+    assert "**Tech**: Node.js\n" in result
+    assert "## Config Files\n- `package.json`\n- `.gitignore`" in result
+    assert "hidden" not in result
+    assert "node_modules" not in result
+
+
+def test_project_overview_gathers_git_summary(tmp_path, monkeypatch) -> None:
+    import threading
+    from datetime import datetime
+
+    import config
+    import mcp_server
+    from git_utils import CommitInfo
+
+    caller = threading.current_thread()
+
+    class FakeRepository:
+        def get_commits(self, max_count, since_days):
+            # GitPython's Repo is not thread-safe; the overview must not hand it off
+            assert threading.current_thread() is caller
+            return [CommitInfo("abc1234567", "abc1234", "Ship it", "Dev", datetime(2024, 5, 1))]
+
+        def get_active_branch(self):
+            return "main"
+
+        def get_total_commit_count(self):
+            return 42
+
+    (tmp_path / "setup.py").write_text("")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "ensure_startup", lambda: None)
+    monkeypatch.setattr(mcp_server, "_get_git_repo_safe", FakeRepository)
+
+    result = mcp_server.get_project_overview()
+    assert "**Git**: branch `main`, 42+ commits\n**Tech**: Python (setup.py)" in result
+    assert "## Recent Activity (last 7 days)\n- 2024-05-01 [abc1234]: Ship it" in result
+    assert "## File Stats (total: 1)" in result
+
+
+def test_memory_sections_reread_only_after_change(tmp_path, monkeypatch) -> None:
+    from pathlib import Path
+
+    import config
+    import mcp_server
+
+    memory_file = tmp_path / "memory.md"
+    memory_file.write_text("# Memory\n## Status\n- ready\n", encoding="utf-8")
+    monkeypatch.setattr(config, "MEMORY_FILE", memory_file)
+
+    reads = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    assert mcp_server._read_memory_sections() == {"Status": "- ready"}
+    assert mcp_server._search_memory_for("READY") == ["- ready"]
+    assert mcp_server._search_memory_for("absent") == []
+    assert len(reads) == 1
+
+    memory_file.write_text("# Memory\n## Status\n- shipped\n", encoding="utf-8")
+    assert mcp_server._read_memory_sections() == {"Status": "- shipped"}
+    assert len(reads) == 2
+
+
+def test_startup_gitignore_matches_whole_entries(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    (tmp_path / ".git").mkdir()
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text(".aim/\n# .ai/\n**/__pycache__/", encoding="utf-8")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(config, "AI_DIR", tmp_path / ".ai")
+    monkeypatch.setattr(config, "MEMORY_FILE", tmp_path / ".ai" / "memory.md")
+
+    mcp_server.startup_check()
+    assert gitignore.read_text(encoding="utf-8") == ".aim/\n# .ai/\n**/__pycache__/\n.ai/\n"
+
+    mcp_server.startup_check()
+    assert gitignore.read_text(encoding="utf-8").count(".ai/\n") == 2
+
+    gitignore.unlink()
+    mcp_server.startup_check()
+    assert gitignore.read_text(encoding="utf-8") == ".ai/\n__pycache__/\n"
+
+
+def test_explore_directory_lists_tree(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x" * 2048)
+    (tmp_path / "pkg" / "sub" / "deep.py").write_text("")
+    (tmp_path / "B.txt").write_text("hi")
+    (tmp_path / "a.txt").write_text("")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "ensure_startup", lambda: None)
+
+    result = mcp_server.explore_directory(".", depth=2)
+    assert "pkg/\n  sub/\n  mod.py  (2.0KB)\na.txt  (0B)\nB.txt  (2B)" in result
+    assert "deep.py" not in result
+    assert "__pycache__" not in result
+
+
+def test_file_summary_streams_large_files(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    module = tmp_path / "mod.py"
+    module.write_text("import os\n\nclass A:\n    def f(self):\n        pass\n", encoding="utf-8")
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "ensure_startup", lambda: None)
+    monkeypatch.setattr(mcp_server, "_get_git_repo_safe", lambda: None)
+
+    in_memory = mcp_server.get_file_summary("mod.py", max_lines=2)
+    assert "**Lines**: 6" in in_memory
+    assert "**Classes**: `A`" in in_memory
+    assert "import os\n\n```\n\n... (4 more lines)" in in_memory
+
+    monkeypatch.setattr(mcp_server, "SUMMARY_STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(config, "safe_read_text", lambda path: pytest.fail("read whole file"))
+    assert mcp_server.get_file_summary("mod.py", max_lines=2) == in_memory
+
+
+def test_file_summary_extracts_structure(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    (tmp_path / "mod.py").write_text(
+        "from a import b  \nimport os\nclass Base(object):\n    def run(\n        self):\n"
+        "    async def later(self): ...\nclassic = 1\n# import nothing\n"
+        '"""\n    class instances are cached per key\n    def ault settings apply\n"""\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "app.ts").write_text(
+        "import x from 'x'\nconst fs = require('fs')\nexport async function go() {}\n"
+        "function helper() {}\nconst cb = async function () {}\nconst y = 1\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(mcp_server, "ensure_startup", lambda: None)
+    monkeypatch.setattr(mcp_server, "_get_git_repo_safe", lambda: None)
+
+    summary = mcp_server.get_file_summary("mod.py", max_lines=0)
+    assert "**Imports** (2):\n  - `from a import b`\n  - `import os`" in summary
+    assert "**Classes**: `Base`" in summary
+    assert "**Functions** (1):\n  - `run`" in summary
+
+    summary = mcp_server.get_file_summary("app.ts", max_lines=0)
+    assert "**Imports** (2):\n  - `import x from 'x'`\n  - `const fs = require('fs')`" in summary
+    assert "**Exports** (1):\n  - `export async function go() {}`" in summary
+    assert "const y" not in summary
+
+    functions = []
+    for line in ("async function load() {}", "const cb = async function () {}", "// async fn"):
+        match = mcp_server._JS_STRUCTURE_RE.match(line)
+        functions.append(match is not None and match.lastindex == 3)
+    assert functions == [True, False, False]
+
+
+def test_git_repo_probe_cached_per_project_root(tmp_path, monkeypatch) -> None:
+    import config
+    import mcp_server
+
+    opened = []
+
+    class FakeRepository:
+        def _get_repo(self):
+            opened.append(config.PROJECT_ROOT)
+            raise RuntimeError("not a git repository")
+
+    monkeypatch.setattr(mcp_server, "GitRepository", FakeRepository)
+    monkeypatch.setattr(mcp_server, "_git_repo_probe", None)
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    assert mcp_server._get_git_repo_safe() is None
+    assert mcp_server._get_git_repo_safe() is None
+    assert opened == [tmp_path]
+
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path / "other")
+    assert mcp_server._get_git_repo_safe() is None
+    assert opened == [tmp_path, tmp_path / "other"]
+
+    # `git init` in the same session makes the next call probe again
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+    mcp_server._get_git_repo_safe()
+    (tmp_path / ".git").mkdir()
+    monkeypatch.setattr(FakeRepository, "_get_repo", lambda self: None)
+    assert isinstance(mcp_server._get_git_repo_safe(), FakeRepository)
+    assert mcp_server._get_git_repo_safe() is mcp_server._git_repo_probe[1]
+
+
+def test_coverage_percentage_read_from_htmlcov(tmp_path, monkeypatch) -> None:
+    import config
+
+    htmlcov = tmp_path / "htmlcov"
+    htmlcov.mkdir()
+    (htmlcov / "index.html").write_text(
+        '<html><h1>Coverage report: <span class="pc_cov">87%</span></h1></html>',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    assert "**Overall Coverage**: 87%" in get_test_coverage_info()
+
+    (htmlcov / "index.html").write_text("", encoding="utf-8")
+    result = get_test_coverage_info()
+    assert "Overall Coverage" not in result
+    assert "htmlcov/index.html" in result
+
+
+def test_extract_tech_stack_reads_package_json(tmp_path, monkeypatch) -> None:
+    import json
+
+    import config
+
+    deps = {f"pkg{i}": f"^{i}.0.0" for i in range(17)}
+    (tmp_path / "package.json").write_bytes(
+        json.dumps({"name": "app", "dependencies": deps}).encode("utf-8")
+    )
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    result = extract_tech_stack()
+    assert "## JavaScript/Node.js Project" in result
+    assert "- pkg0: ^0.0.0" in result
+    assert "... and 2 more" in result
+
+
+def test_extract_tech_stack_parses_pyproject(tmp_path, monkeypatch) -> None:
+    import config
+
+    (tmp_path / "pyproject.toml").write_text(
+        "[project]\n"
+        'name = "app"\n'
+        "dependencies = [\n"
+        '    "requests>=2.0",  # inline comment\n'
+        '    "rich[jupyter]>=13", "click",\n'
+        "]\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    result = extract_tech_stack()
+    assert "## Python Project" in result
+    assert "- requests>=2.0\n" in result
+    assert "- rich[jupyter]>=13" in result
+    assert "- click" in result
+
+
+def test_extract_tech_stack_parses_poetry_dependencies(tmp_path, monkeypatch) -> None:
+    import config
+
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.poetry.dependencies]\n"
+        'python = "^3.10"\n'
+        'httpx = { version = "^0.27", extras = ["http2"] }\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    result = extract_tech_stack()
+    assert "- python: ^3.10" in result
+    assert "- httpx" in result
+
+
+def test_extract_tech_stack_reads_requirements(tmp_path, monkeypatch) -> None:
+    import config
+
+    (tmp_path / "requirements.txt").write_bytes(
+        b"# pinned\r\nrequests==2.31\r\n\r\n  # indented comment\r\n  click\r\n"
+    )
+    monkeypatch.setattr(config, "PROJECT_ROOT", tmp_path)
+
+    result = extract_tech_stack()
+    assert result.endswith("**Dependencies:**\n- requests==2.31\n- click")
+
+
 if __name__ == "__main__":
     try:
         test_memory_tools()
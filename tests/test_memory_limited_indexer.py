@@ -46,6 +46,22 @@ class TestMemoryLimitedIndexer(unittest.TestCase):
 
         self.assertEqual(indexer.total_chunks, 2)
 
+    def test_max_chunks_flushes_full_batches(self):
+        """Test that the chunk cap streams fixed-size batches before memory fills up"""
+        batch_sizes = []
+        indexer = MemoryLimitedIndexer(
+            self.max_memory, lambda docs, metas, ids: batch_sizes.append(len(docs)), max_chunks=3
+        )
+
+        for i in range(7):
+            indexer.add_chunk(f"doc{i}", {"source": "file.py"}, f"id{i}")
+
+        self.assertEqual(batch_sizes, [3, 3])
+        self.assertEqual(len(indexer.documents), 1)
+
+        indexer.flush()
+        self.assertEqual(batch_sizes, [3, 3, 1])
+
     def test_flush_calls_callback(self):
         """Test that flush calls the callback with correct data"""
         received_data = []
@@ -0,0 +1,148 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory_manager import MemoryManager
+
+
+class TestMemoryManagerUpdate(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary memory file"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.memory_file = Path(self.tmp.name) / "memory.md"
+        self.memory_file.write_text("# Project Memory\n", encoding="utf-8")
+        self.manager = MemoryManager(self.memory_file)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_update_appends_section(self):
+        """Test that update appends an Update block at the end of the file"""
+        result = self.manager.update("- first entry", section="Notes")
+
+        self.assertEqual(result, "Memory updated successfully.")
+        self.assertEqual(
+            self.memory_file.read_text(encoding="utf-8"),
+            "# Project Memory\n\n\n### Update (Notes)\n- first entry",
+        )
+
+    def test_update_skips_duplicate(self):
+        """Test that identical content in the same section is not appended twice"""
+        self.manager.update("- same entry", section="Notes")
+        before = self.memory_file.read_text(encoding="utf-8")
+
+        result = self.manager.update("- same entry", section="Notes")
+
+        self.assertIn("duplicate", result)
+        self.assertEqual(self.memory_file.read_text(encoding="utf-8"), before)
+
+    def test_clear_keeps_template(self):
+        """Test that clear rewrites the shared memory template"""
+        self.manager.update("- first entry", section="Notes")
+
+        self.assertEqual(self.manager.clear(), "Memory cleared (template preserved).")
+        content = self.memory_file.read_text(encoding="utf-8")
+        self.assertTrue(content.startswith("# Project Memory\n\n## Status\n"))
+        self.assertTrue(content.endswith("## Recent Decisions\n- Memory cleared.\n"))
+
+    def test_update_rejects_unencodable_content(self):
+        """Test that an entry UTF-8 cannot encode is reported instead of silently trimmed"""
+        result = self.manager.update("- lone \ud800 surrogate", section="Notes")
+
+        self.assertTrue(result.startswith("Error updating memory:"))
+        self.assertEqual(self.memory_file.read_text(encoding="utf-8"), "# Project Memory\n")
+
+    def test_update_missing_file(self):
+        """Test that update reports a missing memory file"""
+        self.memory_file.unlink()
+        self.assertEqual(self.manager.update("- entry"), "Memory file not found.")
+
+
+class TestMemoryManagerDeleteSection(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary memory file with nested sections"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.memory_file = Path(self.tmp.name) / "memory.md"
+        self.manager = MemoryManager(self.memory_file)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_delete_section_with_subsections(self):
+        """Test that a section and its deeper headers are removed up to the next peer"""
+        self.memory_file.write_text(
+            "# Project Memory\n\n## Notes\n- a\n### Sub\n- b\n## Keep\n- c\n",
+            encoding="utf-8",
+        )
+
+        result = self.manager.delete_section("notes")
+
+        self.assertIn("deleted successfully", result)
+        self.assertEqual(
+            self.memory_file.read_text(encoding="utf-8"),
+            "# Project Memory\n\n## Keep\n- c\n",
+        )
+
+    def test_delete_every_matching_section_through_eof(self):
+        """Test that all matching sections go, including one that runs to the end"""
+        self.memory_file.write_text(
+            "# Memory\n## Update (Notes)\n- x\n## Keep\n- y\n### Update (Notes)\n- z",
+            encoding="utf-8",
+        )
+
+        self.manager.delete_section("Update (Notes)")
+
+        self.assertEqual(self.memory_file.read_text(encoding="utf-8"), "# Memory\n## Keep\n- y")
+
+
+class TestMemoryManagerVersions(unittest.TestCase):
+    def setUp(self):
+        """Create a memory file with its own history directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.memory_file = Path(self.tmp.name) / "memory.md"
+        self.memory_file.write_text("# Project Memory\n", encoding="utf-8")
+        self.manager = MemoryManager(self.memory_file)
+        self.manager.history_dir = Path(self.tmp.name) / "memory_history"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_list_versions_reused_until_history_changes(self):
+        """Test that the listing is cached by directory mtime and refreshed on save"""
+        self.assertEqual(self.manager.list_versions(), "No memory versions found")
+
+        self.manager.save_version("first")
+        listing = self.manager.list_versions()
+        self.assertIn(": first", listing)
+
+        with patch("memory_manager.json.loads", side_effect=AssertionError("re-read")):
+            self.assertEqual(self.manager.list_versions(), listing)
+
+        # Same-second saves overwrite the existing .meta.json without a new directory entry
+        self.manager.save_version("second")
+        self.assertIn(": second", self.manager.list_versions())
+
+    def test_restore_skips_backup_when_memory_matches_latest(self):
+        """Test that restoring does not back up memory already saved as the newest version"""
+        self.manager.save_version("base")
+        (version_file,) = self.manager.history_dir.glob("memory_*.md")
+        timestamp = version_file.stem.removeprefix("memory_")
+
+        with patch.object(self.manager, "save_version") as save_version:
+            self.manager.restore_version(timestamp)
+            save_version.assert_not_called()
+
+            self.manager.update("- changed", section="Notes")
+            self.manager.restore_version(timestamp)
+            save_version.assert_called_once_with(description="Auto-backup before restore")
+
+        self.assertEqual(self.memory_file.read_text(encoding="utf-8"), "# Project Memory\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -41,6 +41,16 @@ def mock_vector_store() -> MagicMock:
         "ttl_seconds": 300,
         "hit_rate": "33.33%",
     }
+    store.get_semantic_cache_stats.return_value = {
+        "hits": 2,
+        "misses": 8,
+        "size": 8,
+        "max_size": 512,
+        "expirations": 0,
+        "ttl_seconds": 300,
+        "threshold": 0.95,
+        "hit_rate": "20.00%",
+    }
     return store
 
 
@@ -137,6 +147,38 @@ class TestSearchCodebase:
         result = search_codebase("test")
         assert "not initialized" in result.lower()
 
+    def test_search_multiple_queries_batched(
+        self, mock_context: AppContext, mock_vector_store: MagicMock
+    ) -> None:
+        """Test that extra queries share a single batched store call."""
+        from mcp_server import search_codebase
+
+        mock_vector_store.hybrid_query_many.return_value = [
+            {
+                "documents": [["def hello():\n    pass"]],
+                "metadatas": [[{"source": "test.py"}]],
+                "distances": [[0.1]],
+            },
+            {"documents": [[]], "metadatas": [[]], "distances": [[]]},
+        ]
+        with patch("mcp_server._check_index_ready", return_value=None):
+            result = search_codebase("hello", queries=["world", "hello", "  "])
+
+        mock_vector_store.hybrid_query_many.assert_called_once_with(["hello", "world"], n_results=5)
+        mock_vector_store.hybrid_query.assert_not_called()
+        assert "# SEARCH: hello" in result
+        assert "test.py" in result
+        assert "# SEARCH: world" in result
+        assert "No matches found" in result
+
+    def test_search_too_many_queries(self, mock_context: AppContext) -> None:
+        """Test that the batch size is capped."""
+        from mcp_server import MAX_BATCH_QUERIES, search_codebase
+
+        extra = [f"query {i}" for i in range(MAX_BATCH_QUERIES)]
+        result = search_codebase("test", queries=extra)
+        assert "Error" in result
+
 
 class TestSearchCodebaseAdvanced:
     """Tests for search_codebase_advanced function."""
@@ -180,6 +222,55 @@ class TestSearchCodebaseAdvanced:
         assert "src/main.py" in result
         assert "tests/test.py" not in result
 
+    def test_advanced_search_min_relevance(
+        self, mock_context: AppContext, mock_vector_store: MagicMock
+    ) -> None:
+        """Test that results under min_relevance are dropped and n_results is honoured."""
+        from mcp_server import search_codebase_advanced
+
+        mock_vector_store.hybrid_query.return_value = {
+            "documents": [["close", "far", "closer"]],
+            "metadatas": [[{"source": "a.py"}, {"source": "b.py"}, {"source": "c.py"}]],
+            "distances": [[0.2, 1.5, 0.1]],
+        }
+        with patch("mcp_server._check_index_ready", return_value=None):
+            result = search_codebase_advanced("test", n_results=1, min_relevance=0.5)
+        assert "a.py (relevance: 0.90)" in result
+        assert "b.py" not in result
+        assert "c.py" not in result
+
+    def test_exclude_dirs_match_whole_path_components(self) -> None:
+        """Test that exclude_dirs matches directory names, not substrings."""
+        from mcp_server import should_include_search_result
+
+        assert not should_include_search_result("tests/a.py", 1.0, None, ["tests"], 0.0)
+        assert should_include_search_result("contests/a.py", 1.0, None, ["tests"], 0.0)
+        assert should_include_search_result("src/a.py", 1.0, frozenset({".py"}), None, 0.0)
+        assert not should_include_search_result("src/a.js", 1.0, frozenset({".py"}), None, 0.0)
+
+    def test_search_result_filter_combinations(self) -> None:
+        """Test the specialized filter for every combination of active filters."""
+        from itertools import product
+        from pathlib import Path
+
+        from mcp_server import make_search_result_filter
+
+        def reference(source, relevance, file_types, exclude_dirs, min_relevance):
+            if min_relevance > 0 and relevance < min_relevance:
+                return False
+            if file_types and Path(source).suffix not in file_types:
+                return False
+            return not (exclude_dirs and any(d in Path(source).parts for d in exclude_dirs))
+
+        sources = ["src/a.py", "tests/b.py", "src/c.js", "docs/tests.md"]
+        for file_types, exclude_dirs, min_relevance in product(
+            [None, [".py"]], [None, ["tests"]], [0.0, 0.5]
+        ):
+            include = make_search_result_filter(file_types, exclude_dirs, min_relevance)
+            for source, relevance in product(sources, [0.2, 0.9]):
+                expected = reference(source, relevance, file_types, exclude_dirs, min_relevance)
+                assert include(source, relevance) is expected
+
 
 class TestGetIndexStats:
     """Tests for get_index_stats function."""
@@ -235,4 +326,56 @@ class TestGetCacheStats:
         assert "CACHE STATISTICS" in result
         assert "File Cache" in result
         assert "Query Cache" in result
+        assert "Semantic Query Cache" in result
         assert "Hit Rate" in result
+
+
+class TestHybridQueryCache:
+    """Tests for the semantic cache behind hybrid search."""
+
+    @staticmethod
+    def _store():
+        from vector_store_manager import VectorStoreManager
+
+        store = VectorStoreManager()
+        bm25 = MagicMock()
+        bm25.is_ready = True
+        bm25.search.side_effect = lambda text, n: [
+            {"id": f"kw:{text.split()[0]}", "text": text, "metadata": {}}
+        ]
+        store._bm25_index = bm25
+        # Near-identical queries share one embedding, as identifier-only variants tend to
+        store.embed = MagicMock(side_effect=lambda texts: [[1.0, 0.0] for _ in texts])
+        store.query = MagicMock(
+            side_effect=lambda texts, n_results, query_embeddings=None: {
+                "ids": [["dense"] for _ in texts],
+                "documents": [["body"] for _ in texts],
+                "metadatas": [[{}] for _ in texts],
+                "distances": [[0.1] for _ in texts],
+            }
+        )
+        return store, store.query
+
+    def test_similar_query_reuses_dense_results_only(self) -> None:
+        """Test that a near-duplicate query gets its own BM25 hits over cached dense results."""
+        store, query = self._store()
+
+        first = store.hybrid_query(["FooBar parser"])
+        second = store.hybrid_query(["FooBaz parser"])
+
+        assert query.call_count == 1
+        assert "kw:FooBar" in first["ids"][0]
+        assert "kw:FooBaz" in second["ids"][0]
+        assert "kw:FooBar" not in second["ids"][0]
+
+    def test_batched_queries_fuse_per_text(self) -> None:
+        """Test that hybrid_query_many fuses cached dense rows with each text's BM25 hits."""
+        store, query = self._store()
+        store.hybrid_query(["FooBar parser"])
+
+        results = store.hybrid_query_many(["FooBaz parser", "FooQux parser"])
+
+        assert query.call_count == 1
+        assert ["kw:FooBaz" in r["ids"][0] for r in results] == [True, False]
+        assert "kw:FooQux" in results[1]["ids"][0]
+        assert all("dense" in r["ids"][0] for r in results)
@@ -90,8 +90,8 @@ def test_metadata_save_load() -> None:
 
     metadata = IndexMetadata()
 
-    metadata.update_file("test_file.py", 1234567890.0)
-    metadata.update_file("another_file.js", 9876543210.0)
+    metadata.update_file("test_file.py", 1234567890123456789)
+    metadata.update_file("another_file.js", 1734567890987654321)
 
     metadata.save()
 
@@ -99,8 +99,8 @@ def test_metadata_save_load() -> None:
 
     new_metadata = IndexMetadata()
 
-    assert new_metadata.get_file_mtime("test_file.py") == 1234567890.0
-    assert new_metadata.get_file_mtime("another_file.js") == 9876543210.0
+    assert new_metadata.get_file_mtime("test_file.py") == 1234567890123456789
+    assert new_metadata.get_file_mtime("another_file.js") == 1734567890987654321
 
     print("  [OK] Metadata save/load works correctly")
 
@@ -94,6 +94,23 @@ def test_nonexistent_file() -> None:
         print("  [OK] Nonexistent file properly rejected")
 
 
+def test_newlines_match_read_text() -> None:
+    """Test that CRLF and CR line endings are normalized like Path.read_text"""
+    print("Testing line ending normalization...")
+
+    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".txt") as f:
+        f.write(b"one\r\ntwo\rthree\n")
+        temp_path = Path(f.name)
+
+    try:
+        content = safe_read_text(temp_path)
+        assert content == "one\ntwo\nthree\n"
+        assert content == temp_path.read_text(encoding="utf-8")
+        print("  [OK] Line endings normalized")
+    finally:
+        temp_path.unlink()
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("UNICODE HANDLING TESTS")
@@ -106,6 +123,7 @@ if __name__ == "__main__":
         test_latin1_file()
         test_windows1252_file()
         test_nonexistent_file()
+        test_newlines_match_read_text()
 
         print()
         print("=" * 50)
@@ -4,7 +4,7 @@ from typing import Any
 
 import config
 from bm25_index import BM25Index, reciprocal_rank_fusion
-from cache_manager import TTLCache
+from cache_manager import SemanticCache, TTLCache
 from logger import get_logger
 
 logger = get_logger()
@@ -29,6 +29,7 @@ class VectorStoreManager:
         self.embedding_fn: Any = None
         self._initialized = False
         self._query_cache = TTLCache(ttl_seconds=300, max_size=100)
+        self._semantic_cache = SemanticCache(threshold=0.95, max_size=512, ttl_seconds=300)
         self._bm25_index = BM25Index(config.BM25_INDEX_PATH)
 
     def initialize(self) -> bool:
@@ -51,11 +52,17 @@ class VectorStoreManager:
             class LocalSentenceTransformerEmbeddingFunction(embedding_functions.EmbeddingFunction):  # type: ignore[type-arg]
                 def __init__(self, model_name: str) -> None:
                     logger.info(f"Loading SentenceTransformer model '{model_name}'...")
+                    # device=None lets sentence-transformers pick CUDA/MPS when available
                     self.model = SentenceTransformer(model_name)
-                    logger.info("Model loaded successfully")
+                    logger.info("Model loaded successfully on %s", self.model.device)
 
                 def __call__(self, input: list[str]) -> list[list[float]]:  # type: ignore[override]
-                    return self.model.encode(input).tolist()  # type: ignore[return-value]
+                    return self.model.encode(  # type: ignore[return-value]
+                        input,
+                        batch_size=config.EMBEDDING_BATCH_SIZE,
+                        convert_to_numpy=True,
+                        show_progress_bar=False,
+                    ).tolist()
 
             self.chroma_client = chromadb.PersistentClient(path=str(config.VECTOR_STORE_DIR))
             logger.info("ChromaDB client initialized")
@@ -104,6 +111,7 @@ class VectorStoreManager:
                 metadata={"hnsw:space": "cosine"},
             )
             self._bm25_index.clear()
+            self._semantic_cache.clear()
             logger.info(f"Collection '{self.collection_name}' cleared successfully")
             return None
         except Exception as e:
@@ -133,6 +141,7 @@ class VectorStoreManager:
         n_results: int = 5,
         where: dict[str, Any] | None = None,
         where_document: dict[str, Any] | None = None,
+        query_embeddings: list[list[float]] | None = None,
     ) -> dict[str, Any] | None:
         """
         Queries the vector store with caching.
@@ -142,6 +151,7 @@ class VectorStoreManager:
             n_results: Number of results to return
             where: Optional metadata filter
             where_document: Optional document content filter
+            query_embeddings: Precomputed embeddings of query_texts (skips re-embedding)
 
         Returns:
             Query results or None if query failed
@@ -149,7 +159,7 @@ class VectorStoreManager:
         cache_key = self._generate_cache_key(query_texts, n_results, where, where_document)
         cached_result = self._query_cache.get(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for query: {query_texts[0][:50]}...")
+            logger.debug("Cache hit for query: %.50s...", query_texts[0])
             return cached_result
 
         coll = self.get_collection()
@@ -157,12 +167,20 @@ class VectorStoreManager:
             return None
 
         try:
-            result: dict[str, Any] = coll.query(
-                query_texts=query_texts,
-                n_results=n_results,
-                where=where,
-                where_document=where_document,
-            )
+            if query_embeddings is not None:
+                result: dict[str, Any] = coll.query(
+                    query_embeddings=query_embeddings,
+                    n_results=n_results,
+                    where=where,
+                    where_document=where_document,
+                )
+            else:
+                result = coll.query(
+                    query_texts=query_texts,
+                    n_results=n_results,
+                    where=where,
+                    where_document=where_document,
+                )
             self._query_cache.put(cache_key, result)
             return result
         except Exception as e:
@@ -206,6 +224,33 @@ class VectorStoreManager:
         """
         return self._query_cache.get_stats()
 
+    def get_semantic_cache_stats(self) -> dict[str, Any]:
+        """
+        Returns semantic (embedding similarity) query cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        return self._semantic_cache.get_stats()
+
+    def embed(self, texts: list[str]) -> list[list[float]] | None:
+        """
+        Embeds texts with the collection's embedding function.
+
+        Args:
+            texts: Strings to embed
+
+        Returns:
+            One embedding per text, or None if the embedding function is unavailable
+        """
+        if self.get_collection() is None or self.embedding_fn is None:
+            return None
+        try:
+            return [list(vector) for vector in self.embedding_fn(texts)]
+        except Exception as e:
+            logger.error(f"Error embedding query: {e}")
+            return None
+
     def upsert(self, documents: list[str], metadatas: list[dict], ids: list[str]) -> bool:
         """
         Upserts documents into the collection.
@@ -224,11 +269,81 @@ class VectorStoreManager:
 
         try:
             coll.upsert(documents=documents, metadatas=metadatas, ids=ids)
+            self._semantic_cache.clear()
             return True
         except Exception as e:
             logger.error(f"Error upserting to collection: {e}", exc_info=True)
             return False
 
+    def get_chunk_hashes(self, source: str) -> dict[str, str]:
+        """
+        Fetches the stored content hash of every chunk from one source file.
+
+        Args:
+            source: Source path as stored in chunk metadata
+
+        Returns:
+            Mapping of chunk ID to content hash ("" for chunks indexed without one)
+        """
+        coll = self.get_collection()
+        if coll is None:
+            return {}
+        try:
+            result = coll.get(where={"source": source}, include=["metadatas"])
+        except Exception as e:
+            logger.error(f"Error fetching chunk hashes for {source}: {e}")
+            return {}
+        metas = result.get("metadatas") or []
+        return {
+            doc_id: str((meta or {}).get("content_hash", ""))
+            for doc_id, meta in zip(result.get("ids", []), metas, strict=True)
+        }
+
+    def delete(self, ids: list[str]) -> bool:
+        """
+        Deletes documents by ID.
+
+        Args:
+            ids: Document IDs to delete
+
+        Returns:
+            True if successful, False otherwise
+        """
+        coll = self.get_collection()
+        if coll is None:
+            return False
+
+        try:
+            coll.delete(ids=ids)
+            self._semantic_cache.clear()
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting from collection: {e}", exc_info=True)
+            return False
+
+    def update_metadatas(self, ids: list[str], metadatas: list[dict[str, Any]]) -> bool:
+        """
+        Replaces the metadata of stored documents without re-embedding them.
+
+        Args:
+            ids: Document IDs to update
+            metadatas: New metadata for each ID, in the same order
+
+        Returns:
+            True if successful, False otherwise
+        """
+        coll = self.get_collection()
+        if coll is None:
+            return False
+
+        try:
+            coll.update(ids=ids, metadatas=metadatas)
+            self._semantic_cache.clear()
+            return True
+        except Exception as e:
+            logger.error(f"Error updating collection metadata: {e}", exc_info=True)
+            return False
+
     def get_all_documents(self) -> tuple[list[str], list[str], list[dict[str, Any]]]:
         """
         Fetches all documents from ChromaDB for BM25 rebuild.
@@ -260,6 +375,7 @@ class VectorStoreManager:
             return
         self._bm25_index.build(ids, docs, metas)
         self._bm25_index.save()
+        self._semantic_cache.clear()
 
     def hybrid_query(
         self,
@@ -287,34 +403,138 @@ class VectorStoreManager:
         cache_key = "hybrid_" + self._generate_cache_key(query_texts, n_results, None, None)
         cached = self._query_cache.get(cache_key)
         if cached is not None:
-            logger.debug(f"Hybrid cache hit for: {query_texts[0][:50]}")
+            logger.debug("Hybrid cache hit for: %.50s", query_texts[0])
             return cached
 
         fetch_n = min(n_results * 3, 50)
         query_text = query_texts[0]
+        # Only the dense results are shared between similar queries: BM25 keys on the
+        # exact tokens, so "FooBar parser" must not reuse the keyword hits of "FooBaz parser"
+        namespace = f"dense_{fetch_n}"
+
+        embeddings = self.embed([query_text])
+        vector_raw = None
+        if embeddings is not None:
+            vector_raw = self._semantic_cache.get(embeddings[0], namespace)
+            if vector_raw is not None:
+                logger.debug("Semantic cache hit for: %.50s", query_text)
+        if vector_raw is None:
+            vector_raw = self.query([query_text], n_results=fetch_n, query_embeddings=embeddings)
+            if embeddings is not None and vector_raw is not None:
+                self._semantic_cache.put(embeddings[0], vector_raw, namespace)
+
+        result = self._fuse_hybrid(query_text, vector_raw, 0, fetch_n, n_results)
+        self._query_cache.put(cache_key, result)
+        return result
+
+    def hybrid_query_many(
+        self, query_texts: list[str], n_results: int = 5
+    ) -> list[dict[str, Any] | None]:
+        """
+        Runs several independent hybrid searches with a single vector store round-trip.
+
+        Queries missing from the exact and semantic caches are embedded and searched in
+        one batched ChromaDB call, then each is fused with its own BM25 results.
+
+        Args:
+            query_texts: Query strings, each searched independently
+            n_results: Number of results to return per query
 
-        vector_raw = self.query(query_texts, n_results=fetch_n)
+        Returns:
+            One ChromaDB-format result (or None on failure) per query, in input order
+        """
+        if not self._bm25_index.is_ready:
+            raw = self.query(query_texts, n_results)
+            if raw is None:
+                return [None] * len(query_texts)
+            return [self._slice_result(raw, i) for i in range(len(query_texts))]
+
+        results: list[dict[str, Any] | None] = [None] * len(query_texts)
+        cache_keys: list[str] = []
+        pending: list[int] = []
+        for i, text in enumerate(query_texts):
+            key = "hybrid_" + self._generate_cache_key([text], n_results, None, None)
+            cache_keys.append(key)
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        if not pending:
+            return results
+
+        fetch_n = min(n_results * 3, 50)
+        namespace = f"dense_{fetch_n}"
+        # Dense results per pending query as (raw result, row); BM25 always runs per text
+        dense: dict[int, tuple[dict[str, Any], int]] = {}
+        embeddings = self.embed([query_texts[i] for i in pending])
+        to_search = pending
+        search_embeddings = embeddings
+        if embeddings is not None:
+            to_search = []
+            search_embeddings = []
+            for i, embedding in zip(pending, embeddings, strict=True):
+                similar = self._semantic_cache.get(embedding, namespace)
+                if similar is not None:
+                    dense[i] = (similar, 0)
+                else:
+                    to_search.append(i)
+                    search_embeddings.append(embedding)
+
+        if to_search:
+            vector_raw = self.query(
+                [query_texts[i] for i in to_search],
+                n_results=fetch_n,
+                query_embeddings=search_embeddings,
+            )
+            if vector_raw is not None:
+                for row, i in enumerate(to_search):
+                    dense[i] = (vector_raw, row)
+                    if search_embeddings is not None:
+                        self._semantic_cache.put(
+                            search_embeddings[row], self._slice_result(vector_raw, row), namespace
+                        )
+
+        for i in pending:
+            if i not in dense:
+                continue
+            raw, row = dense[i]
+            fused = self._fuse_hybrid(query_texts[i], raw, row, fetch_n, n_results)
+            self._query_cache.put(cache_keys[i], fused)
+            results[i] = fused
+        return results
+
+    @staticmethod
+    def _slice_result(raw: dict[str, Any], row: int) -> dict[str, Any]:
+        """Extracts the results of the `row`-th query from a batched ChromaDB result."""
+        sliced: dict[str, Any] = {}
+        for key in ("ids", "documents", "metadatas", "distances"):
+            values = raw.get(key)
+            sliced[key] = [values[row]] if values and row < len(values) else [[]]
+        return sliced
+
+    def _fuse_hybrid(
+        self,
+        query_text: str,
+        vector_raw: dict[str, Any] | None,
+        row: int,
+        fetch_n: int,
+        n_results: int,
+    ) -> dict[str, Any]:
+        """Merges the `row`-th vector result with BM25 results for `query_text` via RRF."""
         vector_items: list[dict[str, Any]] = []
-        if vector_raw and vector_raw.get("ids") and vector_raw["ids"][0]:
-            for i, doc_id in enumerate(vector_raw["ids"][0]):
+        if vector_raw and vector_raw.get("ids") and row < len(vector_raw["ids"]):
+            documents = vector_raw.get("documents")
+            metadatas = vector_raw.get("metadatas")
+            distances = vector_raw.get("distances")
+            for i, doc_id in enumerate(vector_raw["ids"][row]):
                 vector_items.append(
                     {
                         "id": doc_id,
-                        "text": (
-                            (vector_raw.get("documents") or [[]])[0][i]
-                            if vector_raw.get("documents")
-                            else ""
-                        ),
-                        "metadata": (
-                            (vector_raw.get("metadatas") or [[]])[0][i]
-                            if vector_raw.get("metadatas")
-                            else {}
-                        ),
-                        "distance": (
-                            (vector_raw.get("distances") or [[]])[0][i]
-                            if vector_raw.get("distances")
-                            else 0.0
-                        ),
+                        "text": documents[row][i] if documents else "",
+                        "metadata": metadatas[row][i] if metadatas else {},
+                        "distance": distances[row][i] if distances else 0.0,
                     }
                 )
 
@@ -322,11 +542,9 @@ class VectorStoreManager:
 
         merged = reciprocal_rank_fusion(vector_items, bm25_items, n=n_results)
 
-        result: dict[str, Any] = {
+        return {
             "ids": [[item["id"] for item in merged]],
             "documents": [[item["text"] for item in merged]],
             "metadatas": [[item["metadata"] for item in merged]],
             "distances": [[item.get("distance", 0.0) for item in merged]],
         }
-        self._query_cache.put(cache_key, result)
-        return result